@@ -0,0 +1,240 @@
+"""Benchmarks of the public `detect_`/`compute_` functions of the GSS and only_sat modules over the frozen
+fixtures of `benchmarks/fixtures`, without any network access.
+
+Every case runs one entry point with the first `satellites` satellites of the fixtures, the first
+`stations` ground stations and a time window starting on 21 March 2020. It reports the best wall time of
+the repeats, the throughput in pair-hours per second (pairs of satellites, times ground stations for the
+GSS functions, times hours of the window) and the peak memory traced by `tracemalloc` on a separate run.
+
+    python benchmarks/bench.py                              # Quick preset
+    python benchmarks/bench.py --preset full --save baseline.json
+    python benchmarks/bench.py --entry satellites_over --compare baseline.json
+"""
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import satnogs_collisions
+from satnogs_collisions import GroundStation, SatelliteCatalog
+from satnogs_collisions.only_sat import SatelliteRegistry
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+START = datetime.datetime(2020, 3, 21, 0, 0)
+WINDOWS = {"1h": datetime.timedelta(hours=1), "24h": datetime.timedelta(days=1), "7d": datetime.timedelta(days=7)}
+PRESETS = {
+    "quick": {"satellites": [10, 100], "stations": [1, 50], "windows": ["1h"]},
+    "full": {"satellites": [10, 100, 1000], "stations": [1, 50, 500], "windows": ["1h", "24h", "7d"]},
+}
+TIME_ACCURACY = 60                                      # Seconds, for the only_sat functions
+NOISE = 0.005                                           # Slowdowns shorter than this many seconds aren't regressions
+
+def load_fixtures():
+    """Loads the satellites and ground stations of the fixtures.
+
+    :return: Satellites and Ground Stations
+    :rtype: tuple
+    """
+    catalog = SatelliteCatalog.from_files(os.path.join(FIXTURES, "tle.txt"), os.path.join(FIXTURES, "transmitters.json"))
+    with open(os.path.join(FIXTURES, "stations.json")) as stations_file:
+        stations = [GroundStation(ground_station_id=elem["id"], coordinates=[elem["lat"], elem["lng"]], elevation=elem["altitude"])
+                    for elem in json.load(stations_file)]
+    return catalog.satellites(), stations
+
+def _pairs(satellites, main_sat):
+    count = len(satellites)
+    return count - 1 if main_sat else count*(count - 1)//2
+
+# Entry point name, with the variant in brackets: (whether it takes a main satellite, number of ground stations it
+# takes: 0, 1 or 2 for many, extra arguments)
+ENTRY_POINTS = {
+    "detect_RF_collision_of_satellite_over_groundstation": (True, 1, {}),
+    "detect_RF_collision_of_satellite_over_groundstations": (True, 2, {}),
+    "detect_RF_collision_of_satellites_over_groundstation": (False, 1, {}),
+    "detect_RF_collision_of_satellites_over_groundstations": (False, 2, {}),
+    "compute_RF_collision_of_satellite_over_groundstation": (True, 1, {}),
+    "compute_RF_collision_of_satellite_over_groundstations": (True, 2, {}),
+    "compute_RF_collision_of_satellites_over_groundstation": (False, 1, {}),
+    "compute_RF_collision_of_satellites_over_groundstations": (False, 2, {}),
+    "compute_RF_collision_of_satellite_over_groundstations[batched]": (True, 2, {"batched": True}),
+    "compute_RF_collision_of_satellites_over_groundstations[batched]": (False, 2, {"batched": True}),
+    "detect_RF_collision_of_satellite_with_satellites": (True, 0, {}),
+    "detect_RF_collision_of_satellites": (False, 0, {}),
+    "detect_RF_collision_of_satellites_with_all_satellites": (True, 0, {}),
+    "compute_RF_collision_of_satellite_with_satellites": (True, 0, {}),
+    "compute_RF_collision_of_satellites": (False, 0, {}),
+    "compute_RF_collision_of_satellites_with_all_satellites": (True, 0, {}),
+}
+
+def _call(entry, satellites, stations, window):
+    """Returns the function running the entry point once over the fixtures.
+    """
+    function = getattr(satnogs_collisions, entry.split("[")[0])
+    main_sat, station_count, kwargs = ENTRY_POINTS[entry]
+    date_time_range = [START, START + WINDOWS[window]]
+    if entry.endswith("with_all_satellites"):
+        registry = SatelliteRegistry(satellites=satellites)
+        return lambda: function(satellites[0], date_time_range, TIME_ACCURACY, registry=registry, **kwargs)
+    args = [satellites, satellites[0]] if main_sat else [satellites]
+    if station_count:
+        args.insert(0, stations[0] if station_count == 1 else stations)
+        return lambda: function(*args, date_time_range, **kwargs)
+    return lambda: function(*args, date_time_range, TIME_ACCURACY, **kwargs)
+
+def cases(satellites, stations, windows, entries=None):
+    """Lists the cases of the matrix. The single ground station functions only run with one ground station,
+    the only_sat functions without any.
+
+    :return: (entry point, number of satellites, number of ground stations, window) tuples
+    :rtype: list
+    """
+    matrix = []
+    for entry, (main_sat, station_count, kwargs) in ENTRY_POINTS.items():
+        if entries and not any(pattern in entry for pattern in entries):
+            continue
+        entry_stations = sorted(stations) if station_count == 2 else [1 if station_count else 0]
+        for window, satellite_count, station_count in itertools.product(windows, sorted(satellites), entry_stations):
+            matrix.append((entry, satellite_count, station_count, window))
+    return matrix
+
+def run_case(case, satellites, stations, repeat=1, memory=True):
+    """Runs a case, returning its timings.
+
+    :param case: (entry point, number of satellites, number of ground stations, window)
+    :type case: tuple
+    :param repeat: number of timed runs, the best one is kept, defaults to 1
+    :type repeat: int, optional
+    :param memory: trace the peak memory on an extra run, defaults to True
+    :type memory: bool, optional
+    :return: result of the case
+    :rtype: dictionary
+    """
+    entry, satellite_count, station_count, window = case
+    function = _call(entry, satellites[:satellite_count], stations[:max(station_count, 1)], window)
+    seconds = []
+    for run in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    pair_hours = _pairs(satellites[:satellite_count], ENTRY_POINTS[entry][0]) * max(station_count, 1) \
+        * WINDOWS[window].total_seconds()/3600
+    return {"entry": entry, "satellites": satellite_count, "stations": station_count, "window": window,
+            "seconds": min(seconds), "pair_hours_per_second": pair_hours/min(seconds), "peak_bytes": peak}
+
+def _key(result):
+    return (result["entry"], result["satellites"], result["stations"], result["window"])
+
+def scaling(results, axis):
+    """Fits the exponent of the time against the number of satellites or of ground stations, every other
+    parameter being fixed. An exponent of 2 is a quadratic growth.
+
+    :param axis: "satellites" or "stations"
+    :type axis: str
+    :return: (entry point, fixed parameters, [(size, seconds)], exponent) tuples
+    :rtype: list
+    """
+    series = {}
+    for result in results:
+        fixed = tuple((name, result[name]) for name in ("satellites", "stations", "window") if name != axis)
+        series.setdefault((result["entry"], fixed), []).append((result[axis], result["seconds"]))
+    curves = []
+    for (entry, fixed), points in series.items():
+        points = sorted(points)
+        if len(points) < 2:
+            continue
+        sizes, seconds = np.log([point[0] for point in points]), np.log([point[1] for point in points])
+        curves.append((entry, dict(fixed), points, float(np.polyfit(sizes, seconds, 1)[0])))
+    return curves
+
+def compare(results, baseline, threshold=0.1):
+    """Compares the results with a saved baseline.
+
+    :param threshold: relative slowdown reported as a regression, defaults to 0.1
+    :type threshold: float, optional
+    :return: (result, baseline seconds, ratio, regression) tuples of the cases found in the baseline
+    :rtype: list
+    """
+    previous = {_key(result): result for result in baseline["results"]}
+    comparison = []
+    for result in results:
+        if _key(result) in previous:
+            seconds = previous[_key(result)]["seconds"]
+            ratio = result["seconds"]/seconds
+            comparison.append((result, seconds, ratio, ratio > 1 + threshold and result["seconds"] - seconds > NOISE))
+    return comparison
+
+def _megabytes(size):
+    return "-" if size is None else "{:.1f}".format(size/2**20)
+
+def report(results, comparison=None, out=sys.stdout):
+    """Prints the results, the scaling curves and the comparison with the baseline.
+    """
+    out.write("{:<64} {:>6} {:>6} {:>5} {:>10} {:>14} {:>9}\n".format("entry point", "sats", "gs", "win", "seconds", "pair-hours/s", "peak MiB"))
+    for result in results:
+        out.write("{:<64} {:>6} {:>6} {:>5} {:>10.3f} {:>14.1f} {:>9}\n".format(result["entry"], result["satellites"], result["stations"],
+                  result["window"], result["seconds"], result["pair_hours_per_second"], _megabytes(result["peak_bytes"])))
+    for axis in ("satellites", "stations"):
+        curves = scaling(results, axis)
+        if curves:
+            out.write("\nScaling with the number of {}\n".format(axis))
+        for entry, fixed, points, exponent in curves:
+            fixed = ", ".join("{}={}".format(name, value) for name, value in fixed.items())
+            points = "  ".join("{}: {:.3f}s".format(size, seconds) for size, seconds in points)
+            out.write("{:<64} {:<24} {}  exponent {:.2f}\n".format(entry, fixed, points, exponent))
+    if comparison:
+        out.write("\nComparison with the baseline\n")
+        for result, seconds, ratio, regression in comparison:
+            out.write("{:<64} {:>6} {:>6} {:>5} {:>10.3f} {:>10.3f} {:>7.2f}x{}\n".format(result["entry"], result["satellites"],
+                      result["stations"], result["window"], seconds, result["seconds"], ratio, "  REGRESSION" if regression else ""))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick", help="matrix of the cases, defaults to quick")
+    parser.add_argument("--satellites", type=int, nargs="+", help="numbers of satellites, overriding the preset")
+    parser.add_argument("--stations", type=int, nargs="+", help="numbers of ground stations, overriding the preset")
+    parser.add_argument("--windows", choices=sorted(WINDOWS), nargs="+", help="time windows, overriding the preset")
+    parser.add_argument("--entry", nargs="+", help="only run the entry points containing one of these strings")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs of every case, the best one is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run measuring the peak memory")
+    parser.add_argument("--save", help="save the results as a baseline to this JSON file")
+    parser.add_argument("--compare", help="compare the results with the baseline saved in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as a regression")
+    options = parser.parse_args(argv)
+
+    preset = PRESETS[options.preset]
+    satellites, stations = load_fixtures()
+    matrix = cases(options.satellites or preset["satellites"], options.stations or preset["stations"],
+                   options.windows or preset["windows"], options.entry)
+    results = []
+    for case in matrix:
+        results.append(run_case(case, satellites, stations, repeat=options.repeat, memory=not options.no_memory))
+        sys.stderr.write("{} {} sats {} gs {}: {:.3f}s\n".format(*case, results[-1]["seconds"]))
+    comparison = None
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            comparison = compare(results, json.load(baseline_file), options.threshold)
+    report(results, comparison)
+    if options.save:
+        with open(options.save, "w") as baseline_file:
+            json.dump({"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+                       "date": datetime.datetime.utcnow().isoformat(), "results": results}, baseline_file, indent=1)
+    return 1 if comparison and any(regression for result, seconds, ratio, regression in comparison) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Writes the frozen benchmark fixtures: a TLE file, a SatNOGS DB transmitters dump and a SatNOGS Network
+stations dump. They are generated from a fixed seed with the `random` module, whose sequences are stable
+across Python versions, so the fixtures only need to be regenerated when their layout changes.
+
+    python benchmarks/make_fixtures.py
+"""
+import json
+import math
+import os
+import random
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SATELLITES = 1000
+STATIONS = 500
+SEED = 2020
+EPOCH = "20080.50000000"                                # 20 March 2020, 12:00 UTC
+
+# (inclination in degrees, weight) of the usual orbits of amateur satellites: ISS deployments, sun-synchronous and others
+ORBITS = [(51.64, 0.3), (97.5, 0.45), (None, 0.25)]
+# (lowest frequency in Hz, number of 5 kHz channels, weight) of the downlink bands
+BANDS = [(435000000, 800, 0.8), (145800000, 40, 0.15), (2400000000, 100, 0.05)]
+
+def _checksum(line):
+    return str(sum(int(char) if char.isdigit() else char == "-" for char in line) % 10)
+
+def _choice(rng, weighted):
+    return rng.choices(weighted, weights=[elem[-1] for elem in weighted])[0]
+
+def _tle(rng, norad_id):
+    inclination = _choice(rng, ORBITS)[0]
+    if inclination is None:
+        inclination = rng.uniform(0, 110)
+    elif inclination > 90:
+        inclination += rng.uniform(-0.7, 0.7)
+    line1 = "1 {:05d}U 20001A   {}  .00000000  00000-0  10000-4 0  999".format(norad_id, EPOCH)
+    line2 = "2 {:05d} {:8.4f} {:8.4f} {:07d} {:8.4f} {:8.4f} {:11.8f}{:5d}".format(
+        norad_id, inclination, rng.uniform(0, 360), rng.randrange(1, 20000), rng.uniform(0, 360), rng.uniform(0, 360),
+        rng.uniform(14.6, 15.7), rng.randrange(1, 99999))
+    return ["{:05d} - BENCH-{}".format(norad_id, norad_id - 90000), line1 + _checksum(line1), line2 + _checksum(line2)]
+
+def _transmitters(rng, norad_id):
+    transmitters = []
+    for count in range(rng.choice([1, 1, 1, 2, 3])):
+        low, channels = _choice(rng, BANDS)[:2]
+        transmitters.append({"norad_cat_id": norad_id, "type": "Transmitter", "alive": True,
+                             "downlink_low": low + 5000*rng.randrange(channels)})
+    return transmitters
+
+def _station(rng, station_id):
+    latitude = math.degrees(math.asin(rng.uniform(math.sin(math.radians(-55)), math.sin(math.radians(70)))))
+    return {"id": station_id, "lat": round(latitude, 4), "lng": round(rng.uniform(-180, 180), 4),
+            "altitude": rng.randrange(0, 2000)}
+
+def main():
+    rng = random.Random(SEED)
+    tles = [_tle(rng, 90001 + index) for index in range(SATELLITES)]
+    transmitters = [transmitter for tle in tles for transmitter in _transmitters(rng, int(tle[1][2:7]))]
+    stations = [_station(rng, 1 + index) for index in range(STATIONS)]
+    os.makedirs(FIXTURES, exist_ok=True)
+    with open(os.path.join(FIXTURES, "tle.txt"), "w") as tle_file:
+        tle_file.write("\n".join(line for tle in tles for line in tle) + "\n")
+    with open(os.path.join(FIXTURES, "transmitters.json"), "w") as transmitters_file:
+        transmitters_file.write("[\n" + ",\n".join(json.dumps(elem) for elem in transmitters) + "\n]\n")
+    with open(os.path.join(FIXTURES, "stations.json"), "w") as stations_file:
+        stations_file.write("[\n" + ",\n".join(json.dumps(elem) for elem in stations) + "\n]\n")
+
+if __name__ == "__main__":
+    main()
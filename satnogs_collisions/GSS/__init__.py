@@ -1,15 +1,18 @@
 from .gss import (detect_RF_collision_of_satellite_over_groundstation,detect_RF_collision_of_satellite_over_groundstations,
 detect_RF_collision_of_satellites_over_groundstation, detect_RF_collision_of_satellites_over_groundstations,
 compute_RF_collision_of_satellite_over_groundstation, compute_RF_collision_of_satellite_over_groundstations,
-compute_RF_collision_of_satellites_over_groundstation, compute_RF_collision_of_satellites_over_groundstations)
+compute_RF_collision_of_satellites_over_groundstation, compute_RF_collision_of_satellites_over_groundstations,
+iter_RF_collisions_over_groundstation, iter_RF_collisions_over_groundstations)
 
 __all__ = [
-    detect_RF_collision_of_satellite_over_groundstation, 
-    detect_RF_collision_of_satellite_over_groundstations,
-    detect_RF_collision_of_satellites_over_groundstation, 
-    detect_RF_collision_of_satellites_over_groundstations,
-    compute_RF_collision_of_satellite_over_groundstation, 
-    compute_RF_collision_of_satellite_over_groundstations,
-    compute_RF_collision_of_satellites_over_groundstation, 
-    compute_RF_collision_of_satellites_over_groundstations
+    'detect_RF_collision_of_satellite_over_groundstation',
+    'detect_RF_collision_of_satellite_over_groundstations',
+    'detect_RF_collision_of_satellites_over_groundstation',
+    'detect_RF_collision_of_satellites_over_groundstations',
+    'compute_RF_collision_of_satellite_over_groundstation',
+    'compute_RF_collision_of_satellite_over_groundstations',
+    'compute_RF_collision_of_satellites_over_groundstation',
+    'compute_RF_collision_of_satellites_over_groundstations',
+    'iter_RF_collisions_over_groundstation',
+    'iter_RF_collisions_over_groundstations'
 ]
\ No newline at end of file
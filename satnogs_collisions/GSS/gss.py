@@ -1,9 +1,21 @@
 import ephem
+import heapq
+import math
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from satnogs_collisions.satellite import Satellite
-from satnogs_collisions.ground_station import GroundStation
-from datetime import datetime
+from satnogs_collisions.ground_station import GroundStation, StationSet
+from satnogs_collisions.satellite.frequency_index import FrequencyIndex
+from satnogs_collisions.propagation import get_backend, get_cache
+from satnogs_collisions.propagation.propagation import A, E2, SatrecArray
+from satnogs_collisions.event import CollisionEvent, collision_dicts, fan_out_pairs
+from datetime import datetime, timedelta
 
 C = 299792458.0                                         # Define speed of light
+DOPPLER_STEP = 10                                       # Seconds between the samples of the Doppler profiles
+BATCH_SIZE = 1000000                                    # Samples computed at once by the batched pass tables
+HORIZON = math.sin(math.radians(-34/60.0))              # Sine of the geometric elevation of the horizon, lowered by the refraction like ephem
 
 def _time_range_intersection(sat1_rise, sat1_set, sat2_rise, sat2_set):
     """Computes the intersection of the rise and set time intervals of the 2 satellites.
@@ -25,35 +37,49 @@ def _time_range_intersection(sat1_rise, sat1_set, sat2_rise, sat2_set):
         return [low.datetime(), high.datetime()]
     return
 
-def _compute_doppler_shift(sat, observer, freq, rise_time, set_time):
-    """Computes the Maximum Doppler shift in the frequency at the ground station.
-    Returns the Max and min doppler shifted frequencies for each frequency received at the GroundStation.
+def _ephem_datetimes(dates):
+    """Converts ephem Dates to numpy datetimes, as taken by the `propagate_ecef` of the backends.
+    """
+    return np.datetime64("1899-12-31T12:00") + np.round(np.asarray(dates, dtype=float) * 86400e6).astype("timedelta64[us]")
+
+def _compute_doppler_profile(sat, observer, frequencies, rise_time, set_time, step=DOPPLER_STEP, satellite=None):
+    """Computes the Doppler shifted frequencies received at the ground station over the whole pass.
+    The range rate is sampled once per timestep and applied to every frequency at once. When the
+    `Satellite` is given and `sgp4` is installed, the range rate of all the samples is computed at once
+    from its Earth fixed track, otherwise ephem computes it one sample at a time.
 
     :param sat: Satellite
     :type sat: instance of ephem satellite
     :param observer: Ground Station / Observer
     :type observer: Instance of ephem ground station
-    :param freq: Satellite transmitting frequencies
-    :type freq: list
+    :param frequencies: Satellite transmitting frequencies
+    :type frequencies: list
     :param rise_time: Rise time of Satellite
-    :type rise_time: datetime/ephem.Date instance
+    :type rise_time: ephem.Date instance
     :param set_time: Set time of Satellite
-    :type set_time: datetime/ephem.Date instance
-    """
-    freq_low_high = {}                                          # Append max and min frequencies shift to the list
-    for elem in freq:   
-        freq_low_high[elem] = []                                # Maximum shift observed at Rise time
-        observer.date = rise_time
-        sat.compute(observer)
-        rel_vel = sat.range_velocity
-        shift_r = (rel_vel/C)*(elem)
-        observer.date = set_time                                # Maximum shift observed at Set time
-        sat.compute(observer)
-        rel_vel = sat.range_velocity
-        shift_s = (rel_vel/C)*(elem)
-        freq_low_high[elem].append(elem + shift_r)
-        freq_low_high[elem].append(elem + shift_s)
-    return freq_low_high
+    :type set_time: ephem.Date instance
+    :param step: seconds between the samples, defaults to `DOPPLER_STEP`
+    :type step: float, optional
+    :param satellite: Satellite of the ephem body, defaults to None
+    :type satellite: Instance of `Satellite`, optional
+    :return: sample times as ephem Dates and received frequencies shaped (frequencies, samples)
+    :rtype: tuple of numpy arrays
+    """
+    times = np.append(np.arange(float(rise_time), float(set_time), step/86400.0), float(set_time))
+    if satellite is not None and SatrecArray is not None:
+        positions, velocities = get_backend("sgp4").propagate_ecef([satellite], _ephem_datetimes(times))
+        station_position, up = _geodetic_ecef(np.degrees([float(observer.lat)]), np.degrees([float(observer.lon)]),
+                                              np.array([observer.elevation]))
+        range_rate = _topocentric(positions[0], velocities[0], station_position, up)[1][:, 0]
+    else:
+        range_rate = np.empty(len(times))
+        for index, date in enumerate(times):
+            observer.date = date
+            sat.compute(observer)
+            range_rate[index] = sat.range_velocity
+    # Frequencies are received lower while the satellite moves away, i.e. while the range rate is positive
+    tracks = np.asarray(frequencies, dtype=float).reshape(-1, 1) * (1 - range_rate/C)
+    return times, tracks
 
 def _in_freq_range(frequencies1, frequencies2, f_range):
     """Checks if the frequencies of both the satellites fall under the given range.
@@ -61,13 +87,375 @@ def _in_freq_range(frequencies1, frequencies2, f_range):
     freq_list = []                                              # compare all the frequencies
     for key1, val1 in frequencies1.items():
         for key2, val2 in frequencies2.items():
-            if (abs(val1[0] - val2[0]) <= f_range) or (abs(val1[0] - val2[1]) <= f_range) or (abs(val1[1] - val2[0]) <= f_range) or (abs(val1[1] - val2[1]) <= f_range):
+            # The [min, max] received frequencies are closer than the range
+            if (max(val1[0], val2[0]) - min(val1[1], val2[1]) <= f_range):
                 freq_list.append((key1, key2))
     if len(freq_list):
         return freq_list
     return False
 
-def _check_collision(ground_station, sat1, sat2, date_time_range, frequency_range, time_period=False):
+def _create_observer(ground_station):
+    """Creates an ephem Observer at the location of the Ground Station.
+
+    :param ground_station: Ground Station object
+    :type ground_station: Instance of `GroundStation`
+    :return: Observer placed at the Ground Station
+    :rtype: Instance of ephem Observer
+    """
+    ground_coordinates = ground_station.get_coordinates()           # Extract ground coordinates
+    observer = ephem.Observer()                                     # Define an Epem Observer
+    observer.elevation = ground_station.get_elevation()
+    observer.lat = str(ground_coordinates[0])
+    observer.lon = str(ground_coordinates[1])
+    return observer
+
+def _compute_passes(observer, sat, frequencies, date_time_range, satellite=None):
+    """Computes every pass of the satellite over the observer that can intersect the given time range,
+    along with the Doppler shifted frequencies of the pass.
+
+    :param observer: Ground Station / Observer
+    :type observer: Instance of ephem ground station
+    :param sat: Satellite
+    :type sat: instance of ephem satellite
+    :param frequencies: Satellite transmitting frequencies
+    :type frequencies: list
+    :param date_time_range: User specified Time interval
+    :type date_time_range: datetime
+    :param satellite: Satellite of the ephem body, to compute the Doppler profiles with SGP4, defaults to None
+    :type satellite: Instance of `Satellite`, optional
+    :return: passes as (rise_time, set_time, freq_low_high, Doppler profile) tuples ordered by rise time. A satellite
+        that never sets has a single pass covering the range, one that never rises has none
+    :rtype: list
+    """
+    e_low = ephem.Date(date_time_range[0])                          # Convert the date_time interval to ephem Date instances
+    e_high = ephem.Date(date_time_range[1])
+    e = e_low - ephem.hour                                          # Decrement e by an hour to record the passes that start slightly before e_low
+    passes = []
+    while (e <= e_high):
+        observer.date = e                                           # Set the date and time of the oberserver
+
+        # `next_pass` computes the rise_time, Rise azimuth ,maximum_atlitude,
+        # max_altitude_time, set_time and set Azimuth of the Satellite.
+        try:
+            info = observer.next_pass(sat)
+        except ValueError:                                          # The satellite never rises or never sets
+            sat.compute(observer)
+            info = (ephem.Date(e), None, None, None, e_high) if sat.alt > 0 else (None,) * 5
+        if (info[0] is None or info[4] is None or info[0] > e_high):
+            break
+        profile = _compute_doppler_profile(sat, observer, frequencies, info[0], info[4], satellite=satellite)
+        freq_low_high = {}                                          # Min and max received frequencies of the pass
+        for freq, track in zip(frequencies, profile[1]):
+            freq_low_high[freq] = [float(track.min()), float(track.max())]
+        passes.append((info[0], info[4], freq_low_high, profile))
+        e = ephem.Date(info[4] + ephem.minute)                      # Check for the next pass after the `set_time`
+    return passes
+
+def _compute_pass_table(ground_station, satellites, date_time_range):
+    """Computes the passes of every satellite over the Ground Station once, so that they can be
+    reused by every pair of satellites checked over that Ground Station.
+
+    :param ground_station: Ground Station object
+    :type ground_station: Instance of `GroundStation`
+    :param satellites: List of Satellites
+    :type satellites: list
+    :param date_time_range: User specified Time interval
+    :type date_time_range: datetime
+    :return: dictionary of passes keyed by `Satellite`
+    :rtype: dictionary
+    """
+    observer = _create_observer(ground_station)
+    pass_table = {}
+    for sat in satellites:
+        if sat in pass_table:
+            continue
+        body = get_cache().body(sat.get_tle())                      # Ephem instance of the satellite, parsed once per TLE
+        pass_table[sat] = _compute_passes(observer, body, sat.get_frequencies(), date_time_range, satellite=sat)
+    return pass_table
+
+def _geodetic_ecef(latitude, longitude, elevation):
+    """Computes the Earth fixed positions and local verticals of points on the WGS84 ellipsoid.
+
+    :param latitude: latitudes in degrees
+    :type latitude: numpy array
+    :param longitude: longitudes in degrees
+    :type longitude: numpy array
+    :param elevation: heights above the ellipsoid in m
+    :type elevation: numpy array
+    :return: positions in m and unit up vectors, each shaped (points, 3)
+    :rtype: tuple of numpy arrays
+    """
+    lat = np.radians(latitude)
+    lon = np.radians(longitude)
+    n = A / np.sqrt(1 - E2 * np.sin(lat) ** 2)
+    up = np.stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)), axis=1)
+    position = np.stack(((n + elevation) * up[:, 0], (n + elevation) * up[:, 1], (n * (1 - E2) + elevation) * up[:, 2]), axis=1)
+    return position, up
+
+def _station_ecef(stations):
+    """Computes the Earth fixed positions and local verticals of the ground stations on the WGS84 ellipsoid.
+
+    :param stations: Ground Stations
+    :type stations: Instance of `StationSet`
+    :return: positions in m and unit up vectors, each shaped (ground stations, 3)
+    :rtype: tuple of numpy arrays
+    """
+    return _geodetic_ecef(stations.latitude, stations.longitude, stations.elevation)
+
+def _topocentric(position, velocity, station_position, up):
+    """Computes the sine of the elevation and the range rate of a satellite seen from every ground station
+    at every timestep, with matrix products over the ground stations.
+
+    :param position: Earth fixed positions of the satellite in m, shaped (timesteps, 3)
+    :type position: numpy array
+    :param velocity: Earth fixed velocities of the satellite in m/s, shaped (timesteps, 3)
+    :type velocity: numpy array
+    :return: sine of the elevation and range rate in m/s, each shaped (timesteps, ground stations)
+    :rtype: tuple of numpy arrays
+    """
+    distance = np.sqrt(np.maximum(np.einsum("ij,ij->i", position, position)[:, None] - 2 * position @ station_position.T
+                                  + np.einsum("ij,ij->i", station_position, station_position)[None, :], 0))
+    sin_elevation = (position @ up.T - np.einsum("ij,ij->i", station_position, up)[None, :]) / distance
+    range_rate = (np.einsum("ij,ij->i", position, velocity)[:, None] - velocity @ station_position.T) / distance
+    return sin_elevation, range_rate
+
+def _crossing(dates, values, index):
+    """Interpolates the time where the values cross zero between the samples `index` and `index + 1`.
+    """
+    return dates[index] + values[index] / (values[index] - values[index + 1]) * (dates[index + 1] - dates[index])
+
+def _batched_passes(dates, sin_elevation, range_rate, frequencies, e_high):
+    """Finds the passes of a satellite over a ground station from its sampled elevation, with the rise and
+    set times interpolated between the samples, along with the Doppler shifted frequencies of the passes.
+
+    :param dates: sample times as ephem Dates
+    :type dates: numpy array
+    :param sin_elevation: sine of the elevation at every sample
+    :type sin_elevation: numpy array
+    :param range_rate: range rate in m/s at every sample
+    :type range_rate: numpy array
+    :return: passes as computed by `_compute_passes`
+    :rtype: list
+    """
+    sin_elevation = sin_elevation - HORIZON
+    if np.all(sin_elevation > 0):                                   # Never sets, a single pass covers the range like `_compute_passes`
+        last = np.searchsorted(dates, e_high - (dates[1] - dates[0])/2)    # A sample close to e_high is replaced by it
+        times = np.concatenate((dates[:last], [e_high]))
+        return [_batched_pass(times, np.interp(times, dates, range_rate), frequencies)]
+    visible = np.concatenate(([0], sin_elevation > 0, [0])).astype(np.int8)
+    edges = np.diff(visible)
+    passes = []
+    for first, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        # Skip the passes in progress at the first sample, or not set by the last one
+        if first == 0 or end == len(dates) or np.isnan(sin_elevation[first - 1]) or np.isnan(sin_elevation[end]):
+            continue
+        rise_time = _crossing(dates, sin_elevation, first - 1)
+        if rise_time > e_high:
+            break
+        set_time = _crossing(dates, sin_elevation, end - 1)
+        times = np.concatenate(([rise_time], dates[first:end], [set_time]))
+        passes.append(_batched_pass(times, np.interp(times, dates[first - 1:end + 1], range_rate[first - 1:end + 1]), frequencies))
+    return passes
+
+def _batched_pass(times, rates, frequencies):
+    """Builds a pass from its sample times and range rates, as computed by `_compute_passes`.
+    """
+    tracks = np.asarray(frequencies, dtype=float).reshape(-1, 1) * (1 - rates/C)
+    freq_low_high = {}
+    for freq, track in zip(frequencies, tracks):
+        freq_low_high[freq] = [float(track.min()), float(track.max())]
+    return (ephem.Date(times[0]), ephem.Date(times[-1]), freq_low_high, (times, tracks))
+
+def _compute_pass_tables(ground_stations, satellites, date_time_range, step=DOPPLER_STEP, backend="sgp4"):
+    """Computes the passes of every satellite over every Ground Station at once. Every satellite is
+    propagated once in the Earth fixed frame for all the Ground Stations, and its elevation and range rate
+    are computed for all the Ground Stations together. Elevations are sampled every `step` seconds.
+
+    :param ground_stations: Ground Stations
+    :type ground_stations: list or Instance of `StationSet`
+    :param satellites: List of Satellites
+    :type satellites: list
+    :param date_time_range: User specified Time interval
+    :type date_time_range: datetime
+    :param step: seconds between the samples, defaults to `DOPPLER_STEP`
+    :type step: float, optional
+    :param backend: propagation backend providing `propagate_ecef`, defaults to "sgp4"
+    :type backend: str, optional
+    :return: pass tables as computed by `_compute_pass_table`, in the order of the Ground Stations
+    :rtype: list
+    """
+    stations = ground_stations if isinstance(ground_stations, StationSet) else StationSet(ground_stations)
+    satellites = list(dict.fromkeys(satellites))
+    pass_tables = [{sat: [] for sat in satellites} for _ in range(len(stations))]
+    if not len(stations) or not satellites:
+        return pass_tables
+    backend = get_backend(backend)
+    e_low = float(ephem.Date(date_time_range[0])) - 1/24.0         # Record the passes that start slightly before e_low, like `_compute_passes`
+    e_high = float(ephem.Date(date_time_range[1]))
+    dates = np.arange(e_low, e_high + 1/24.0, step/86400.0)         # One more hour to find the set time of the last passes
+    times = _ephem_datetimes(dates)
+    station_position, up = _station_ecef(stations)
+    sat_size = max(1, BATCH_SIZE // len(dates))                     # Satellites propagated at once
+    station_size = max(1, BATCH_SIZE // len(dates))                 # Ground Stations seen at once
+    for sat_start in range(0, len(satellites), sat_size):
+        sats = satellites[sat_start:sat_start + sat_size]
+        positions, velocities = backend.propagate_ecef(sats, times)
+        for sat, position, velocity in zip(sats, positions, velocities):
+            for start in range(0, len(stations), station_size):
+                sin_elevation, range_rate = _topocentric(position, velocity, station_position[start:start + station_size],
+                                                         up[start:start + station_size])
+                for column in range(sin_elevation.shape[1]):
+                    pass_tables[start + column][sat] = _batched_passes(dates, sin_elevation[:, column], range_rate[:, column],
+                                                                       sat.get_frequencies(), e_high)
+    return pass_tables
+
+def _find_overlapping_passes(pass_table, main_sat=None):
+    """Finds every pair of passes of different satellites that overlap in time with a sweep line
+    over the passes sorted by rise time.
+
+    :param pass_table: passes of the satellites over a Ground Station
+    :type pass_table: dictionary
+    :param main_sat: only report the pairs that include this satellite, defaults to None
+    :type main_sat: Instance of `Satellite`, optional
+    :return: lists of overlapping (pass1, pass2) tuples keyed by the (sat1, sat2) pair
+    :rtype: dictionary
+    """
+    intervals = []
+    for sat, passes in pass_table.items():
+        for sat_pass in passes:
+            intervals.append((sat_pass[0], sat_pass[1], sat, sat_pass))
+    intervals.sort(key=lambda interval: interval[0])
+
+    overlaps = {}
+    active = []                                                     # Heap of the passes still above the horizon, by set time
+    for index, (rise_time, set_time, sat, sat_pass) in enumerate(intervals):
+        while active and active[0][0] < rise_time:                  # Drop the passes that set before this one rises
+            heapq.heappop(active)
+        for _, _, active_sat, active_pass in active:                # Every remaining pass overlaps this one
+            if active_sat is sat:
+                continue
+            if main_sat is not None and main_sat is not sat and main_sat is not active_sat:
+                continue
+            if (sat, active_sat) in overlaps:
+                overlaps[(sat, active_sat)].append((sat_pass, active_pass))
+            else:
+                overlaps.setdefault((active_sat, sat), []).append((active_pass, sat_pass))
+        heapq.heappush(active, (set_time, index, sat, sat_pass))
+    return overlaps
+
+def _get_overlapping_passes(overlaps, sat1, sat2):
+    """Returns the overlapping passes of Sat1 and Sat2 as (pass1, pass2) tuples.
+    """
+    if (sat1, sat2) in overlaps:
+        return overlaps[(sat1, sat2)]
+    return [(pass1, pass2) for pass2, pass1 in overlaps.get((sat2, sat1), [])]
+
+def _interpolate_tracks(profile, times):
+    """Linearly interpolates every track of the Doppler profile at the given times at once.
+
+    :param profile: sample times and received frequencies, as computed by `_compute_doppler_profile`
+    :type profile: tuple
+    :param times: ephem Dates inside the pass
+    :type times: numpy array
+    :return: received frequencies shaped (frequencies, times)
+    :rtype: numpy array
+    """
+    sample_times, tracks = profile
+    if len(sample_times) == 1:
+        return np.repeat(tracks, len(times), axis=1)
+    index = np.clip(np.searchsorted(sample_times, times) - 1, 0, len(sample_times) - 2)
+    weight = np.clip((times - sample_times[index]) / (sample_times[index + 1] - sample_times[index]), 0, 1)
+    return tracks[:, index] * (1 - weight) + tracks[:, index + 1] * weight
+
+def _interfering_periods(pass1, pass2, frequencies1, frequencies2, low, high, frequency_range):
+    """Finds the sub-intervals of [low, high] where the Doppler shifted frequencies of both passes are
+    closer than the range. The differences of every pair of frequencies are computed at once on the
+    samples of both profiles, and the bounds of the sub-intervals are interpolated between the samples.
+
+    :param pass1: pass of Sat1, as computed by `_compute_passes`
+    :type pass1: tuple
+    :param pass2: pass of Sat2, as computed by `_compute_passes`
+    :type pass2: tuple
+    :param frequencies1: frequencies of Sat1, in the order of the tracks of its profile
+    :type frequencies1: list
+    :param frequencies2: frequencies of Sat2, in the order of the tracks of its profile
+    :type frequencies2: list
+    :param low: start of the intersection of the passes
+    :type low: ephem.Date
+    :param high: end of the intersection of the passes
+    :type high: ephem.Date
+    :return: (colliding frequencies, [start, end]) tuples with ephem Dates
+    :rtype: list
+    """
+    low, high = float(low), float(high)
+    samples = np.union1d(pass1[3][0], pass2[3][0])
+    times = np.concatenate(([low], samples[(samples > low) & (samples < high)], [high]))
+    tracks1 = _interpolate_tracks(pass1[3], times)
+    tracks2 = _interpolate_tracks(pass2[3], times)
+    gap = np.abs(tracks1[:, None, :] - tracks2[None, :, :]) - frequency_range      # (frequencies1, frequencies2, times)
+    closest = gap.reshape(-1, len(times)).min(axis=0)                               # Any pair of frequencies in range
+    inside = np.concatenate(([False], closest <= 0, [False])).astype(np.int8)
+    edges = np.diff(inside)
+    periods = []
+    for first, last in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1):
+        start, end = times[first], times[last]
+        if first > 0:                                               # Crossing between the previous sample and the first one
+            g0, g1 = closest[first - 1], closest[first]
+            start = times[first - 1] + g0 / (g0 - g1) * (times[first] - times[first - 1])
+        if last < len(times) - 1:
+            g0, g1 = closest[last], closest[last + 1]
+            end = times[last] + g0 / (g0 - g1) * (times[last + 1] - times[last])
+        pairs = np.argwhere((gap[:, :, first:last + 1] <= 0).any(axis=2))
+        freq_list = list(dict.fromkeys((frequencies1[i], frequencies2[j]) for i, j in pairs))
+        periods.append((freq_list, [ephem.Date(start), ephem.Date(end)]))
+    return periods
+
+def _pass_collisions(pass1, pass2, date_time_range, frequency_range, frequencies1=None, frequencies2=None, time_resolved=False):
+    """Checks if two overlapping passes collide inside the given time range.
+
+    :param pass1: pass of Sat1, as computed by `_compute_passes`
+    :type pass1: tuple
+    :param pass2: pass of Sat2, as computed by `_compute_passes`
+    :type pass2: tuple
+    :param frequencies1: frequencies of Sat1, needed with `time_resolved`
+    :type frequencies1: list, optional
+    :param frequencies2: frequencies of Sat2, needed with `time_resolved`
+    :type frequencies2: list, optional
+    :param time_resolved: report only the sub-intervals where the Doppler shifted frequencies are in range, defaults to False
+    :type time_resolved: bool, optional
+    :return: (colliding frequencies, period of intersection) tuples
+    :rtype: list
+    """
+    e_low = ephem.Date(date_time_range[0])                          # Convert the date_time interval to ephem Date instances
+    e_high = ephem.Date(date_time_range[1])
+
+    # Compute the period of intersection of the satellites' passes
+    intersection_range = _time_range_intersection(pass1[0], pass1[1], pass2[0], pass2[1])
+
+    # Check the brackets of intersection range with the defined datetime range
+    if intersection_range:
+        if (intersection_range[0] > e_high.datetime() or intersection_range[1] < e_low.datetime()):
+            return []
+        if (intersection_range[0] < e_low.datetime()):
+            intersection_range[0] = e_low.datetime()
+        if (intersection_range[1] > e_high.datetime()):
+            intersection_range[1] = e_high.datetime()
+    else:
+        return []
+
+    # Compare the Maximum and minimum Doppler frequencies
+    # of both the satellites' passes
+    freq_list = _in_freq_range(pass1[2], pass2[2], frequency_range)
+    if not freq_list:
+        return []
+    if not time_resolved:
+        return [(freq_list, intersection_range)]
+    periods = _interfering_periods(pass1, pass2, frequencies1, frequencies2, ephem.Date(intersection_range[0]),
+                                   ephem.Date(intersection_range[1]), frequency_range)
+    return [(freq_list, [start.datetime(), end.datetime()]) for freq_list, (start, end) in periods]
+
+def _check_collision(ground_station, sat1, sat2, date_time_range, frequency_range, time_period=False, pass_table=None, overlaps=None,
+                     time_resolved=False):
     """Checks and computes the possible collision between Sat1 and Sat2
 
     :param ground_station: Ground Station object
@@ -82,94 +470,164 @@ def _check_collision(ground_station, sat1, sat2, date_time_range, frequency_rang
     :type frequency_range: int
     :param time_period: , defaults to False
     :type time_period: bool, optional
-    :return: bool/ Array of time periods if there is a collision
+    :param pass_table: passes of the satellites over the Ground Station, computed if not given, defaults to None
+    :type pass_table: dictionary, optional
+    :param overlaps: overlapping passes found by `_find_overlapping_passes`, computed if not given, defaults to None
+    :type overlaps: dictionary, optional
+    :param time_resolved: report only the sub-intervals where the Doppler shifted frequencies are in range, defaults to False
+    :type time_resolved: bool, optional
+    :return: bool/ Array of `CollisionEvent`s if there is a collision
     :rtype: bool/list
     """
-    ground_coordinates = ground_station.get_coordinates()           # Extract ground coordinates  
-    observer = ephem.Observer()                                     # Define an Epem Observer
-    observer.elevation = ground_station.get_elevation()
-    observer.lat = str(ground_coordinates[0])
-    observer.lon = str(ground_coordinates[1])
-
-    line1, line2, line3 = sat1.get_tle()                            # Read TLE of both the sateellites and create an instance
-    satA = ephem.readtle(line1, line2, line3)
-    line1, line2, line3 = sat2.get_tle()
-    satB = ephem.readtle(line1, line2, line3)
+    if overlaps is None:
+        if pass_table is None:
+            pass_table = _compute_pass_table(ground_station, [sat1, sat2], date_time_range)
+        overlaps = _find_overlapping_passes({sat1: pass_table[sat1], sat2: pass_table[sat2]})
 
     # This stores an array of intervals as there could be multiple RF collisions 
     # between the  satellites at the given time interval. 
     collisions = []
 
-    e_low = ephem.Date(date_time_range[0])                          # Convert the date_time interval to ephem Date instances
-    e_high = ephem.Date(date_time_range[1])
-    e = e_low - ephem.hour                                          # Decrement e by an hour to record the collisions that start slightly before e_low
-    while (e <= e_high):
-        observer.date = e                                           # Set the date and time of the oberserver
-
-        # `next_pass` computes the rise_time, Rise azimuth ,maximum_atlitude,
-        # max_altitude_time, set_time and set Azimuth of the Satellite.
-        infoA = observer.next_pass(satA)
-        infoB = observer.next_pass(satB)
-
-        # Check if the satellites' have a period of intersection
-        intersection_range = _time_range_intersection(infoA[0], infoA[4], infoB[0], infoB[4])
-
-        # Check the brackets of intersection range with the defined datetime range
-        if intersection_range:
-            if (intersection_range[0] > e_high.datetime() or intersection_range[1] < e_low.datetime()):
-                intersection_range = None
-            else:
-                if (intersection_range[0] < e_low.datetime()):
-                    intersection_range[0] = e_low.datetime()
-                if (intersection_range[1] > e_high.datetime()):
-                    intersection_range[1] = e_high.datetime()
-
-        if intersection_range is not None:
-            # Compute the Maximum and minimum Doppler frequencies
-            # for all the frequencies for both the satellites
-            freq1_low_high = _compute_doppler_shift(satA, observer, sat1.get_frequencies(), infoA[0], infoA[4])
-            freq2_low_high = _compute_doppler_shift(satB, observer, sat2.get_frequencies(), infoB[0], infoB[4])
-            freq_list = _in_freq_range(freq1_low_high, freq2_low_high, frequency_range)
-            if (freq_list):
-                if not time_period:
-                    return True
-                temp = {}
-                temp["ground_station"] = {}                                         # Add Ground Station Meta data to the dictionary
-                temp["ground_station"]["id"] = ground_station.get_id()
-                temp["ground_station"]["latitude"] = ground_coordinates[0]
-                temp["ground_station"]["longitude"] = ground_coordinates[1]
-                temp["ground_station"]["elevation"] = ground_station.get_elevation()
-                temp["satellites"] = []
-                sat_dict = {}                                                       # Add Satellites' Meta data to the dictionary
-                sat_dict["norad_id"] = sat1.get_name().split(' ')[0]
-                sat_dict["name"] = sat1.get_name().split(' ')[1]
-                sat_dict["tle"] = sat1.get_tle()
-                sat_dict["frequencies"] = sat1.get_frequencies()
-                sat_dict["collision_frequencies"] = []
-                for elem in freq_list:
-                    sat_dict["collision_frequencies"].append(elem[0])
-                temp["satellites"].append(sat_dict)
-                sat_dict = {}
-                sat_dict["norad_id"] = sat2.get_name().split(' ')[0]
-                sat_dict["name"] = sat2.get_name().split(' ')[1]
-                sat_dict["tle"] = sat2.get_tle()
-                sat_dict["frequencies"] = sat2.get_frequencies()
-                sat_dict["collision_frequencies"] = []
-                for elem in freq_list:
-                    sat_dict["collision_frequencies"].append(elem[1])
-                temp["satellites"].append(sat_dict)
-                temp["time_period"] = intersection_range                            # Add time period of the collision
-                collisions.append(temp)
-
-        e = ephem.Date(min(infoA[4], infoB[4]) + ephem.minute)                      # Check for every increment after the minimum `set_time`
+    for pass1, pass2 in _get_overlapping_passes(overlaps, sat1, sat2):
+        for collision in _pass_collisions(pass1, pass2, date_time_range, frequency_range,
+                                          sat1.get_frequencies(), sat2.get_frequencies(), time_resolved=time_resolved):
+            if not time_period:
+                return True
+            freq_list, intersection_range = collision
+            collisions.append(CollisionEvent.from_frequencies(sat1, sat2, freq_list, intersection_range[0], intersection_range[1],
+                                                              ground_station=ground_station))
 
     if (len(collisions) == 0):                                                      # Return True or time_periods depending on the passed argument `time_period`
         return collisions if time_period else False
     return collisions
 
+def _detect_collisions(ground_station, satellites, main_sat, date_time_range, frequency_range, time_period, overlaps, time_resolved=False):
+    """Checks the main satellite against every satellite over a ground station using the precomputed
+    overlapping passes.
+    """
+    rf_collisions = []
+    for sat in satellites:
+            rf_collisions.append(_check_collision(ground_station, main_sat, sat, 
+                    date_time_range, frequency_range, time_period=time_period, overlaps=overlaps, time_resolved=time_resolved))
+    return rf_collisions
+
+def _pair_collisions(ground_station, satellites, candidate_pairs, date_time_range, frequency_range, time_period, overlaps,
+                     time_resolved=False):
+    """Checks every candidate pair of satellites over a ground station using the precomputed
+    overlapping passes, and lists the collisions of every satellite keyed by its name.
+    """
+    return fan_out_pairs(satellites, candidate_pairs,
+                         lambda sat1, sat2: _check_collision(ground_station, sat1, sat2, date_time_range, frequency_range,
+                                                             time_period=time_period, overlaps=overlaps, time_resolved=time_resolved),
+                         time_period)
+
+def _candidates(satellites, frequency_range):
+    """Returns the candidate pairs of satellites, with frequencies close to each other even with the worst
+    case Doppler shift, and the satellites of these pairs in the order of `satellites`.
+    """
+    candidate_pairs = FrequencyIndex(satellites, doppler=True).candidate_pairs(frequency_range)
+    candidates = set()
+    for sat1, sat2 in candidate_pairs:
+        candidates.update((sat1, sat2))
+    return candidate_pairs, [sat for sat in satellites if sat in candidates]
+
+def _detect_satellite_over_groundstation(ground_station, satellites, main_sat, date_time_range, frequency_range=30000,
+                                         time_period=False, time_resolved=False):
+    """`detect_RF_collision_of_satellite_over_groundstation` returning `CollisionEvent`s.
+    """
+    # Only the satellites with frequencies close to the main satellite, even with the worst case Doppler shift, are propagated
+    candidates = FrequencyIndex(satellites, doppler=True).query(main_sat, frequency_range)
+    pass_table = _compute_pass_table(ground_station, [main_sat] + candidates, date_time_range)
+    overlaps = _find_overlapping_passes(pass_table, main_sat=main_sat)
+    return _detect_collisions(ground_station, satellites, main_sat, date_time_range, frequency_range, time_period, overlaps,
+                              time_resolved=time_resolved)
+
+def _detect_satellites_over_groundstation(ground_station, satellites, date_time_range, frequency_range=30000,
+                                          time_period=False, time_resolved=False):
+    """`detect_RF_collision_of_satellites_over_groundstation` returning `CollisionEvent`s.
+    """
+    satellites = list(satellites)
+
+    # Only the satellites with frequencies close to each other, even with the worst case Doppler shift, are propagated
+    candidate_pairs, candidates = _candidates(satellites, frequency_range)
+    pass_table = _compute_pass_table(ground_station, candidates, date_time_range)
+    overlaps = _find_overlapping_passes(pass_table)                                   # Only the pairs found here can collide
+
+    return _pair_collisions(ground_station, satellites, candidate_pairs, date_time_range, frequency_range, time_period,
+                            overlaps, time_resolved)
+
+def _detect_satellite_over_batch(ground_stations, satellites, main_sat, date_time_range, frequency_range=30000,
+                                 time_period=False, time_resolved=False):
+    """Batched `detect_RF_collision_of_satellite_over_groundstation` for a list of ground stations,
+    computing the passes over all of them at once.
+    """
+    candidates = FrequencyIndex(satellites, doppler=True).query(main_sat, frequency_range)
+    rf_collisions = []
+    for ground_station, pass_table in zip(ground_stations, _compute_pass_tables(ground_stations, [main_sat] + candidates,
+                                                                                 date_time_range)):
+        overlaps = _find_overlapping_passes(pass_table, main_sat=main_sat)
+        rf_collisions.append(_detect_collisions(ground_station, satellites, main_sat, date_time_range, frequency_range,
+                                                time_period, overlaps, time_resolved=time_resolved))
+    return rf_collisions
+
+def _detect_satellites_over_batch(ground_stations, satellites, date_time_range, frequency_range=30000,
+                                  time_period=False, time_resolved=False):
+    """Batched `detect_RF_collision_of_satellites_over_groundstation` for a list of ground stations,
+    computing the passes over all of them at once.
+    """
+    satellites = list(satellites)
+    candidate_pairs, candidates = _candidates(satellites, frequency_range)
+    rf_collisions = []
+    for ground_station, pass_table in zip(ground_stations, _compute_pass_tables(ground_stations, candidates, date_time_range)):
+        overlaps = _find_overlapping_passes(pass_table)
+        rf_collisions.append(_pair_collisions(ground_station, satellites, candidate_pairs, date_time_range, frequency_range,
+                                              time_period, overlaps, time_resolved))
+    return rf_collisions
+
+def _run_batch(function, ground_stations, args, kwargs):
+    """Runs the batched function once for all the ground stations of the chunk.
+    """
+    return function(ground_stations, *args, **kwargs)
+
+def _run_chunk(function, ground_stations, args, kwargs):
+    """Runs the function for every ground station of the chunk, in a worker process of the pool.
+    """
+    return [function(ground_station, *args, **kwargs) for ground_station in ground_stations]
+
+def _run_over_groundstations(function, ground_stations, args, kwargs, workers=None, executor=None, batched=False):
+    """Runs the single ground station function for every ground station. With `workers` or `executor` the
+    ground stations are split in chunks which run in a process pool, so the Satellites are pickled once per chunk.
+
+    :param function: single ground station function, called as `function(ground_station, *args, **kwargs)`
+    :type function: function
+    :param batched: `function` is a batched function, called once per chunk as `function(ground_stations, *args, **kwargs)`, defaults to False
+    :type batched: bool, optional
+    :param workers: number of worker processes, defaults to None
+    :type workers: int, optional
+    :param executor: executor to submit the chunks to instead of a new process pool, defaults to None
+    :type executor: Instance of `concurrent.futures.Executor`, optional
+    :return: results keyed by the ground station index, starting from 1
+    :rtype: dictionary
+    """
+    ground_stations = list(ground_stations)
+    run = _run_batch if batched else _run_chunk
+    if executor is None and (workers is None or workers <= 1):
+        results = run(function, ground_stations, args, kwargs)
+    else:
+        pool = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+        # Several chunks per worker to balance stations with few and many passes
+        size = max(1, math.ceil(len(ground_stations) / (4 * (workers or os.cpu_count() or 1))))
+        try:
+            futures = [pool.submit(run, function, ground_stations[start:start + size], args, kwargs)
+                       for start in range(0, len(ground_stations), size)]
+            results = [result for future in futures for result in future.result()]
+        finally:
+            if executor is None:
+                pool.shutdown()
+    return {id: result for id, result in enumerate(results, 1)}    # Ground Station index for the dictionary.
 
 def detect_RF_collision_of_satellite_over_groundstation(ground_station, 
-                    satellites, main_sat, date_time_range, frequency_range=30000, time_period=False):
+                    satellites, main_sat, date_time_range, frequency_range=30000, time_period=False, time_resolved=False):
     """Detects RF collisions that main satellite will have with 
     other satellites over a ground station
 
@@ -185,37 +643,39 @@ def detect_RF_collision_of_satellite_over_groundstation(ground_station,
     :type frequency_range: int, optional
     :param time_period: Set to True if desired to compute the time periods of intersection, defaults to False
     :type time_period: bool, optional
+    :param time_resolved: Set to True to only report the sub-intervals of the passes where the Doppler shifted
+        frequencies are within the frequency range, defaults to False
+    :type time_resolved: bool, optional
     :return: list of all collisions
     :rtype: list
     """
-    rf_collisions = []
-    for sat in satellites:
-            rf_collisions.append(_check_collision(ground_station, main_sat, sat, 
-                    date_time_range, frequency_range, time_period=time_period))
-    return rf_collisions
+    return collision_dicts(_detect_satellite_over_groundstation(ground_station, satellites, main_sat, date_time_range,
+                           frequency_range=frequency_range, time_period=time_period, time_resolved=time_resolved))
 
 def detect_RF_collision_of_satellite_over_groundstations(ground_stations, 
-                    satellites, main_sat, date_time_range, frequency_range=30000, time_period=False):
+                    satellites, main_sat, date_time_range, frequency_range=30000, time_period=False, time_resolved=False,
+                    workers=None, executor=None, batched=False):
     """Detects RF collisions that main satellite will have with 
     other satellites over every ground station
 
     :param ground_station: List of `GroundStation`s
+    :param workers: number of worker processes the ground stations are split over, defaults to None
+    :type workers: int, optional
+    :param executor: executor to run the ground stations on, e.g. a shared `ProcessPoolExecutor`, defaults to None
+    :type executor: Instance of `concurrent.futures.Executor`, optional
+    :param batched: propagate every satellite once with SGP4 for all the ground stations and compute their passes
+        together, instead of with ephem for every ground station, defaults to False
+    :type batched: bool, optional
     :return: ditcionary contaning all collisions
     :rtype: dictionary
     """
-    all_rf_collisions = {}
-    id = 1                                                      # Ground Station index for the dictionary.
-    for ground_station in ground_stations:
-        rf_collisions = []
-        for sat in satellites:
-                rf_collisions.append(_check_collision(ground_station, main_sat, sat, 
-                        date_time_range, frequency_range=frequency_range, time_period=time_period))
-        all_rf_collisions[id] = rf_collisions
-        id += 1
-    return all_rf_collisions
+    return collision_dicts(_run_over_groundstations(_detect_satellite_over_batch if batched else _detect_satellite_over_groundstation,
+                    ground_stations, (satellites, main_sat, date_time_range), {"frequency_range": frequency_range,
+                     "time_period": time_period, "time_resolved": time_resolved},
+                    workers=workers, executor=executor, batched=batched))
 
 def detect_RF_collision_of_satellites_over_groundstation(ground_station, 
-                    satellites, date_time_range, frequency_range=30000, time_period=False):
+                    satellites, date_time_range, frequency_range=30000, time_period=False, time_resolved=False):
     """Detects RF collisions that every pair of satellites will have with 
     each other over a ground station
 
@@ -224,37 +684,34 @@ def detect_RF_collision_of_satellites_over_groundstation(ground_station,
     :return: ditcionary contaning all collisions
     :rtype: dictionary
     """
-    all_rf_collisions = {}
-    for main_sat in satellites:
-        # Create a satellite list to pass to `detect_RF_collision_of_satellite_over_groundstation`
-        sat_list  = []
-        for sat in satellites:
-            if (sat != main_sat):
-                sat_list.append(sat)
-        all_rf_collisions[main_sat.get_name()] = (detect_RF_collision_of_satellite_over_groundstation(ground_station, sat_list, main_sat,
-                                               date_time_range, frequency_range=frequency_range, time_period=time_period))
-    return all_rf_collisions
+    return collision_dicts(_detect_satellites_over_groundstation(ground_station, satellites, date_time_range,
+                           frequency_range=frequency_range, time_period=time_period, time_resolved=time_resolved))
 
 def detect_RF_collision_of_satellites_over_groundstations(ground_stations, 
-                    satellites, date_time_range, frequency_range=30000, time_period=False):
+                    satellites, date_time_range, frequency_range=30000, time_period=False, time_resolved=False,
+                    workers=None, executor=None, batched=False):
     """Detects RF collisions that every pair of satellites will have with 
     each other over every ground station
 
     :param ground_station: List of `GroundStation`s
     :param satellites: List of `Satellites`s
+    :param workers: number of worker processes the ground stations are split over, defaults to None
+    :type workers: int, optional
+    :param executor: executor to run the ground stations on, e.g. a shared `ProcessPoolExecutor`, defaults to None
+    :type executor: Instance of `concurrent.futures.Executor`, optional
+    :param batched: propagate every satellite once with SGP4 for all the ground stations and compute their passes
+        together, instead of with ephem for every ground station, defaults to False
+    :type batched: bool, optional
     :return: ditcionary contaning all collisions
     :rtype: dictionary
     """
-    all_rf_collisions = {}
-    id = 1
-    for ground_station in ground_stations:
-        all_rf_collisions[id] = (detect_RF_collision_of_satellites_over_groundstation(ground_station, satellites, date_time_range,
-                         frequency_range=frequency_range, time_period=time_period))
-        id += 1
-    return all_rf_collisions
+    return collision_dicts(_run_over_groundstations(_detect_satellites_over_batch if batched else _detect_satellites_over_groundstation,
+                    ground_stations, (satellites, date_time_range), {"frequency_range": frequency_range,
+                     "time_period": time_period, "time_resolved": time_resolved},
+                    workers=workers, executor=executor, batched=batched))
 
 def compute_RF_collision_of_satellite_over_groundstation(ground_station, 
-                    satellites, main_sat, date_time_range, frequency_range=30000):
+                    satellites, main_sat, date_time_range, frequency_range=30000, time_resolved=False):
     """Computes RF collisions that main satellite will have with 
     other satellites over a ground station
 
@@ -272,28 +729,124 @@ def compute_RF_collision_of_satellite_over_groundstation(ground_station,
     :rtype: list
     """
     return detect_RF_collision_of_satellite_over_groundstation(ground_station, 
-                    satellites, main_sat, date_time_range, frequency_range=frequency_range, time_period=True)
+                    satellites, main_sat, date_time_range, frequency_range=frequency_range, time_period=True,
+                    time_resolved=time_resolved)
 
 def compute_RF_collision_of_satellite_over_groundstations(ground_stations, 
-                    satellites, main_sat, date_time_range, frequency_range=30000):
+                    satellites, main_sat, date_time_range, frequency_range=30000, time_resolved=False, workers=None, executor=None,
+                    batched=False):
     """Computes the time periods of the RF collisions that every pair of satellite will
     have with each other over the ground station.
     """
     return detect_RF_collision_of_satellite_over_groundstations(ground_stations, 
-                    satellites, main_sat, date_time_range, frequency_range=frequency_range, time_period=True)
+                    satellites, main_sat, date_time_range, frequency_range=frequency_range, time_period=True,
+                    time_resolved=time_resolved, workers=workers, executor=executor, batched=batched)
 
 def compute_RF_collision_of_satellites_over_groundstation(ground_station, 
-                    satellites, date_time_range, frequency_range=30000, time_period=False):
+                    satellites, date_time_range, frequency_range=30000, time_period=False, time_resolved=False):
     """Computes the time periods of the RF collisions that every pair of satellite will
     have with each other over the ground station. 
     """
     return detect_RF_collision_of_satellites_over_groundstation(ground_station, 
-                    satellites, date_time_range, frequency_range=frequency_range, time_period=True)
+                    satellites, date_time_range, frequency_range=frequency_range, time_period=True, time_resolved=time_resolved)
 
 def compute_RF_collision_of_satellites_over_groundstations(ground_stations, 
-                    satellites, date_time_range, frequency_range=30000, time_period=False):
+                    satellites, date_time_range, frequency_range=30000, time_period=False, time_resolved=False,
+                    workers=None, executor=None, batched=False):
     """Computes the time periods of the RF collisions that every pair of satellite will
     have with each other over every ground station. 
     """
     return detect_RF_collision_of_satellites_over_groundstations(ground_stations, 
-                    satellites, date_time_range, frequency_range=frequency_range, time_period=True)
\ No newline at end of file
+                    satellites, date_time_range, frequency_range=frequency_range, time_period=True,
+                    time_resolved=time_resolved, workers=workers, executor=executor, batched=batched)
+
+def iter_RF_collisions_over_groundstation(ground_station, 
+                    satellites, date_time_range, frequency_range=30000, main_sat=None, window=timedelta(days=1),
+                    time_resolved=False):
+    """Yields the RF collisions that every pair of satellites, or main satellite with the
+    other satellites, will have over a ground station in the order of their start time.
+    The time range is processed one window at a time, so only the passes of one window are held in memory.
+
+    :param ground_station: Ground Station
+    :type ground_station: Instance of `GroundStation`
+    :param satellites: List of Satellites
+    :type satellites: list
+    :param date_time_range: User defined date-time range
+    :type date_time_range: datetime
+    :param frequency_range: Frequency in Hz, defaults to 30000
+    :type frequency_range: int, optional
+    :param main_sat: only yield the collisions of this satellite, defaults to None
+    :type main_sat: Instance of `Satellite`, optional
+    :param window: duration of the time range whose passes are computed at once, defaults to one day
+    :type window: datetime.timedelta, optional
+    :param time_resolved: only yield the sub-intervals of the passes where the Doppler shifted frequencies
+        are within the frequency range, defaults to False
+    :type time_resolved: bool, optional
+    :return: collision events, whose `to_dict` returns the metadata of `compute_RF_collision_of_satellites_over_groundstation`
+    :rtype: generator of `CollisionEvent`s
+    :raises ValueError: the window isn't positive
+    """
+    if window <= timedelta(0):
+        raise ValueError("The window must be a positive duration, got {}".format(window))
+    return _iter_RF_collisions_over_groundstation(ground_station, satellites, date_time_range, frequency_range=frequency_range,
+                                                  main_sat=main_sat, window=window, time_resolved=time_resolved)
+
+def _iter_RF_collisions_over_groundstation(ground_station, satellites, date_time_range, frequency_range, main_sat, window,
+                                           time_resolved):
+    """Generator of `iter_RF_collisions_over_groundstation`, run once its arguments are validated.
+    """
+    satellites = list(satellites)
+    index = FrequencyIndex(satellites, doppler=True)
+    if main_sat is None:
+        order = {sat: position for position, sat in enumerate(satellites)}
+        pairs = [(sat1, sat2) if order[sat1] <= order[sat2] else (sat2, sat1) for sat1, sat2 in index.candidate_pairs(frequency_range)]
+    else:
+        pairs = [(main_sat, sat) for sat in index.query(main_sat, frequency_range)]
+    involved = set(sat for pair in pairs for sat in pair)
+    involved = [sat for sat in dict.fromkeys(([main_sat] if main_sat is not None else []) + satellites) if sat in involved]
+
+    low = date_time_range[0]
+    while pairs and low <= date_time_range[1]:
+        high = min(low + window, date_time_range[1])
+        last = high == date_time_range[1]
+        pass_table = _compute_pass_table(ground_station, involved, [low, high])
+        overlaps = _find_overlapping_passes(pass_table, main_sat=main_sat)
+        found = []
+        for sat1, sat2 in pairs:
+            for pass1, pass2 in _get_overlapping_passes(overlaps, sat1, sat2):
+                for collision in _pass_collisions(pass1, pass2, date_time_range, frequency_range,
+                                                  sat1.get_frequencies(), sat2.get_frequencies(), time_resolved=time_resolved):
+                    # Collisions starting in an other window are yielded with that window
+                    if low <= collision[1][0] and (collision[1][0] < high or last):
+                        found.append((collision[1][0], sat1, sat2, collision))
+        found.sort(key=lambda elem: elem[0])
+        for start, sat1, sat2, (freq_list, intersection_range) in found:
+            yield CollisionEvent.from_frequencies(sat1, sat2, freq_list, start, intersection_range[1], ground_station=ground_station)
+        if last:
+            break
+        low = high
+
+def iter_RF_collisions_over_groundstations(ground_stations, 
+                    satellites, date_time_range, frequency_range=30000, main_sat=None, window=timedelta(days=1),
+                    time_resolved=False):
+    """Yields the RF collisions over every ground station in the order of their start time,
+    merging the collisions of the ground stations as they are found.
+
+    :param ground_stations: List of `GroundStation`s
+    :type ground_stations: list
+    :return: (ground station index, `CollisionEvent`) tuples, the index starting from 1
+    :rtype: generator of tuples
+    :raises ValueError: the window isn't positive
+    """
+    satellites = list(satellites)
+    streams = []
+    for id, ground_station in enumerate(ground_stations, 1):
+        streams.append(_tag_collisions(id, iter_RF_collisions_over_groundstation(ground_station, satellites, date_time_range,
+                    frequency_range=frequency_range, main_sat=main_sat, window=window, time_resolved=time_resolved)))
+    return heapq.merge(*streams, key=lambda elem: (elem[1].start, elem[0]))
+
+def _tag_collisions(id, collisions):
+    """Pairs every collision with the index of its ground station.
+    """
+    for collision in collisions:
+        yield id, collision
@@ -1,28 +1,43 @@
 from .GSS import (detect_RF_collision_of_satellite_over_groundstation,detect_RF_collision_of_satellite_over_groundstations,detect_RF_collision_of_satellites_over_groundstation, 
 detect_RF_collision_of_satellites_over_groundstations, compute_RF_collision_of_satellite_over_groundstation, compute_RF_collision_of_satellite_over_groundstations,
-compute_RF_collision_of_satellites_over_groundstation, compute_RF_collision_of_satellites_over_groundstations)
-from .only_sat import detect_collisions, compute_collisions
-from .ground_station import GroundStation
-from .satellite import Satellite
+compute_RF_collision_of_satellites_over_groundstation, compute_RF_collision_of_satellites_over_groundstations,
+iter_RF_collisions_over_groundstation, iter_RF_collisions_over_groundstations)
+from .only_sat import (detect_RF_collision_of_satellite_with_satellites, detect_RF_collision_of_satellites,
+detect_RF_collision_of_satellites_with_all_satellites, compute_RF_collision_of_satellite_with_satellites, compute_RF_collision_of_satellites,
+compute_RF_collision_of_satellites_with_all_satellites, iter_RF_collisions)
+from .ground_station import GroundStation, StationSet
+from .satellite import Satellite, SatelliteCatalog, Constellation
+from .event import CollisionEvent
+from .planner import IncrementalPlanner
 
 __all__ = [
-    detect_RF_collision_of_satellite_over_groundstation, 
-    detect_RF_collision_of_satellite_over_groundstations,
-    detect_RF_collision_of_satellites_over_groundstation, 
-    detect_RF_collision_of_satellites_over_groundstations,
-    compute_RF_collision_of_satellite_over_groundstation, 
-    compute_RF_collision_of_satellite_over_groundstations,
-    compute_RF_collision_of_satellites_over_groundstation, 
-    compute_RF_collision_of_satellites_over_groundstations,
+    'detect_RF_collision_of_satellite_over_groundstation',
+    'detect_RF_collision_of_satellite_over_groundstations',
+    'detect_RF_collision_of_satellites_over_groundstation',
+    'detect_RF_collision_of_satellites_over_groundstations',
+    'compute_RF_collision_of_satellite_over_groundstation',
+    'compute_RF_collision_of_satellite_over_groundstations',
+    'compute_RF_collision_of_satellites_over_groundstation',
+    'compute_RF_collision_of_satellites_over_groundstations',
+    'iter_RF_collisions_over_groundstation',
+    'iter_RF_collisions_over_groundstations',
 
-    detect_RF_collision_of_satellite_with_satellites,
-    detect_RF_collision_of_satellites,
-    detect_RF_collision_of_satellites_with_all_satellites,
-    compute_RF_collision_of_satellite_with_satellites,
-    compute_RF_collision_of_satellites,
-    compute_RF_collision_of_satellites_with_all_satellites,
+    'detect_RF_collision_of_satellite_with_satellites',
+    'detect_RF_collision_of_satellites',
+    'detect_RF_collision_of_satellites_with_all_satellites',
+    'compute_RF_collision_of_satellite_with_satellites',
+    'compute_RF_collision_of_satellites',
+    'compute_RF_collision_of_satellites_with_all_satellites',
+    'iter_RF_collisions',
 
-    GroundStation,
+    'GroundStation',
+    'StationSet',
     
-    Satellite
+    'Satellite',
+    'SatelliteCatalog',
+    'Constellation',
+
+    'CollisionEvent',
+
+    'IncrementalPlanner'
 ]
@@ -0,0 +1,10 @@
+from .cache import DiskCache, CacheMissError, get_disk_cache, set_disk_cache, fetch_json, load
+
+__all__ = [
+    'DiskCache',
+    'CacheMissError',
+    'get_disk_cache',
+    'set_disk_cache',
+    'fetch_json',
+    'load'
+]
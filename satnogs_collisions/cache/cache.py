@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+import requests
+
+DEFAULT_TTL = 86400                                     # Records are refreshed after a day
+CACHE_DIR_ENV = "SATNOGS_COLLISIONS_CACHE_DIR"          # Enables the disk cache in this directory
+
+class CacheMissError(LookupError):
+    """Raised in cache-only mode when a record isn't cached.
+    """
+
+class DiskCache:
+    """Persistent cache of the TLEs, transmitters and ground stations fetched from the network, stored as
+    one JSON file per record. Records are fresh for `ttl` seconds, expired HTTP records are refreshed with
+    conditional requests (ETag / Last-Modified), and stale records are served when the network fails.
+
+    :param directory: directory of the records
+    :type directory: str
+    :param ttl: seconds a record is fresh, defaults to one day
+    :type ttl: int, optional
+    :param offline: cache-only mode, never access the network, defaults to False
+    :type offline: bool, optional
+    :param session: session of the HTTP requests, defaults to a new `requests.Session`
+    :type session: Instance of `requests.Session`, optional
+    """
+    def __init__(self, directory, ttl=DEFAULT_TTL, offline=False, session=None):
+        """Constructor method
+        """
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.offline = offline
+        self.session = session if session is not None else requests.Session()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def _read(self, key):
+        try:
+            with open(self._path(key)) as record_file:
+                record = json.load(record_file)
+        except (OSError, ValueError):                       # Missing or corrupt records are fetched again
+            return None
+        return record if record.get("key") == key else None
+
+    def _write(self, key, record):
+        record["key"] = key
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "w") as record_file:         # Replace the record atomically for concurrent jobs
+            json.dump(record, record_file)
+        os.replace(temp_path, self._path(key))
+
+    def _is_fresh(self, record):
+        return time.time() - record["fetched_at"] < record["ttl"]
+
+    def _cached(self, key, record):
+        """Returns the record in cache-only mode, or raises `CacheMissError`.
+        """
+        if record is None:
+            raise CacheMissError("'{}' isn't cached".format(key))
+        return record["value"]
+
+    def get(self, key, loader, ttl=None):
+        """Returns the value of the key, calling `loader()` when it isn't cached or has expired.
+
+        :param key: key of the record
+        :type key: str
+        :param loader: function returning a JSON serializable value
+        :type loader: function
+        :param ttl: seconds the record is fresh, defaults to the TTL of the cache
+        :type ttl: int, optional
+        :raises CacheMissError: the key isn't cached in cache-only mode
+        :return: cached or loaded value
+        """
+        record = self._read(key)
+        if record is not None and self._is_fresh(record):
+            return record["value"]
+        if self.offline:                                    # Stale records are better than none without network
+            return self._cached(key, record)
+        try:
+            value = loader()
+        except Exception:
+            if record is not None:                          # Survive outages with the stale record
+                return record["value"]
+            raise
+        self._write(key, {"value": value, "fetched_at": time.time(), "ttl": self.ttl if ttl is None else ttl})
+        return value
+
+    def get_json(self, url, ttl=None):
+        """Returns the JSON response of the URL, refreshing expired records with a conditional request.
+
+        :param url: URL of the JSON resource
+        :type url: str
+        :param ttl: seconds the record is fresh, defaults to the TTL of the cache
+        :type ttl: int, optional
+        :raises CacheMissError: the URL isn't cached in cache-only mode
+        :return: decoded JSON response
+        """
+        record = self._read(url)
+        if record is not None and self._is_fresh(record):
+            return record["value"]
+        if self.offline:
+            return self._cached(url, record)
+        headers = {}
+        if record is not None:
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+        try:
+            response = self.session.get(url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException:
+            if record is not None:                          # Survive outages with the stale record
+                return record["value"]
+            raise
+        ttl = self.ttl if ttl is None else ttl
+        if response.status_code == 304:                     # Unchanged upstream, only renew the record
+            record["fetched_at"] = time.time()
+            record["ttl"] = ttl
+            self._write(url, record)
+            return record["value"]
+        value = response.json()
+        self._write(url, {"value": value, "fetched_at": time.time(), "ttl": ttl,
+                          "etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")})
+        return value
+
+    def clear(self):
+        """Removes every record of the cache.
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+_disk_cache = None
+_configured = False                                     # Set once `set_disk_cache` overrides the environment
+
+def get_disk_cache():
+    """Returns the disk cache used when fetching TLEs, transmitters and ground stations, if enabled. It is
+    enabled with `set_disk_cache` or by setting the `SATNOGS_COLLISIONS_CACHE_DIR` environment variable.
+
+    :return: Disk cache
+    :rtype: Instance of `DiskCache` or None
+    """
+    global _disk_cache, _configured
+    if not _configured and os.environ.get(CACHE_DIR_ENV):
+        _disk_cache = DiskCache(os.environ[CACHE_DIR_ENV])
+        _configured = True
+    return _disk_cache
+
+def set_disk_cache(cache):
+    """Sets the disk cache used when fetching TLEs, transmitters and ground stations.
+
+    :param cache: Disk cache, None disables caching
+    :type cache: Instance of `DiskCache` or None
+    """
+    global _disk_cache, _configured
+    _disk_cache = cache
+    _configured = True
+
+def fetch_json(url, ttl=None):
+    """Fetches the JSON resource of the URL, through the disk cache if it is enabled.
+
+    :param url: URL of the JSON resource
+    :type url: str
+    :param ttl: seconds the record is fresh, defaults to the TTL of the cache
+    :type ttl: int, optional
+    :return: decoded JSON response
+    """
+    cache = get_disk_cache()
+    if cache is None:
+        return requests.get(url).json()
+    return cache.get_json(url, ttl=ttl)
+
+def load(key, loader, ttl=None):
+    """Calls `loader()`, through the disk cache if it is enabled.
+
+    :param key: key of the record
+    :type key: str
+    :param loader: function returning a JSON serializable value
+    :type loader: function
+    :param ttl: seconds the record is fresh, defaults to the TTL of the cache
+    :type ttl: int, optional
+    :return: cached or loaded value
+    """
+    cache = get_disk_cache()
+    if cache is None:
+        return loader()
+    return cache.get(key, loader, ttl=ttl)
@@ -0,0 +1,9 @@
+from .event import CollisionEvent, satellite_metadata, collision_dicts, mirror_collisions, fan_out_pairs
+
+__all__ = [
+    'CollisionEvent',
+    'satellite_metadata',
+    'collision_dicts',
+    'mirror_collisions',
+    'fan_out_pairs'
+]
@@ -0,0 +1,188 @@
+def _satellite_name(title, norad_id):
+    """Returns the name of the satellite from the title line of its TLE, which is either the bare name as
+    given by CelesTrak, "0 NAME" as in 3LE files or "NNNNN - NAME".
+    """
+    words = title.split()
+    if len(words) > 2 and words[0] in (norad_id, norad_id.lstrip("0")) and words[1] == "-":
+        words = words[2:]
+    elif len(words) > 1 and words[0] == "0":
+        words = words[1:]
+    return " ".join(words)
+
+def satellite_metadata(sat, collision_frequencies):
+    """Creates the metadata dictionary of a satellite taking part in a collision.
+
+    :param sat: Satellite
+    :type sat: Instance of `Satellite`
+    :param collision_frequencies: frequencies of the satellite in range of the other satellite
+    :type collision_frequencies: list
+    :return: metadata of the satellite
+    :rtype: dictionary
+    """
+    sat_dict = {}
+    sat_dict["norad_id"] = sat.get_tle()[1][2:7].strip()            # The title line doesn't always hold the NORAD ID
+    sat_dict["name"] = _satellite_name(sat.get_name(), sat_dict["norad_id"])
+    sat_dict["tle"] = sat.get_tle()
+    sat_dict["frequencies"] = sat.get_frequencies()
+    sat_dict["collision_frequencies"] = list(collision_frequencies)
+    return sat_dict
+
+def mirror_collisions(collisions):
+    """Returns the result of checking Sat1 against Sat2 as the result of checking Sat2 against Sat1,
+    by swapping the satellites of every collision.
+
+    :param collisions: `CollisionEvent`s of Sat1 with Sat2, or whether they collide
+    :type collisions: bool/list
+    :return: collisions of Sat2 with Sat1, or whether they collide
+    :rtype: bool/list
+    """
+    if not isinstance(collisions, list):
+        return collisions
+    return [collision.mirrored() for collision in collisions]
+
+def collision_dicts(results):
+    """Replaces every `CollisionEvent` in the nested lists and dictionaries of results by its metadata
+    dictionary, which is only built here at the boundary of the public functions. Every collision gets
+    its own dictionary.
+
+    :param results: results holding `CollisionEvent`s
+    :type results: bool/list/dictionary
+    :return: results holding the metadata dictionaries
+    :rtype: bool/list/dictionary
+    """
+    if isinstance(results, CollisionEvent):
+        return results.to_dict()
+    if isinstance(results, list):
+        return [collision_dicts(elem) for elem in results]
+    if isinstance(results, dict):
+        return {key: collision_dicts(value) for key, value in results.items()}
+    return results
+
+def fan_out_pairs(satellites, candidate_pairs, check, time_period):
+    """Checks every unordered candidate pair of satellites once and fans the results out to every satellite,
+    the result of (B, A) being the mirror of the result of (A, B).
+
+    :param satellites: List of Satellites
+    :type satellites: list
+    :param candidate_pairs: pairs of satellites that can collide, in either order
+    :type candidate_pairs: set
+    :param check: function checking a pair, called as `check(sat1, sat2)` with Sat1 before Sat2 in `satellites`
+    :type check: function
+    :param time_period: the results are lists of collisions rather than booleans
+    :type time_period: bool
+    :return: results of every satellite against all other satellites, keyed by satellite name
+    :rtype: dictionary
+    """
+    pair_results = {}
+    for index, sat1 in enumerate(satellites):
+        for sat2 in satellites[index + 1:]:
+            if sat1 == sat2 or (sat1, sat2) in pair_results or (sat2, sat1) in pair_results:
+                continue
+            if (sat1, sat2) not in candidate_pairs and (sat2, sat1) not in candidate_pairs:
+                continue
+            pair_results[(sat1, sat2)] = check(sat1, sat2)
+    all_results = {}
+    for main_sat in satellites:
+        results = []
+        for sat in satellites:
+            if sat != main_sat:
+                if (main_sat, sat) in pair_results:
+                    results.append(pair_results[(main_sat, sat)])
+                elif (sat, main_sat) in pair_results:
+                    results.append(mirror_collisions(pair_results[(sat, main_sat)]))
+                else:
+                    results.append([] if time_period else False)
+        all_results[main_sat.get_name()] = results
+    return all_results
+
+class CollisionEvent:
+    """Compact record of a collision between two satellites, optionally over a ground station. It only holds
+    the NORAD IDs, the station ID, the period and the indices of the colliding frequencies, along with
+    references to the `Satellite`s and `GroundStation` they resolve to. The metadata is only built by `to_dict`.
+    Events of the only_sat module may also hold the intersections of the footprints.
+
+    :param satellites: both Satellites
+    :type satellites: tuple
+    :param start: start of the collision
+    :type start: datetime
+    :param end: end of the collision
+    :type end: datetime
+    :param frequency_indices: (index in the frequencies of Sat1, index in the frequencies of Sat2) tuples
+    :type frequency_indices: tuple
+    :param ground_station: Ground Station of the collision, defaults to None
+    :type ground_station: Instance of `GroundStation`, optional
+    :param footprints: (timestamp, footprint) tuples of the intersections of the footprints, defaults to None
+    :type footprints: list, optional
+    """
+    __slots__ = ("norad_ids", "station_id", "start", "end", "frequency_indices", "footprints", "_satellites", "_ground_station")
+
+    def __init__(self, satellites, start, end, frequency_indices, ground_station=None, footprints=None):
+        """Constructor method
+        """
+        self._satellites = tuple(satellites)
+        self._ground_station = ground_station
+        self.norad_ids = tuple(int(sat.get_tle()[1][2:7]) for sat in self._satellites)
+        self.station_id = ground_station.get_id() if ground_station is not None else None
+        self.start = start
+        self.end = end
+        self.frequency_indices = tuple(frequency_indices)
+        self.footprints = footprints
+
+    @classmethod
+    def from_frequencies(cls, sat1, sat2, freq_list, start, end, ground_station=None, footprints=None):
+        """Creates the event from the (frequency of Sat1, frequency of Sat2) tuples in range of each other.
+        """
+        frequencies1 = list(sat1.get_frequencies())
+        frequencies2 = list(sat2.get_frequencies())
+        indices = [(frequencies1.index(freq1), frequencies2.index(freq2)) for freq1, freq2 in freq_list]
+        return cls((sat1, sat2), start, end, indices, ground_station=ground_station, footprints=footprints)
+
+    def mirrored(self):
+        """Returns the same collision with the satellites swapped.
+        """
+        return CollisionEvent(self._satellites[::-1], self.start, self.end, [indices[::-1] for indices in self.frequency_indices],
+                              ground_station=self._ground_station,
+                              footprints=list(self.footprints) if self.footprints is not None else None)
+
+    @property
+    def satellites(self):
+        return self._satellites
+
+    @property
+    def ground_station(self):
+        return self._ground_station
+
+    @property
+    def collision_frequencies(self):
+        """Returns the (frequency of Sat1, frequency of Sat2) tuples in range of each other.
+        """
+        frequencies1 = self._satellites[0].get_frequencies()
+        frequencies2 = self._satellites[1].get_frequencies()
+        return [(frequencies1[index1], frequencies2[index2]) for index1, index2 in self.frequency_indices]
+
+    def to_dict(self):
+        """Returns the metadata of the collision as a dictionary, in the shape returned by the
+        `compute_RF_collision_*` functions.
+
+        :return: metadata of the collision
+        :rtype: dictionary
+        """
+        freq_list = self.collision_frequencies
+        temp = {}
+        if self._ground_station is not None:                # Add Ground Station Meta data to the dictionary
+            ground_coordinates = self._ground_station.get_coordinates()
+            temp["ground_station"] = {}
+            temp["ground_station"]["id"] = self._ground_station.get_id()
+            temp["ground_station"]["latitude"] = ground_coordinates[0]
+            temp["ground_station"]["longitude"] = ground_coordinates[1]
+            temp["ground_station"]["elevation"] = self._ground_station.get_elevation()
+        temp["satellites"] = [satellite_metadata(self._satellites[0], [elem[0] for elem in freq_list]),
+                              satellite_metadata(self._satellites[1], [elem[1] for elem in freq_list])]
+        temp["time_period"] = [self.start, self.end]
+        if self.footprints is not None:
+            temp["footprints"] = self.footprints
+        return temp
+
+    def __repr__(self):
+        return "CollisionEvent(norad_ids={}, station_id={}, start={}, end={})".format(
+            self.norad_ids, self.station_id, self.start, self.end)
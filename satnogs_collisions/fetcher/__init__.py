@@ -0,0 +1,5 @@
+from .fetcher import AsyncFetcher
+
+__all__ = [
+    'AsyncFetcher'
+]
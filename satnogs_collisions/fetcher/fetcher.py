@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from satnogs_collisions.cache import load
+
+TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?CATNR={}"
+TRANSMITTERS_URL = "https://db.satnogs.org/api/transmitters/?satellite__norad_cat_id={}"
+STATIONS_URL = "https://network.satnogs.org/api/stations/?id={}"
+
+class AsyncFetcher:
+    """Fetches TLEs, transmitters and ground stations concurrently for asyncio code. Requests share a pooled
+    `requests.Session` and run on `concurrency` threads, at most `rate` requests per second, and are
+    retried with exponential backoff on connection errors, 429 and 5xx responses. They go through the disk
+    cache when it is enabled.
+
+    :param concurrency: maximum number of concurrent requests, defaults to 16
+    :type concurrency: int, optional
+    :param retries: retries of every failed request, defaults to 3
+    :type retries: int, optional
+    :param backoff: seconds before the first retry, doubled on every retry, defaults to 0.5
+    :type backoff: float, optional
+    :param rate: maximum number of requests per second, defaults to None
+    :type rate: float, optional
+    :param timeout: timeout of every request in seconds, defaults to 30
+    :type timeout: float, optional
+    """
+    def __init__(self, concurrency=16, retries=3, backoff=0.5, rate=None, timeout=30,
+                 tle_url=TLE_URL, transmitters_url=TRANSMITTERS_URL, stations_url=STATIONS_URL):
+        """Constructor method
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.rate = rate
+        self.timeout = timeout
+        self.tle_url = tle_url
+        self.transmitters_url = transmitters_url
+        self.stations_url = stations_url
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._rate_lock = threading.Lock()
+        self._next_request = 0.0
+
+    def _wait_turn(self):
+        """Blocks until the request can start without exceeding the rate limit.
+        """
+        if not self.rate:
+            return
+        with self._rate_lock:                               # Reserve the next free slot
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + 1.0/self.rate
+        time.sleep(start - now)
+
+    def _get(self, url):
+        """Requests the URL, retrying connection errors, 429 and 5xx responses.
+
+        :raises requests.RequestException: the request failed after every retry
+        :return: response
+        :rtype: Instance of `requests.Response`
+        """
+        for attempt in range(self.retries + 1):
+            self._wait_turn()
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                if response.status_code == 429 or response.status_code >= 500:
+                    response.raise_for_status()
+            except requests.RequestException:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2**attempt)
+                continue
+            response.raise_for_status()                     # Other client errors aren't retried
+            return response
+
+    def _load_tle(self, norad_id):
+        lines = [line.strip() for line in self._get(self.tle_url.format(norad_id)).text.splitlines() if line.strip()]
+        if len(lines) < 3:
+            raise LookupError("No TLE for the NORAD ID {}".format(norad_id))
+        return lines[:3]
+
+    async def _run(self, key, loader):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, load, key, loader)
+
+    async def tle(self, norad_id):
+        """Fetches the TLE of the satellite.
+
+        :param norad_id: NORAD ID of the satellite
+        :type norad_id: int
+        :raises LookupError: no TLE is available
+        :return: Two line element set
+        :rtype: list
+        """
+        return await self._run("tle:" + str(norad_id), lambda: self._load_tle(norad_id))
+
+    async def frequencies(self, norad_id):
+        """Fetches the downlink frequencies of the satellite.
+
+        :param norad_id: NORAD ID of the satellite
+        :type norad_id: int
+        :return: frequencies in Hz
+        :rtype: list
+        """
+        url = self.transmitters_url.format(norad_id)
+        data = await self._run(url, lambda: self._get(url).json())
+        downlink_lows = set()
+        for elem in data:
+            if elem["downlink_low"] is not None:
+                downlink_lows.add(elem["downlink_low"])
+        return list(downlink_lows)
+
+    async def station(self, ground_station_id):
+        """Fetches the location of the ground station.
+
+        :param ground_station_id: ID of the Ground Station
+        :type ground_station_id: int
+        :return: latitude, longitude and altitude of the Ground Station
+        :rtype: tuple
+        """
+        url = self.stations_url.format(ground_station_id)
+        data = await self._run(url, lambda: self._get(url).json())
+        return data[0]['lat'], data[0]['lng'], data[0]['altitude']
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
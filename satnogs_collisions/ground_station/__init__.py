@@ -1,5 +1,7 @@
 from .ground_station import GroundStation
+from .station_set import StationSet
 
 __all__ = [
-    GroundStation
-]
\ No newline at end of file
+    'GroundStation',
+    'StationSet'
+]
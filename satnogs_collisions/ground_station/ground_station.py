@@ -1,9 +1,10 @@
-import requests
+import asyncio
 import warnings
+from satnogs_collisions.cache import fetch_json
+from satnogs_collisions.fetcher import AsyncFetcher
 
 def _set_params(ground_station_id):
-    response = requests.get("https://network.satnogs.org/api/stations/?id=" + str(ground_station_id))
-    data = response.json()
+    data = fetch_json("https://network.satnogs.org/api/stations/?id=" + str(ground_station_id))
     return data[0]['lat'], data[0]['lng'], data[0]['altitude']
 
 class GroundStation:
@@ -17,20 +18,54 @@ class GroundStation:
     :type elevation: int, optional
     :raises ValueError: Missing Values
     """
+    __slots__ = ("ground_station_id", "latitude", "longitude", "elevation")
+
     def __init__(self, ground_station_id=None, coordinates=[], elevation=None):
         """Constructor method
         """
         self.ground_station_id = ground_station_id
-        if (len(coordinates) == 2 and elevation):
+        if (len(coordinates) == 2 and elevation is not None):
             self.latitude = coordinates[0]
-            self.longitide = coordinates[1]
+            self.longitude = coordinates[1]
             self.elevation = elevation
         else:
-            self.latitude, self.longitide, self.elevation = _set_params(ground_station_id)
+            self.latitude, self.longitude, self.elevation = _set_params(ground_station_id)
+
+    @classmethod
+    async def fetch_many(cls, ground_station_ids, fetcher=None):
+        """Creates the Ground Stations of the IDs, fetching their locations concurrently.
+
+        :param ground_station_ids: IDs of the Ground Stations
+        :type ground_station_ids: list
+        :param fetcher: fetcher of the requests, defaults to a new `AsyncFetcher`
+        :type fetcher: Instance of `AsyncFetcher`, optional
+        :return: List of Ground Stations in the order of the IDs
+        :rtype: list
+        """
+        ground_station_ids = list(ground_station_ids)
+        own_fetcher = fetcher is None
+        if own_fetcher:
+            fetcher = AsyncFetcher()
+        try:
+            params = await asyncio.gather(*[fetcher.station(ground_station_id) for ground_station_id in ground_station_ids])
+        finally:
+            if own_fetcher:
+                fetcher.close()
+        return [cls(ground_station_id=ground_station_id, coordinates=[lat, lng], elevation=altitude)
+                for ground_station_id, (lat, lng, altitude) in zip(ground_station_ids, params)]
+
+    @property
+    def longitide(self):
+        """Former misspelled name of `longitude`, kept for compatibility.
+        """
+        return self.longitude
 
+    @longitide.setter
+    def longitide(self, value):
+        self.longitude = value
 
     def get_coordinates(self):
-        return (self.latitude, self.longitide)
+        return (self.latitude, self.longitude)
     
     def get_elevation(self):
         return self.elevation
@@ -0,0 +1,29 @@
+import numpy as np
+
+class StationSet:
+    """Columnar representation of a list of Ground Stations, holding their locations as NumPy arrays.
+    It iterates over the Ground Stations, so every function taking a list of Ground Stations takes a
+    `StationSet` too.
+
+    :param ground_stations: List of Ground Stations
+    :type ground_stations: list
+    """
+    def __init__(self, ground_stations):
+        """Constructor method
+        """
+        self.ground_stations = list(ground_stations)
+        self.ids = [ground_station.get_id() for ground_station in self.ground_stations]
+        coordinates = np.array([ground_station.get_coordinates() for ground_station in self.ground_stations],
+                               dtype=float).reshape(-1, 2)
+        self.latitude = coordinates[:, 0]                   # Degrees
+        self.longitude = coordinates[:, 1]                  # Degrees
+        self.elevation = np.array([ground_station.get_elevation() for ground_station in self.ground_stations], dtype=float)
+
+    def __len__(self):
+        return len(self.ground_stations)
+
+    def __iter__(self):
+        return iter(self.ground_stations)
+
+    def __getitem__(self, index):
+        return self.ground_stations[index]
@@ -1,12 +1,17 @@
-from .sat_intersection import detect_RF_collision_of_satellite_with_satellites, detect_RF_collision_of_satellites,
+from .sat_intersection import (detect_RF_collision_of_satellite_with_satellites, detect_RF_collision_of_satellites,
 detect_RF_collision_of_satellites_with_all_satellites, compute_RF_collision_of_satellite_with_satellites, compute_RF_collision_of_satellites,
-compute_RF_collision_of_satellites_with_all_satellites
+compute_RF_collision_of_satellites_with_all_satellites, iter_RF_collisions, orbital_summary)
+from .registry import SatelliteRegistry, get_registry
 
 __all__ = [
-    detect_RF_collision_of_satellite_with_satellites,
-    detect_RF_collision_of_satellites,
-    detect_RF_collision_of_satellites_with_all_satellites,
-    compute_RF_collision_of_satellite_with_satellites,
-    compute_RF_collision_of_satellites,
-    compute_RF_collision_of_satellites_with_all_satellites
+    'detect_RF_collision_of_satellite_with_satellites',
+    'detect_RF_collision_of_satellites',
+    'detect_RF_collision_of_satellites_with_all_satellites',
+    'compute_RF_collision_of_satellite_with_satellites',
+    'compute_RF_collision_of_satellites',
+    'compute_RF_collision_of_satellites_with_all_satellites',
+    'iter_RF_collisions',
+    'orbital_summary',
+    'SatelliteRegistry',
+    'get_registry'
 ]
@@ -0,0 +1,64 @@
+import threading
+from satnogs_collisions.satellite import SatelliteCatalog
+
+def _load_all_satellites():
+    """Loads every transmitting satellite of SatNOGS DB with one bulk request for the transmitters,
+    grouped by NORAD ID in a single pass, and one for the TLEs.
+    """
+    return SatelliteCatalog.fetch().satellites()
+
+class SatelliteRegistry:
+    """Registry of all the satellites the `*_with_all_satellites` functions compare with. The satellites
+    are loaded on first use and kept until the registry is refreshed or invalidated.
+
+    :param loader: function returning the list of Satellites, defaults to loading every transmitting satellite of SatNOGS DB
+    :type loader: function, optional
+    :param satellites: initial list of Satellites, defaults to None
+    :type satellites: list, optional
+    """
+    def __init__(self, loader=None, satellites=None):
+        """Constructor method
+        """
+        self.loader = loader if loader is not None else _load_all_satellites
+        self._satellites = list(satellites) if satellites is not None else None
+        self._lock = threading.Lock()
+
+    def satellites(self):
+        """Returns the satellites of the registry, loading them if needed.
+
+        :return: List of Satellites
+        :rtype: list
+        """
+        with self._lock:                                    # Concurrent callers wait for a single load
+            if self._satellites is None:
+                self._satellites = list(self.loader())
+            return self._satellites
+
+    def refresh(self):
+        """Loads the satellites again, replacing the previous ones once loaded.
+        """
+        satellites = list(self.loader())
+        with self._lock:
+            self._satellites = satellites
+
+    def invalidate(self):
+        """Drops the satellites, they are loaded again on next use.
+        """
+        with self._lock:
+            self._satellites = None
+
+    def __len__(self):
+        return len(self.satellites())
+
+    def __iter__(self):
+        return iter(self.satellites())
+
+_registry = SatelliteRegistry()
+
+def get_registry():
+    """Returns the registry shared by the `*_with_all_satellites` functions.
+
+    :return: Satellite registry
+    :rtype: Instance of `SatelliteRegistry`
+    """
+    return _registry
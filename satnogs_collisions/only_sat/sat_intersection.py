@@ -1,31 +1,27 @@
-import requests
-import ephem
 import geog
 import math
+import os
 import numpy as np
 import shapely
 import datetime
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from shapely.geometry import Point
 from shapely.geometry.polygon import Polygon
+from shapely.prepared import prep
 from satnogs_collisions.satellite import Satellite
+from satnogs_collisions.satellite.frequency_index import FrequencyIndex
+from satnogs_collisions.propagation import get_backend, get_cache, propagate
+from satnogs_collisions.event import CollisionEvent, collision_dicts, fan_out_pairs
+from .registry import get_registry
 
 R = 6371800                                     # Define Radius of Earth in m
-all_sats = []                                   # Used when `detect_collisions_satellite`  method is called multiple times
-
-def _get_all_satellite():
-    resonse = requests.get("https://db.satnogs.org/api/transmitters/")
-    data = response.json()
-    norad_ids = set()
-    for sat_detail in data:
-        norad_ids.add(sat_detail["norad_cat_id"])
-    for norad_id in norad_ids:                                 # Get the list of all satellites
-        frequencies = []
-        for sat_detail in data:
-            if (sat_detail["norad_cat_id"] == norad_id):
-                frequencies.append(sat_detail["downlink_low"])
-        sat = Satellite(norad_id=norad_id, frequencies=frequencies)
-        all_sats.append(sat)
-    return
+MU = 398600441800000.0                          # Standard gravitational parameter of the Earth in m^3/s^2
+OMEGA_E = 7.2921159e-5                          # Rotation rate of the Earth in rad/s
+J2 = 1.08263e-3                                 # Second zonal harmonic of the Earth
+HEIGHT_MARGIN = 20000.0                         # Short periodic variation of the height in m
+BATCH_BLOCK = 1000000                           # Sub-satellite points propagated at once against one satellite
+_tracks = None                                  # Tracks of the satellites in shared memory, set in the worker processes
 
 def compute_intersection(footprint1, footprint2):
     """Compute the intersection of footprints using the `shapely` method.
@@ -53,34 +49,381 @@ def compute_footprint(sat, date_time, alpha=None):
     :rtype: Shapely Polygon instance
     """
 
-    line1, line2, line3 = sat.get_tle()                     # Read TLE of the sateellite and create an Ephem instance
-    sat = ephem.readtle(line1, line2, line3)
+    sat = get_cache().body(sat.get_tle())                   # Ephem instance of the satellite, parsed once per TLE
     sat.compute(date_time)
 
     sublat = sat.sublat                                     # Sub-satellite points
     sublong = sat.sublong
 
     h = sat.elevation                                       # height of the satellite above sea level in m
+    return _footprint(sublat, sublong, h, alpha=alpha)
 
-    d = None                                                # Diameter of the circular coverage
+def _footprint_radius(h, alpha=None):
+    """Compute the angular radius of the circular coverage of Satellites, i.e. the Earth central angle
+    between the sub-satellite point and the edge of the footprint.
+
+    :param h: height of the satellites above sea level in m
+    :type h: float/numpy array
+    :param alpha: half angle given by user in degrees, defaults to None
+    :type alpha: int, optional
+    :return: angular radius in radians
+    :rtype: float/numpy array
+    """
+    lam = np.arccos(R/(R+h))                                # Coverage up to the horizon if alpha isn't defined
     if alpha:
-        theta = math.degrees(math.asin(sin(alpha)*(R/(R+h)))) - alpha
-        theta = math.radians(theta)
-        d = 2*R*theta                                       # diameter
+        eta = math.radians(alpha)                           # Coverage of the antenna cone, limited by the horizon
+        arg = ((R+h)/R)*math.sin(eta)
+        lam = np.where(arg < 1.0, np.arcsin(np.minimum(arg, 1.0)) - eta, lam)
+    return lam
+
+def _cap_gap(sublat1, sublong1, radius1, sublat2, sublong2, radius2):
+    """Computes the great-circle distance between the sub-satellite points minus the sum of the angular
+    radii of the footprints, which is negative exactly when the circular footprints overlap.
+
+    :return: gap between the footprints in radians
+    :rtype: float/numpy array
+    """
+    a = np.sin((sublat2 - sublat1)/2)**2 + np.cos(sublat1)*np.cos(sublat2)*np.sin((sublong2 - sublong1)/2)**2
+    distance = 2*np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))  # Haversine formula
+    return distance - (radius1 + radius2)
+
+def _cap_overlap(sublat1, sublong1, radius1, sublat2, sublong2, radius2):
+    """Checks if the circular footprints of two satellites overlap, which is exactly when the great-circle
+    distance between their sub-satellite points is less than the sum of their angular radii.
+
+    :return: whether the footprints overlap at every timestep
+    :rtype: numpy array
+    """
+    return _cap_gap(sublat1, sublong1, radius1, sublat2, sublong2, radius2) < 0
+
+def orbital_summary(sat, alpha=None):
+    """Computes a summary of the orbit of the satellite from its TLE, bounding where its footprint can be and
+    how fast it can move. Heights have a margin for the flattening of the Earth and the short periodic
+    perturbations, so every bound holds for the propagated positions.
+
+    :param sat: Satellite object
+    :type sat: instance of the satnogs-collisions Satellite object
+    :param alpha: half angle given by user in degrees, defaults to None
+    :type alpha: int, optional
+    :return: perigee and apogee heights in m, inclination in degrees, minimum and maximum angular radius of the
+        footprint and latitude reach of the footprint in radians, and the maximum rate of change in rad/s of the
+        gap between the footprint and any other footprint
+    :rtype: dictionary
+    """
+    line2 = sat.get_tle()[2]
+    i = math.radians(float(line2[8:16]))
+    e = float("0." + line2[26:33].strip())
+    n = float(line2[52:63])*2*math.pi/86400                 # Mean motion in rad/s
+    a = (MU/n**2)**(1/3)                                    # Semi-major axis in m
+    r_p = a*(1 - e)
+    r_a = a*(1 + e)
+    p = a*(1 - e**2)
+    h_min = max(r_p - 6378137.0 - HEIGHT_MARGIN, 1.0)       # Heights above the WGS84 ellipsoid
+    h_max = r_a - 6356752.3 + HEIGHT_MARGIN
+
+    # The sub-satellite point turns around the normal of the orbit, fastest at perigee and slowest at apogee,
+    # while the Earth turns around its axis, so its speed on the ground is the norm of the difference
+    ang_mom = math.sqrt(MU*p)
+    omega = max(math.sqrt(rate**2 + OMEGA_E**2 - 2*rate*OMEGA_E*math.cos(i)) for rate in (ang_mom/r_p**2, ang_mom/r_a**2))
+    omega += 7.5*n*J2*(R/p)**2 + 1e-8                       # Precession of the node and perigee, and third bodies
+
+    h_dot = e*math.sqrt(MU/p) + 30.0                        # Radial speed, plus the flattening of the Earth
+    rho = 0.0
+    for h in (h_min, h_max):                                # Footprint growth rate at perigee and apogee
+        rate = R/((R+h)*math.sqrt((R+h)**2 - R**2))
+        if alpha:
+            eta = math.radians(alpha)
+            arg = min(((R+h)/R)*math.sin(eta), 0.999)
+            rate = max(rate, (math.sin(eta)/R)/math.sqrt(1 - arg**2))
+        rho = max(rho, rate*h_dot)
+
+    min_radius, max_radius = (float(radius) for radius in _footprint_radius(np.array([h_min, h_max]), alpha=alpha))
+    summary = {}
+    summary["perigee_height"] = h_min
+    summary["apogee_height"] = h_max
+    summary["inclination"] = math.degrees(i)
+    summary["min_footprint_radius"] = min_radius
+    summary["max_footprint_radius"] = max_radius
+    summary["latitude_reach"] = min(min(i, math.pi - i) + max_radius, math.pi/2)
+    summary["max_gap_rate"] = omega + rho
+    return summary
+
+def _max_gap_rate(sat, alpha=None):
+    """Computes an upper bound of how fast the gap between the footprint of the satellite and any other
+    footprint can change: the speed of the sub-satellite point on the ground plus the growth rate of the
+    footprint radius.
+
+    :param sat: Satellite object
+    :type sat: instance of the satnogs-collisions Satellite object
+    :param alpha: half angle given by user in degrees, defaults to None
+    :type alpha: int, optional
+    :return: rate in rad/s
+    :rtype: float
+    """
+    return orbital_summary(sat, alpha=alpha)["max_gap_rate"]
+
+def _classify_pair(summary1, summary2, gap, duration):
+    """Classifies a pair of satellites from their orbital summaries and the gap between their footprints at
+    the start of the time range, without propagating them over the time range.
+
+    :param summary1: orbital summary of Sat1
+    :type summary1: dictionary
+    :param summary2: orbital summary of Sat2
+    :type summary2: dictionary
+    :param gap: gap between the footprints at the start of the time range in radians
+    :type gap: float
+    :param duration: duration of the time range in seconds
+    :type duration: float
+    :return: "never" if the footprints can't overlap in the time range, "always" if they overlap all along
+        and "sweep" if the time range has to be propagated
+    :rtype: str
+    """
+    if summary1["min_footprint_radius"] + summary2["min_footprint_radius"] >= math.pi:
+        return "always"                                     # Footprints larger than a hemisphere always meet
+    if np.isnan(gap):
+        return "sweep"
+    change = (summary1["max_gap_rate"] + summary2["max_gap_rate"])*duration
+    if gap > change:
+        return "never"
+    if gap < -change:
+        return "always"
+    return "sweep"
+
+def _classified_periods(sats, pairs, date_time_range, time_accuracy, alpha=None, backend=None, adaptive=False, summaries=None):
+    """Finds the overlaps of the footprints of the pairs whose class is known from their orbits, e.g.
+    satellites on opposite sides of the Earth or geostationary satellites with wide footprints. The
+    satellites are only propagated at the start of the time range.
+
+    :param sats: satellites of the pairs
+    :type sats: list
+    :param pairs: (sat1, sat2) pairs to classify
+    :type pairs: list
+    :param summaries: orbital summaries of the satellites keyed by satellite, computed if not given, defaults to None
+    :type summaries: dictionary, optional
+    :return: [start, end] of the overlaps keyed by pair, for the pairs that don't have to be propagated over the time range
+    :rtype: dictionary
+    """
+    low, high = date_time_range
+    if not adaptive:                                        # Last timestep of the grid
+        step = datetime.timedelta(seconds=time_accuracy)
+        high = low + step*((high - low)//step)
+    sublat, sublong, h = get_backend(backend).propagate(sats, [low])
+    radius = _footprint_radius(h[:, 0], alpha=alpha)
+    index = {sat: position for position, sat in enumerate(sats)}
+    if summaries is None:
+        summaries = {sat: orbital_summary(sat, alpha=alpha) for sat in sats}
+    known = {}
+    for sat1, sat2 in pairs:
+        i, j = index[sat1], index[sat2]
+        gap = _cap_gap(sublat[i, 0], sublong[i, 0], radius[i], sublat[j, 0], sublong[j, 0], radius[j])
+        pair_class = _classify_pair(summaries[sat1], summaries[sat2], gap, (date_time_range[1] - low).total_seconds())
+        if pair_class == "never":
+            known[(sat1, sat2)] = []
+        elif pair_class == "always":
+            known[(sat1, sat2)] = [[low, high]]
+    return known
+
+def _adaptive_overlap_periods(sat1, sat2, date_time_range, time_accuracy, tolerance, alpha=None, backend=None, first_only=False,
+                              summaries=None):
+    """Finds the periods where the footprints of both satellites overlap with adaptive time steps.
+    Steps are as large as the gap between the footprints allows, given how fast it can close, but at
+    least `time_accuracy` seconds. The start and end of every overlap are then found by bisection.
+
+    :param time_accuracy: minimum step in seconds, overlaps shorter than it may be missed
+    :type time_accuracy: int
+    :param tolerance: precision of the start and end of the overlaps in seconds
+    :type tolerance: float
+    :param first_only: stop at the first overlap, defaults to False
+    :type first_only: bool, optional
+    :param summaries: orbital summaries of the satellites keyed by satellite, computed if not given, defaults to None
+    :type summaries: dictionary, optional
+    :return: [start, end] datetimes of every overlap
+    :rtype: list
+    """
+    backend = get_backend(backend)
+    if summaries is not None:
+        rate = summaries[sat1]["max_gap_rate"] + summaries[sat2]["max_gap_rate"]
     else:
-        rho = math.degrees(math.asin((R/(R+h))))            # Compute d as maximum d if alpha isn't defined
-        lam = 90 - rho
-        lam = math.radians(lam)
-        d_max = R*(math.tan(lam))
-        d = d_max
+        rate = _max_gap_rate(sat1, alpha=alpha) + _max_gap_rate(sat2, alpha=alpha)
+
+    def gap(date_time):
+        sublat, sublong, h = backend.propagate([sat1, sat2], [date_time])
+        radius = _footprint_radius(h[:, 0], alpha=alpha)
+        return _cap_gap(sublat[0, 0], sublong[0, 0], radius[0], sublat[1, 0], sublong[1, 0], radius[1])
+
+    low, high = date_time_range
+    periods = []
+    g = gap(low)
+    start = low if g < 0 else None
+    while low < high:
+        step = time_accuracy if np.isnan(g) else max(abs(g)/rate, time_accuracy)
+        upper = min(low + datetime.timedelta(seconds=step), high)
+        g_upper = gap(upper)
+        if (g < 0) != (g_upper < 0):                        # The footprints start or stop overlapping in between
+            a, b = low, upper
+            while (b - a).total_seconds() > tolerance:
+                mid = a + (b - a)/2
+                if (gap(mid) < 0) == (g < 0):
+                    a = mid
+                else:
+                    b = mid
+            if g_upper < 0:
+                start = b
+            else:
+                periods.append([start, a])
+                start = None
+                if first_only:
+                    return periods
+        low, g = upper, g_upper
+    if start is not None:                                   # Add the overlap still ongoing at the end of the range
+        periods.append([start, high])
+    return periods
+
+def _overlap_periods(overlap):
+    """Finds the runs of consecutive timesteps where the footprints overlap.
+
+    :return: (first, last) timestep indices of every run
+    :rtype: list
+    """
+    edges = np.diff(np.concatenate(([0], overlap.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+def _footprint(sublat, sublong, h, alpha=None):
+    """Compute the footprint of a Satellite from its sub-satellite point and height.
+
+    :param sublat: latitude of the sub-satellite point in radians
+    :type sublat: float
+    :param sublong: longitude of the sub-satellite point in radians
+    :type sublong: float
+    :param h: height of the satellite above sea level in m
+    :type h: float
+    :param alpha: half angle given by user in degrees, defaults to None
+    :type alpha: int, optional
+    :return: Footprint of the Satllite in GeoJSON format
+    :rtype: Shapely Polygon instance
+    """
+    d = R*_footprint_radius(h, alpha=alpha)                 # Radius of the circular coverage along the surface
 
-    p = Point([sublat, sublong])                            # Convert the data to GeoJSON format
+    p = Point([math.degrees(sublong), math.degrees(sublat)])    # Convert the data to GeoJSON format
     n = 32
     angles = np.linspace(0, 360, n)
     polygon = geog.propagate(p, angles, d)
     footprint = Polygon(list(polygon))
     return footprint
 
+def _time_grid(date_time_range, time_accuracy):
+    """Computes the timesteps of the given time range, `time_accuracy` seconds apart.
+
+    :return: timesteps from the start to the end of the range
+    :rtype: list of Python datetime objects
+    """
+    times = []
+    low = date_time_range[0]
+    while (low <= date_time_range[1]):
+        times.append(low)
+        low += datetime.timedelta(seconds=time_accuracy)
+    return times
+
+def _densify(coordinates, spacing=1.0):
+    """Adds points along the edges of a ring of (longitude, latitude) coordinates, at most `spacing` degrees apart.
+    """
+    coordinates = np.asarray(coordinates, dtype=float)[:, :2]
+    points = [coordinates[:1]]
+    for start, end in zip(coordinates[:-1], coordinates[1:]):
+        count = max(1, int(math.ceil(np.abs(end - start).max()/spacing)))
+        points.append(start + np.outer(np.arange(1, count + 1)/count, end - start))
+    return np.concatenate(points)
+
+def _area_caps(area):
+    """Covers the area of interest with spherical caps. Ground Stations are caps without radius, so a footprint
+    reaches one exactly when the Ground Station is inside the footprint.
+
+    :param area: GeoJSON polygon or multipolygon, Shapely geometry, list of Ground Stations or `StationSet`
+    :type area: dictionary/Shapely geometry/list
+    :return: latitudes and longitudes of the centers in radians, angular radii, and the geometry to clip the
+        footprints to, None for Ground Stations
+    :rtype: tuple
+    """
+    if hasattr(area, "latitude") and hasattr(area, "longitude"):                 # StationSet
+        return np.radians(area.latitude), np.radians(area.longitude), np.zeros(len(area.latitude)), None
+    if isinstance(area, (list, tuple)):
+        coordinates = np.array([ground_station.get_coordinates() for ground_station in area], dtype=float).reshape(-1, 2)
+        return np.radians(coordinates[:, 0]), np.radians(coordinates[:, 1]), np.zeros(len(coordinates)), None
+    geometry = area if hasattr(area, "geom_type") else shapely.geometry.shape(area.get("geometry", area))
+    lat, lon, radius = [], [], []
+    for part in getattr(geometry, "geoms", [geometry]):
+        points = np.radians(_densify(part.exterior.coords))
+        vectors = np.stack((np.cos(points[:, 1])*np.cos(points[:, 0]), np.cos(points[:, 1])*np.sin(points[:, 0]),
+                            np.sin(points[:, 1])), axis=1)
+        center = vectors.mean(axis=0)
+        norm = np.linalg.norm(center)
+        if norm < 1e-6:                                     # Spread over the whole Earth
+            lat.append(0.0)
+            lon.append(0.0)
+            radius.append(math.pi)
+            continue
+        center /= norm
+        lat.append(math.asin(center[2]))
+        lon.append(math.atan2(center[1], center[0]))
+        radius.append(float(np.arccos(np.clip(vectors @ center, -1.0, 1.0)).max()) + math.radians(1))
+    return np.array(lat), np.array(lon), np.array(radius), geometry
+
+def _area_reach(caps, sublat, sublong, radius):
+    """Checks which caps of the area of interest the footprints reach.
+
+    :param caps: caps of the area, as computed by `_area_caps`
+    :type caps: tuple
+    :return: whether every cap is reached, shaped (caps,) + shape of the sub-satellite points
+    :rtype: numpy array
+    """
+    shape = (-1,) + (1,)*np.ndim(sublat)
+    return _cap_gap(caps[0].reshape(shape), caps[1].reshape(shape), caps[2].reshape(shape), sublat, sublong, radius) < 0
+
+def _polygon_filter(caps, sublat1, sublong1, h1, sublat2, sublong2, h2, keep, alpha=None):
+    """Keeps the timesteps where the intersection of both footprints meets the polygon of the area of interest.
+    The caps only bound the polygon, so the footprints are only built for the timesteps they let through.
+
+    :param keep: timesteps to check, the others are dropped
+    :type keep: numpy array
+    :return: timesteps over the polygon
+    :rtype: numpy array
+    """
+    if caps[3] is None:                                     # Ground Stations, the caps are exact
+        return keep
+    polygon = prep(caps[3])
+    keep = np.array(keep, dtype=bool)
+    for step in np.flatnonzero(keep):
+        fp1 = _footprint(sublat1[step], sublong1[step], h1[step], alpha=alpha)
+        fp2 = _footprint(sublat2[step], sublong2[step], h2[step], alpha=alpha)
+        keep[step] = polygon.intersects(compute_intersection(fp1, fp2))
+    return keep
+
+def _area_mask(caps, sublat, sublong, h, radius, alpha=None):
+    """Checks at every timestep if the footprints of both satellites, of shape (2, timesteps), overlap over
+    the area of interest.
+    """
+    reach1 = _area_reach(caps, sublat[0], sublong[0], radius[0])
+    reach2 = _area_reach(caps, sublat[1], sublong[1], radius[1])
+    keep = np.any(reach1 & reach2, axis=0) & _cap_overlap(sublat[0], sublong[0], radius[0], sublat[1], sublong[1], radius[1])
+    return _polygon_filter(caps, sublat[0], sublong[0], h[0], sublat[1], sublong[1], h[1], keep, alpha=alpha)
+
+def _restrict_to_area(sat1, sat2, periods, time_accuracy, caps, alpha=None, backend=None):
+    """Keeps the parts of the overlap periods where both footprints reach the area of interest, propagating the
+    satellites only inside the periods.
+
+    :return: [start, end] datetimes of the overlaps over the area
+    :rtype: list
+    """
+    restricted = []
+    for period in periods:
+        times = _time_grid(period, time_accuracy)
+        sublat, sublong, h = propagate([sat1, sat2], times, backend=backend)
+        inside = _area_mask(caps, sublat, sublong, h, _footprint_radius(h, alpha=alpha), alpha=alpha)
+        restricted.extend([times[first], times[last]] for first, last in _overlap_periods(inside))
+    return restricted
+
 def _in_freq_range(frequencies1, frequencies2, frequency_range):
     """Check if difference between the frequencies lie in the given range
     """
@@ -93,7 +436,7 @@ def _in_freq_range(frequencies1, frequencies2, frequency_range):
         return freq_list
     return False
 
-def _check_collision(sat1, sat2, date_time_range, time_accuracy, frequency_range, alpha=None, time_period=False, intersection=False):
+def _check_collision(sat1, sat2, date_time_range, time_accuracy, frequency_range, alpha=None, time_period=False, intersection=False, backend=None, adaptive=False, tolerance=1, periods=None, caps=None, classify=True, summaries=None):
     """Helper function to check collision between Satellites in given time range.
 
     :param sat1: Satellite object
@@ -112,72 +455,247 @@ def _check_collision(sat1, sat2, date_time_range, time_accuracy, frequency_range
     :type time_period: bool, optional
     :param intersection: parameter set to add footprint of the collisions to the Metadata, defaults to False
     :type intersection: bool, optional
-    :return: bool/ Array of time periods if there is a collision
+    :param backend: propagation backend, see `get_backend`, defaults to None
+    :type backend: str, optional
+    :param adaptive: use adaptive time steps, `time_accuracy` being the minimum step, defaults to False
+    :type adaptive: bool, optional
+    :param tolerance: precision in seconds of the start and end of the collisions in adaptive mode, defaults to 1
+    :type tolerance: float, optional
+    :param periods: [start, end] of the overlaps of the footprints when already known, over the area of interest if any, defaults to None
+    :type periods: list, optional
+    :param caps: caps of the area of interest, as computed by `_area_caps`, defaults to None
+    :type caps: tuple, optional
+    :param classify: classify the pair from the orbits when `periods` isn't given, set to False when the caller
+        already classified it, defaults to True
+    :type classify: bool, optional
+    :param summaries: orbital summaries of the satellites keyed by satellite, computed if not given, defaults to None
+    :type summaries: dictionary, optional
+    :return: bool/ Array of `CollisionEvent`s if there is a collision
     :rtype: bool/list
     """
-    low = date_time_range[0]
-    high = date_time_range[1]
     collisions = []
     freq_list = _in_freq_range(sat1.get_frequencies(), sat2.get_frequencies(), frequency_range)
-    tp = []                                                 # Initialize buffers to store time_period...
-    time_fp = []                                            # ... (timestamp,foorpint) tuples...
-    temp = {}                                               # ... and collision dictionary.
-    sat_arr = []
-    if len(freq_list):                                      # Add Satellites' Meta data to the dictionary
-        sat_dict = {}
-        sat_dict["norad_id"] = sat1.get_name().split(' ')[0]
-        sat_dict["name"] = sat1.get_name().split(' ')[1]
-        sat_dict["tle"] = sat1.get_tle()
-        sat_dict["frequencies"] = sat1.get_frequencies()
-        sat_dict["collision_frequencies"] = []
-        for elem in freq_list:
-            sat_dict["collision_frequencies"].append(elem[0])
-        sat_arr.append(sat_dict)
-        sat_dict = {}
-        sat_dict["norad_id"] = sat2.get_name().split(' ')[0]
-        sat_dict["name"] = sat2.get_name().split(' ')[1]
-        sat_dict["tle"] = sat2.get_tle()
-        sat_dict["frequencies"] = sat2.get_frequencies()
-        sat_dict["collision_frequencies"] = []
-        for elem in freq_list:
-            sat_dict["collision_frequencies"].append(elem[1])
-        sat_arr.append(sat_dict)
-    while (len(freq_list) and low <= high):                 # iterate throught he while loop only when frequencies are close
-        fp1 = compute_footprint(sat1, low, alpha=alpha)
-        fp2 = compute_footprint(sat2, low, alpha=alpha)     # Compute footprints each satellite
-        intersection_res = compute_intersection(fp1, fp2)   # Compute footprints
-        if intersection_res:
-            if not time_period:                             # Return true if metadata isn't required
-                return True
-            if not len(tp):                                 # no ongoing collision, add first new collision
-                temp = {}                                   # Start new collision and initialize metadata
-                temp["satellites"] = sat_arr
-                tp = [low, low]
-                if intersection:
-                    time_fp.append((low, intersection_res))
-            else:                                           # add values to ongoing collision
-                tp[-1] = low
-                if intersection:
-                    time_fp.append((low, intersection_res))
-        else:
-            if (len(tp)):                                   # Add previous recenlty finished collision to the list
-                temp["time_period"] = tp
-                if intersection:
-                    temp["footprints"] = time_fp
-                collisions.append(temp)
-                tp = []                                     # Initialize values for new collisions
-                time_fp = []
-                temp = {}
-        low += datetime.timedelta(seconds=time_accuracy)
-    temp["time_period"] = tp
-    if intersection:
-        temp["footprints"] = time_fp
-    collisions.append(temp)
-    if not time_period:
-        return False
+    if not freq_list:                                       # No propagation is needed when frequencies aren't close
+        return [] if time_period else False
+    restrict = caps is not None and periods is None
+    if periods is None and classify:                        # No propagation over the range for the pairs known from their orbits
+        periods = _classified_periods([sat1, sat2], [(sat1, sat2)], date_time_range, time_accuracy,
+                                      alpha=alpha, backend=backend, adaptive=adaptive, summaries=summaries).get((sat1, sat2))
+    if periods is not None:                                 # Overlaps were already computed from shared tracks
+        periods = list(periods)
+    elif adaptive:
+        periods = _adaptive_overlap_periods(sat1, sat2, date_time_range, time_accuracy, tolerance,
+                                            alpha=alpha, backend=backend, first_only=not time_period and caps is None,
+                                            summaries=summaries)
+    else:
+        times = _time_grid(date_time_range, time_accuracy)
+        sublat, sublong, h = propagate([sat1, sat2], times, backend=backend)    # Propagate both satellites over the whole range at once
+        radius = _footprint_radius(h, alpha=alpha)
+        overlap = _cap_overlap(sublat[0], sublong[0], radius[0], sublat[1], sublong[1], radius[1])
+        if restrict:                                        # Only the timesteps over the area of interest
+            overlap &= _area_mask(caps, sublat, sublong, h, radius, alpha=alpha)
+            restrict = False
+        periods = [[times[first], times[last]] for first, last in _overlap_periods(overlap)]
+    if restrict:
+        periods = _restrict_to_area(sat1, sat2, periods, time_accuracy, caps, alpha=alpha, backend=backend)
+    if not time_period:                                     # Return true if metadata isn't required
+        return bool(len(periods))
+    frequencies1, frequencies2 = list(sat1.get_frequencies()), list(sat2.get_frequencies())
+    indices = [(frequencies1.index(freq1), frequencies2.index(freq2)) for freq1, freq2 in freq_list]
+    for period in periods:                                  # Metadata is only built by `collision_dicts`
+        footprints = None
+        if intersection:                                    # Footprint polygons are only built when asked for
+            footprints = _intersection_footprints(sat1, sat2, period, time_accuracy, alpha=alpha, backend=backend, caps=caps)
+        collisions.append(CollisionEvent((sat1, sat2), period[0], period[1], indices, footprints=footprints))
     return collisions
 
-def detect_RF_collision_of_satellite_with_satellites(sats, main_sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None):
+def _intersection_footprints(sat1, sat2, period, time_accuracy, alpha=None, backend=None, caps=None):
+    """Computes the intersection of the footprints of both satellites every `time_accuracy` seconds of the period.
+    With an area of interest, only the timesteps over it are kept and the intersections are clipped to it.
+
+    :return: (timestamp, footprint) tuples
+    :rtype: list
+    """
+    times = _time_grid(period, time_accuracy)
+    sublat, sublong, h = propagate([sat1, sat2], times, backend=backend)
+    inside = _area_mask(caps, sublat, sublong, h, _footprint_radius(h, alpha=alpha), alpha=alpha) if caps is not None else None
+    time_fp = []
+    for step, date_time in enumerate(times):
+        if inside is not None and not inside[step]:
+            continue
+        fp1 = _footprint(sublat[0, step], sublong[0, step], h[0, step], alpha=alpha)
+        fp2 = _footprint(sublat[1, step], sublong[1, step], h[1, step], alpha=alpha)
+        footprint = compute_intersection(fp1, fp2)
+        if caps is not None and caps[3] is not None:
+            footprint = footprint.intersection(caps[3])
+            if footprint.is_empty:
+                continue
+        time_fp.append((date_time, footprint))
+    return time_fp
+
+def _attach_tracks(name, shape):
+    """Initializer of the worker processes, attaching the tracks of the satellites in shared memory.
+    """
+    global _tracks
+    memory = shared_memory.SharedMemory(name=name)
+    _tracks = (memory, np.ndarray(shape, dtype=np.float64, buffer=memory.buf))  # Keep the memory open with its array
+
+def _pair_overlap_periods(pairs):
+    """Computes the overlap periods of the pairs of satellites from the tracks in shared memory.
+
+    :param pairs: (index1, index2) tuples of the satellites in the tracks
+    :type pairs: list
+    :return: (first, last) timestep indices of the overlaps of every pair
+    :rtype: list
+    """
+    sublat, sublong, radius = _tracks[1]
+    return [_overlap_periods(_cap_overlap(sublat[i], sublong[i], radius[i], sublat[j], sublong[j], radius[j]))
+            for i, j in pairs]
+
+def _parallel_overlap_periods(sats, pairs, times, alpha=None, backend=None, workers=None):
+    """Propagates every satellite once into a shared memory buffer and computes the overlap periods of the
+    pairs in a process pool, which reads the tracks from the buffer instead of propagating again.
+
+    :param sats: List of Satellites
+    :type sats: list
+    :param pairs: (sat1, sat2) tuples
+    :type pairs: list
+    :param times: timesteps of the propagation
+    :type times: list of Python datetime objects
+    :param workers: number of worker processes, defaults to None
+    :type workers: int, optional
+    :return: [start, end] datetimes of the overlaps, keyed by pair
+    :rtype: dictionary
+    """
+    position = {sat: index for index, sat in enumerate(sats)}
+    sublat, sublong, h = propagate(sats, times, backend=backend)
+    shape = (3, len(sats), len(times))
+    memory = shared_memory.SharedMemory(create=True, size=max(1, 8*int(np.prod(shape))))
+    try:
+        tracks = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+        tracks[0], tracks[1], tracks[2] = sublat, sublong, _footprint_radius(h, alpha=alpha)
+        indices = [(position[sat1], position[sat2]) for sat1, sat2 in pairs]
+        size = max(1, math.ceil(len(indices)/(4*(workers or os.cpu_count() or 1))))   # Several blocks per worker
+        blocks = [indices[start:start + size] for start in range(0, len(indices), size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_tracks, initargs=(memory.name, shape)) as pool:
+            results = [periods for block in pool.map(_pair_overlap_periods, blocks) for periods in block]
+        del tracks                                          # Release the buffer before closing the memory
+    finally:
+        memory.close()
+        memory.unlink()
+    return {pair: [[times[first], times[last]] for first, last in periods] for pair, periods in zip(pairs, results)}
+
+def _batch_overlap_periods(main_sat, sats, times, alpha=None, backend=None, caps=None):
+    """Finds the overlaps of the footprint of the main satellite with the footprints of the satellites.
+    The satellites are propagated together in blocks of timesteps and the footprints of all of them are
+    checked against the main satellite at once.
+
+    :param main_sat: Satellite
+    :type main_sat: Instance of `Satellite`
+    :param sats: List of Satellites
+    :type sats: list
+    :param times: timesteps of the propagation
+    :type times: list of Python datetime objects
+    :param caps: caps of the area of interest, as computed by `_area_caps`, defaults to None
+    :type caps: tuple, optional
+    :return: [start, end] datetimes of the overlaps, keyed by satellite
+    :rtype: dictionary
+    """
+    overlaps = np.zeros((len(sats), len(times)), dtype=bool)
+    block = max(1, BATCH_BLOCK//((len(sats) + 1)*(len(caps[0]) if caps is not None else 1)))
+    for start in range(0, len(times) if sats else 0, block):
+        sublat, sublong, h = propagate([main_sat] + list(sats), times[start:start + block], backend=backend)
+        radius = _footprint_radius(h, alpha=alpha)
+        if caps is None:
+            overlaps[:, start:start + block] = _cap_overlap(sublat[:1], sublong[:1], radius[:1], sublat[1:], sublong[1:], radius[1:])
+            continue
+        main_reach = _area_reach(caps, sublat[0], sublong[0], radius[0])
+        near = main_reach.any(axis=0)                       # Only the timesteps where the main satellite reaches the area are checked
+        overlap = _cap_overlap(sublat[:1, near], sublong[:1, near], radius[:1, near], sublat[1:, near], sublong[1:, near], radius[1:, near])
+        overlap &= np.any(main_reach[:, None, near] & _area_reach(caps, sublat[1:, near], sublong[1:, near], radius[1:, near]), axis=0)
+        steps = np.flatnonzero(near)
+        for position in np.flatnonzero(overlap.any(axis=1)):
+            overlap[position] = _polygon_filter(caps, sublat[0, steps], sublong[0, steps], h[0, steps], sublat[position + 1, steps],
+                                                sublong[position + 1, steps], h[position + 1, steps], overlap[position], alpha=alpha)
+        overlaps[:, start + steps] = overlap
+    return {sat: [[times[first], times[last]] for first, last in _overlap_periods(overlaps[position])]
+            for position, sat in enumerate(sats)}
+
+def _one_to_many_periods(main_sat, sats, date_time_range, time_accuracy, frequency_range, alpha=None, backend=None, caps=None, adaptive=False,
+                         summaries=None):
+    """Finds the overlaps of the main satellite with every satellite with close frequencies, from the orbits
+    of the pairs when possible and by propagating them together otherwise. In adaptive mode, only the
+    overlaps known from the orbits are found, the other pairs are stepped one by one.
+
+    :return: [start, end] datetimes of the overlaps, keyed by satellite
+    :rtype: dictionary
+    """
+    sats = [sat for sat in sats if _in_freq_range(sat.get_frequencies(), main_sat.get_frequencies(), frequency_range)]
+    known = _classified_periods([main_sat] + sats, [(sat, main_sat) for sat in sats], date_time_range, time_accuracy,
+                                alpha=alpha, backend=backend, adaptive=adaptive, summaries=summaries)
+    sat_periods = {sat: known[(sat, main_sat)] for sat in sats if (sat, main_sat) in known}
+    if caps is not None:
+        sat_periods = {sat: _restrict_to_area(sat, main_sat, periods, time_accuracy, caps, alpha=alpha, backend=backend)
+                       for sat, periods in sat_periods.items()}
+    if adaptive:
+        return sat_periods
+    sat_periods.update(_batch_overlap_periods(main_sat, [sat for sat in sats if sat not in sat_periods],
+                                             _time_grid(date_time_range, time_accuracy), alpha=alpha, backend=backend, caps=caps))
+    return sat_periods
+
+def _check_all_pairs(sats, date_time_range, time_accuracy, frequency_range, alpha=None, time_period=False, intersection=False, backend=None, adaptive=False, tolerance=1, workers=None, pair_periods=None, caps=None):
+    """Checks every unordered pair of satellites once and fans the results out to every satellite.
+
+    :param sats: List of all Satellites
+    :type sats: list
+    :param workers: number of worker processes evaluating the pairs in parallel, defaults to None
+    :type workers: int, optional
+    :param pair_periods: [start, end] of the overlaps of the footprints keyed by (sat2, sat1) when already known, defaults to None
+    :type pair_periods: dictionary, optional
+    :param caps: caps of the area of interest, as computed by `_area_caps`, defaults to None
+    :type caps: tuple, optional
+    :raises ValueError: both `adaptive` and `workers` are set
+    :return: dictionary of the results of every satellite with all other satellites, keyed by satellite name
+    :rtype: dictionary
+    """
+    sats = list(sats)
+    candidate_pairs = FrequencyIndex(sats).candidate_pairs(frequency_range)     # Only these pairs have close frequencies
+    summaries = None
+    if pair_periods is None:
+        if adaptive and workers is not None and workers > 1:
+            raise ValueError("Adaptive time stepping can't run in parallel, the shared tracks use a fixed time grid")
+        # Satellites come in the order of the list, (sat2, sat1) is checked for every pair like below
+        pairs = [(sat2, sat1) for sat1, sat2 in candidate_pairs
+                 if _in_freq_range(sat1.get_frequencies(), sat2.get_frequencies(), frequency_range)]
+        involved = set(sat for pair in pairs for sat in pair)
+        involved = [sat for sat in sats if sat in involved]
+        # Orbital summaries and positions at the start of the range are computed once per satellite
+        summaries = {sat: orbital_summary(sat, alpha=alpha) for sat in involved}
+        pair_periods = _classified_periods(involved, pairs, date_time_range, time_accuracy, alpha=alpha, backend=backend,
+                                           adaptive=adaptive, summaries=summaries) if pairs else {}
+        if caps is not None:
+            pair_periods = {pair: _restrict_to_area(pair[0], pair[1], periods, time_accuracy, caps, alpha=alpha, backend=backend)
+                            for pair, periods in pair_periods.items()}
+        if workers is not None and workers > 1:
+            pairs = [pair for pair in pairs if pair not in pair_periods]
+            involved = set(sat for pair in pairs for sat in pair)
+            involved = [sat for sat in sats if sat in involved]
+            swept = _parallel_overlap_periods(involved, pairs, _time_grid(date_time_range, time_accuracy),
+                                              alpha=alpha, backend=backend, workers=workers) if pairs else {}
+            if caps is not None:
+                swept = {pair: _restrict_to_area(pair[0], pair[1], periods, time_accuracy, caps, alpha=alpha, backend=backend)
+                         for pair, periods in swept.items()}
+            pair_periods.update(swept)
+    # Sat2 is checked against Sat1 for every pair, the satellites of its collisions come in that order
+    return fan_out_pairs(sats, candidate_pairs,
+                         lambda sat1, sat2: _check_collision(sat2, sat1, date_time_range, time_accuracy, frequency_range, alpha=alpha,
+                                                             time_period=time_period, intersection=intersection, backend=backend,
+                                                             adaptive=adaptive, tolerance=tolerance,
+                                                             periods=pair_periods.get((sat2, sat1)), caps=caps, classify=False,
+                                                             summaries=summaries),
+                         time_period)
+
+def detect_RF_collision_of_satellite_with_satellites(sats, main_sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None, backend=None, adaptive=False, tolerance=1, area=None):
     """Detects if there is a collision possible between main_sat and other satellites over any region given the date_time_range and the satelitte details
 
     :param sats: List of Satellites
@@ -194,42 +712,61 @@ def detect_RF_collision_of_satellite_with_satellites(sats, main_sat, date_time_r
     :type alpha: int, optional
     :param intersection: parameter set to add footprint of the collisions to the Metadata, defaults to False
     :type intersection: bool, optional
+    :param backend: propagation backend, "sgp4" or "ephem", defaults to "sgp4" when installed
+    :type backend: str, optional
+    :param adaptive: use adaptive time steps, `time_accuracy` being the minimum step, defaults to False
+    :type adaptive: bool, optional
+    :param tolerance: precision in seconds of the start and end of the collisions in adaptive mode, defaults to 1
+    :type tolerance: float, optional
+    :param area: only report the collisions over this area, a GeoJSON polygon or a list of Ground Stations, defaults to None
+    :type area: dictionary/list, optional
     :return: list boolean values of collisions between satellites
     :rtype: list
     """
+    candidates = FrequencyIndex(sats).query(main_sat, frequency_range)          # Only these satellites have close frequencies
+    caps = _area_caps(area) if area is not None else None
+    summaries = {sat: orbital_summary(sat, alpha=alpha) for sat in [main_sat] + candidates}   # Once per satellite, not per pair
+    sat_periods = _one_to_many_periods(main_sat, candidates, date_time_range, time_accuracy, frequency_range,
+                                       alpha=alpha, backend=backend, caps=caps, adaptive=adaptive, summaries=summaries)
     res = []
     for sat in sats:
-        res.append(_check_collision(sat, main_sat, date_time_range, time_accuracy, frequency_range, alpha=alpha, time_period=False, intersection=False))
+        if sat not in candidates:
+            res.append(False)
+            continue
+        res.append(_check_collision(sat, main_sat, date_time_range, time_accuracy, frequency_range, alpha=alpha, time_period=False, intersection=False, backend=backend, adaptive=adaptive, tolerance=tolerance,
+                                    periods=sat_periods.get(sat), caps=caps, classify=False, summaries=summaries))
     return res
 
-def detect_RF_collision_of_satellites(sats, date_time_range, time_accuracy, frequency_range=30000, alpha=None):
+def detect_RF_collision_of_satellites(sats, date_time_range, time_accuracy, frequency_range=30000, alpha=None, backend=None, adaptive=False, tolerance=1, workers=None, area=None):
     """Detects the collision possible between every sat with all other satellites over any region given the date_time_range and the satelitte details
 
     :param sats: List of all Satellites
     :type sats: list
+    :param workers: number of worker processes evaluating the pairs, every satellite being propagated once, defaults to None
+    :type workers: int, optional
+    :param area: only report the collisions over this area, a GeoJSON polygon or a list of Ground Stations, defaults to None
+    :type area: dictionary/list, optional
     """
-    all_collisions = {}
-    for main_sat in sats:
-        sat_list = []
-        for sat in sats:
-            if sat != main_sat:
-                sat_list.append(sat)
-        res = detect_RF_collision_of_satellite_with_satellites(sat_list, main_sat, date_time_range, time_accuracy, frequency_range=frequency_range, alpha=alpha)
-        all_collisions[main_sat.get_name()] = res
-    return all_collisions
-
-def detect_RF_collision_of_satellites_with_all_satellites(sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None):
+    return _check_all_pairs(sats, date_time_range, time_accuracy, frequency_range, alpha=alpha, backend=backend, adaptive=adaptive, tolerance=tolerance, workers=workers,
+                            caps=_area_caps(area) if area is not None else None)
+
+def detect_RF_collision_of_satellites_with_all_satellites(sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None, backend=None, adaptive=False, tolerance=1, registry=None, area=None):
     """Detects collisions of one satellite with all the other satellites in the Network.
 
     :param sat: The one satellite we desire to compare with
     :type sat: Satellite instance
-
+    :param registry: registry of all the satellites, defaults to the shared one
+    :type registry: Instance of `SatelliteRegistry`, optional
+    :param area: only report the collisions over this area, a GeoJSON polygon or a list of Ground Stations, defaults to None
+    :type area: dictionary/list, optional
+    :return: list boolean values of collisions with the satellites of the registry
+    :rtype: list
     """
-    if not len(all_sats):
-        _get_all_satellite()
-    return detect_RF_collision_of_satellite_with_satellites(all_sats, sat, date_time_range, time_accuracy, frequency_range=frequency_range, alpha=alpha)
+    if registry is None:
+        registry = get_registry()
+    return detect_RF_collision_of_satellite_with_satellites(registry.satellites(), sat, date_time_range, time_accuracy, frequency_range=frequency_range, alpha=alpha, backend=backend, adaptive=adaptive, tolerance=tolerance, area=area)
 
-def compute_RF_collision_of_satellite_with_satellites(sats, main_sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None, intersection=False):
+def compute_RF_collision_of_satellite_with_satellites(sats, main_sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None, intersection=False, backend=None, adaptive=False, tolerance=1, area=None):
     """Computes the collision possible between main_sat and other satellites over any region given the date_time_range and the satelitte details
 
     :param sats: List of Satellites
@@ -246,37 +783,135 @@ def compute_RF_collision_of_satellite_with_satellites(sats, main_sat, date_time_
     :type alpha: int, optional
     :param intersection: parameter set to add footprint of the collisions to the Metadata, defaults to False
     :type intersection: bool, optional
+    :param backend: propagation backend, "sgp4" or "ephem", defaults to "sgp4" when installed
+    :type backend: str, optional
+    :param adaptive: use adaptive time steps, `time_accuracy` being the minimum step, defaults to False
+    :type adaptive: bool, optional
+    :param tolerance: precision in seconds of the start and end of the collisions in adaptive mode, defaults to 1
+    :type tolerance: float, optional
+    :param area: only report the collisions over this area, a GeoJSON polygon or a list of Ground Stations, defaults to None
+    :type area: dictionary/list, optional
     :return: Array of collisions containing the metadate of each collision along with it
     :rtype: list
     """
+    candidates = FrequencyIndex(sats).query(main_sat, frequency_range)          # Only these satellites have close frequencies
+    caps = _area_caps(area) if area is not None else None
+    summaries = {sat: orbital_summary(sat, alpha=alpha) for sat in [main_sat] + candidates}   # Once per satellite, not per pair
+    sat_periods = _one_to_many_periods(main_sat, candidates, date_time_range, time_accuracy, frequency_range,
+                                       alpha=alpha, backend=backend, caps=caps, adaptive=adaptive, summaries=summaries)
     res = []
     for sat in sats:
-        res.append(_check_collision(sat, main_sat, date_time_range, time_accuracy, frequency_range, alpha=alpha, time_period=True, intersection=intersection))
-    return res
+        if sat not in candidates:
+            res.append([])
+            continue
+        res.append(_check_collision(sat, main_sat, date_time_range, time_accuracy, frequency_range, alpha=alpha, time_period=True, intersection=intersection, backend=backend, adaptive=adaptive, tolerance=tolerance,
+                                    periods=sat_periods.get(sat), caps=caps, classify=False, summaries=summaries))
+    return collision_dicts(res)
 
-def compute_RF_collision_of_satellites(sats, date_time_range, time_accuracy, frequency_range=30000, alpha=None, intersection=False):
+def compute_RF_collision_of_satellites(sats, date_time_range, time_accuracy, frequency_range=30000, alpha=None, intersection=False, backend=None, adaptive=False, tolerance=1, workers=None, area=None):
     """Computes the collision possible between every sat with all other satellites over any region given the date_time_range and the satelitte details
 
     :param sats: List of all Satellites
     :type sats: list
+    :param workers: number of worker processes evaluating the pairs, every satellite being propagated once, defaults to None
+    :type workers: int, optional
+    :param area: only report the collisions over this area, a GeoJSON polygon or a list of Ground Stations, defaults to None
+    :type area: dictionary/list, optional
     """
-    all_collisions = {}
-    for main_sat in sats:
-        sat_list = []
-        for sat in sats:
-            if sat != main_sat:
-                sat_list.append(sat)
-        res = compute_RF_collision_of_satellite_with_satellites(sat_list, main_sat, date_time_range, time_accuracy, frequency_range=frequency_range, alpha=alpha, intersection=intersection)
-        all_collisions[main_sat.get_name()] = res
-    return all_collisions
+    return collision_dicts(_check_all_pairs(sats, date_time_range, time_accuracy, frequency_range, alpha=alpha, time_period=True, intersection=intersection, backend=backend, adaptive=adaptive, tolerance=tolerance, workers=workers,
+                                            caps=_area_caps(area) if area is not None else None))
     
-def compute_RF_collision_of_satellite_with_all_satellites(sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None, intersection=False):
+def compute_RF_collision_of_satellites_with_all_satellites(sat, date_time_range, time_accuracy, frequency_range=30000, alpha=None, intersection=False, backend=None, adaptive=False, tolerance=1, registry=None, area=None):
     """Computes collisions of one satellite with all the other satellites in the Network.
 
     :param sat: The one satellite we desire to compare with
     :type sat: Satellite instance
+    :param registry: registry of all the satellites, defaults to the shared one
+    :type registry: Instance of `SatelliteRegistry`, optional
+    :param area: only report the collisions over this area, a GeoJSON polygon or a list of Ground Stations, defaults to None
+    :type area: dictionary/list, optional
+    :return: Array of collisions with the satellites of the registry
+    :rtype: list
+    """
+    if registry is None:
+        registry = get_registry()
+    return compute_RF_collision_of_satellite_with_satellites(registry.satellites(), sat, date_time_range, time_accuracy, frequency_range=frequency_range, alpha=alpha, intersection=intersection, backend=backend, adaptive=adaptive, tolerance=tolerance, area=area)
 
+def iter_RF_collisions(sats, date_time_range, time_accuracy, frequency_range=30000, alpha=None, main_sat=None, backend=None, window=datetime.timedelta(hours=1)):
+    """Yields the collisions between every pair of satellites, or between main_sat and the other satellites,
+    as they are found. The time range is processed one window at a time, so only the tracks of one window
+    and the collisions still ongoing are held in memory. Collisions are yielded as soon as they end, hence
+    in the order of their end time.
+
+    :param sats: List of Satellites
+    :type sats: list
+    :param date_time_range: User defined date-time range
+    :type date_time_range: datetime
+    :param time_accuracy: incrments of the time parameter in the given range to check for collisions in seconds
+    :type time_accuracy: int
+    :param frequency_range: Frequency in Hz, defaults to 30000
+    :type frequency_range: int, optional
+    :param alpha: half angle given by user in degrees, defaults to None
+    :type alpha: int, optional
+    :param main_sat: only yield the collisions of this satellite, defaults to None
+    :type main_sat: Instance of `Satellite`, optional
+    :param backend: propagation backend, "sgp4" or "ephem", defaults to "sgp4" when installed
+    :type backend: str, optional
+    :param window: duration of the time range propagated at once, defaults to one hour
+    :type window: datetime.timedelta, optional
+    :return: collision events, whose `to_dict` returns the metadata of `compute_RF_collision_of_satellites`
+    :rtype: generator of `CollisionEvent`s
+    :raises ValueError: the window isn't positive
+    """
+    if window <= datetime.timedelta(0):
+        raise ValueError("The window must be a positive duration, got {}".format(window))
+    return _iter_RF_collisions(sats, date_time_range, time_accuracy, frequency_range, alpha, main_sat, backend, window)
+
+def _iter_RF_collisions(sats, date_time_range, time_accuracy, frequency_range, alpha, main_sat, backend, window):
+    """Generator of `iter_RF_collisions`, run once its arguments are validated.
     """
-    if not len(all_sats):
-        _get_all_satellite()
-    return compute_RF_collision_of_satellite_with_satellites(all_sats, sat, date_time_range, time_accuracy, frequency_range=frequency_range, alpha=alpha, intersection=intersection)
+    sats = list(sats)
+    index = FrequencyIndex(sats)
+    if main_sat is None:
+        pairs = [(sat2, sat1) for sat1, sat2 in index.candidate_pairs(frequency_range)]
+    else:
+        pairs = [(sat, main_sat) for sat in index.query(main_sat, frequency_range)]
+    freq_lists = {}                                         # Frequencies of the pairs in range of each other
+    for sat1, sat2 in pairs:
+        freq_list = _in_freq_range(sat1.get_frequencies(), sat2.get_frequencies(), frequency_range)
+        if freq_list:
+            freq_lists[(sat1, sat2)] = freq_list
+    pairs = [pair for pair in pairs if pair in freq_lists]
+    involved = set(sat for pair in pairs for sat in pair)
+    involved = [sat for sat in dict.fromkeys(([main_sat] if main_sat is not None else []) + sats) if sat in involved]
+    position = {sat: row for row, sat in enumerate(involved)}
+    backend = get_backend(backend)
+
+    steps = max(1, int(window.total_seconds() // time_accuracy))   # Timesteps of every window
+    step = datetime.timedelta(seconds=time_accuracy)
+    open_periods = {}                                       # Start and last timestep of the ongoing collisions
+    low = date_time_range[0]
+    while pairs and low <= date_time_range[1]:
+        times = _time_grid([low, min(low + (steps - 1)*step, date_time_range[1])], time_accuracy)
+        sublat, sublong, h = backend.propagate(involved, times)    # Tracks of the window aren't kept in the cache
+        radius = _footprint_radius(h, alpha=alpha)
+        ended = []
+        for pair in pairs:
+            i, j = position[pair[0]], position[pair[1]]
+            overlap = _cap_overlap(sublat[i], sublong[i], radius[i], sublat[j], sublong[j], radius[j])
+            if pair in open_periods and not overlap[0]:     # The collision ended with the previous window
+                start, end = open_periods.pop(pair)
+                ended.append((end, start, pair))
+            for first, last in _overlap_periods(overlap):
+                start = times[first]
+                if first == 0 and pair in open_periods:     # Continues the collision of the previous window
+                    start = open_periods.pop(pair)[0]
+                if last == len(times) - 1:
+                    open_periods[pair] = [start, times[last]]
+                else:
+                    ended.append((times[last], start, pair))
+        for end, start, pair in sorted(ended, key=lambda elem: (elem[0], elem[1])):
+            yield CollisionEvent.from_frequencies(pair[0], pair[1], freq_lists[pair], start, end)
+        low = times[-1] + step
+    for pair, (start, end) in sorted(open_periods.items(), key=lambda elem: elem[1][1]):
+        yield CollisionEvent.from_frequencies(pair[0], pair[1], freq_lists[pair], start, end)
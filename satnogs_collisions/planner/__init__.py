@@ -0,0 +1,5 @@
+from .planner import IncrementalPlanner
+
+__all__ = [
+    'IncrementalPlanner'
+]
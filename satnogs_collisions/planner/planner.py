@@ -0,0 +1,341 @@
+import datetime
+import json
+import math
+import ephem
+import numpy as np
+from satnogs_collisions.GSS import gss
+from satnogs_collisions.only_sat import sat_intersection
+from satnogs_collisions.satellite.frequency_index import FrequencyIndex
+from satnogs_collisions.event import collision_dicts
+from satnogs_collisions.propagation import get_backend, get_cache, propagate
+
+EPOCH = datetime.datetime(1970, 1, 1)                   # Time slices are aligned to the Unix epoch
+
+def _station_key(ground_station):
+    return (ground_station.get_id(), tuple(ground_station.get_coordinates()), ground_station.get_elevation())
+
+def _contiguous(starts, slice_length):
+    """Groups the starts of the time slices into runs of consecutive slices.
+    """
+    runs = []
+    for start in starts:
+        if runs and start - runs[-1][-1] == slice_length:
+            runs[-1].append(start)
+        else:
+            runs.append([start])
+    return runs
+
+def _clip_pass(sat_pass, low, high):
+    """Clips a pass and its Doppler profile to [low, high], interpolating the profile at the bounds.
+
+    :param sat_pass: pass, as computed by `_compute_passes`
+    :type sat_pass: tuple
+    :param low: start of the clipped pass
+    :type low: ephem.Date instance
+    :param high: end of the clipped pass
+    :type high: ephem.Date instance
+    :return: clipped pass
+    :rtype: tuple
+    """
+    sample_times = sat_pass[3][0]
+    times = np.concatenate([[float(low)], sample_times[(sample_times > low) & (sample_times < high)], [float(high)]])
+    tracks = gss._interpolate_tracks(sat_pass[3], times)
+    freq_low_high = {freq: [float(track.min()), float(track.max())] for freq, track in zip(sat_pass[2], tracks)}
+    return (ephem.Date(low), ephem.Date(high), freq_low_high, (times, tracks))
+
+def _join_passes(pass1, pass2):
+    """Joins two clipped pieces of a pass, the second one starting where the first one ends.
+    """
+    times = np.concatenate([pass1[3][0], pass2[3][0][1:]])
+    tracks = np.concatenate([pass1[3][1], pass2[3][1][:, 1:]], axis=1)
+    freq_low_high = {freq: [min(low_high[0], pass2[2][freq][0]), max(low_high[1], pass2[2][freq][1])]
+                     for freq, low_high in pass1[2].items()}
+    return (pass1[0], pass2[1], freq_low_high, (times, tracks))
+
+def _encode_pass(sat_pass):
+    rise_time, set_time, freq_low_high, (times, tracks) = sat_pass
+    return [float(rise_time), float(set_time), [[freq] + low_high for freq, low_high in freq_low_high.items()],
+            times.tolist(), tracks.tolist()]
+
+def _decode_pass(value):
+    rise_time, set_time, freq_low_high, times, tracks = value
+    tracks = np.array(tracks, dtype=float).reshape(len(freq_low_high), len(times))
+    return (ephem.Date(rise_time), ephem.Date(set_time), {elem[0]: elem[1:] for elem in freq_low_high},
+            (np.array(times, dtype=float), tracks))
+
+def _splice(slices, step, date_time_range):
+    """Joins the overlap periods of consecutive time slices, merging the periods that continue over
+    the end of a slice, and clips them to the time range.
+
+    :param slices: [start, end] of the overlaps of every slice, in the order of the slices
+    :type slices: list
+    :param step: time between two timesteps
+    :type step: datetime.timedelta
+    :return: [start, end] of the overlaps inside the time range
+    :rtype: list
+    """
+    periods = []
+    for slice_periods in slices:
+        for first, last in slice_periods:
+            if periods and first - periods[-1][1] <= step:      # Only happens at the start of a slice
+                periods[-1][1] = last
+            else:
+                periods.append([first, last])
+    return [[max(first, date_time_range[0]), min(last, date_time_range[1])] for first, last in periods
+            if last >= date_time_range[0] and first <= date_time_range[1]]
+
+class IncrementalPlanner:
+    """Keeps the passes over the ground stations and the footprint overlaps of the pairs of satellites
+    computed by previous runs, keyed by TLE and time slice. Rerunning the checks after new TLEs are published,
+    or over a time window sliding forward, only computes the satellites whose TLE changed and the new time
+    slices, the rest is spliced in from the stored results.
+
+    The timesteps of the footprint overlaps are aligned to the time slices, so `time_accuracy` should divide
+    `slice_length`.
+
+    :param slice_length: duration of the time slices the results are stored by, defaults to one hour
+    :type slice_length: datetime.timedelta, optional
+    :param alpha: half angle given by user in degrees, defaults to None
+    :type alpha: int, optional
+    :param backend: propagation backend of the footprints, see `get_backend`, defaults to None
+    :type backend: str, optional
+    """
+    def __init__(self, slice_length=datetime.timedelta(hours=1), alpha=None, backend=None):
+        """Constructor method
+        """
+        self.slice_length = slice_length
+        self.alpha = alpha
+        self.backend = backend
+        self._passes = {}                                   # Keyed by (ground station, TLE, frequencies, slice start)
+        self._periods = {}                                  # Keyed by (TLE1, TLE2, time accuracy, slice start, backend)
+        self.computed = {"passes": 0, "periods": 0}         # Number of slices computed rather than reused
+
+    def _slices(self, date_time_range):
+        """Returns the start of every time slice intersecting the time range.
+        """
+        start = EPOCH + ((date_time_range[0] - EPOCH) // self.slice_length) * self.slice_length
+        starts = []
+        while start <= date_time_range[1]:
+            starts.append(start)
+            start += self.slice_length
+        return starts
+
+    def _pass_key(self, ground_station, sat, start):
+        return (_station_key(ground_station), tuple(sat.get_tle()), tuple(sat.get_frequencies()), start)
+
+    def _compute_slices(self, observer, sat, starts):
+        """Computes the passes of the satellite rising in each of the consecutive time slices, with one
+        `_compute_passes` call over all of them. A satellite that never sets over the slices has one pass
+        per slice, clipped to the slice.
+
+        :return: passes keyed by slice start
+        :rtype: dictionary
+        """
+        low, high = ephem.Date(starts[0]), ephem.Date(starts[-1] + self.slice_length)
+        body = get_cache().body(sat.get_tle())
+        passes = gss._compute_passes(observer, body, sat.get_frequencies(), [starts[0], starts[-1] + self.slice_length],
+                                     satellite=sat)
+        slices = {start: [] for start in starts}
+        # `_compute_passes` reports a satellite that never sets as one pass from an hour before the range to its end
+        if len(passes) == 1 and passes[0][0] == ephem.Date(low - ephem.hour) and passes[0][1] == high:
+            for start in starts:
+                slices[start].append(_clip_pass(passes[0], ephem.Date(start), ephem.Date(start + self.slice_length)))
+            return slices
+        length = self.slice_length.total_seconds()/86400
+        for sat_pass in passes:                             # Passes rising before the slices belong to earlier slices
+            position = math.floor((sat_pass[0] - low)/length)
+            if 0 <= position < len(starts):
+                slices[starts[position]].append(sat_pass)
+        return slices
+
+    def pass_table(self, ground_station, satellites, date_time_range):
+        """Returns the passes of every satellite over the Ground Station that can intersect the time range,
+        like `_compute_pass_table`, computing only the time slices that aren't stored yet. The missing
+        slices of a satellite are computed together, one run of consecutive slices at a time.
+
+        :param ground_station: Ground Station
+        :type ground_station: Instance of `GroundStation`
+        :param satellites: List of Satellites
+        :type satellites: list
+        :param date_time_range: User defined date-time range
+        :type date_time_range: datetime
+        :return: dictionary of passes keyed by `Satellite`
+        :rtype: dictionary
+        """
+        e_low = ephem.Date(ephem.Date(date_time_range[0]) - ephem.hour)   # Passes starting slightly before the range, like `_compute_passes`
+        e_high = ephem.Date(date_time_range[1])
+        starts = self._slices([e_low.datetime(), date_time_range[1]])
+        observer = gss._create_observer(ground_station)
+        pass_table = {}
+        for sat in satellites:
+            if sat in pass_table:
+                continue
+            missing = [start for start in starts if self._pass_key(ground_station, sat, start) not in self._passes]
+            for run in _contiguous(missing, self.slice_length):
+                for start, passes in self._compute_slices(observer, sat, run).items():
+                    self._passes[self._pass_key(ground_station, sat, start)] = passes
+                self.computed["passes"] += len(run)
+            passes = []
+            for start in starts:
+                for sat_pass in self._passes[self._pass_key(ground_station, sat, start)]:
+                    if passes and passes[-1][1] == sat_pass[0]:     # Pieces of the pass of a satellite that never sets
+                        passes[-1] = _join_passes(passes[-1], sat_pass)
+                    else:
+                        passes.append(sat_pass)
+            # A pass covering the whole range is clipped to it, like `_compute_passes` does
+            pass_table[sat] = [_clip_pass(sat_pass, e_low, e_high) if sat_pass[0] < e_low and sat_pass[1] >= e_high else sat_pass
+                               for sat_pass in passes if e_low <= sat_pass[0] <= e_high or sat_pass[0] < e_low and sat_pass[1] >= e_high]
+        return pass_table
+
+    def compute_RF_collision_of_satellites_over_groundstation(self, ground_station, satellites, date_time_range,
+                                                              frequency_range=30000, time_resolved=False):
+        """Computes the RF collisions that every pair of satellites will have with each other over the
+        ground station, like `compute_RF_collision_of_satellites_over_groundstation`.
+
+        :param ground_station: Ground Station
+        :type ground_station: Instance of `GroundStation`
+        :param satellites: List of Satellites
+        :type satellites: list
+        :param date_time_range: User defined date-time range
+        :type date_time_range: datetime
+        :param frequency_range: Frequency in Hz, defaults to 30000
+        :type frequency_range: int, optional
+        :param time_resolved: only report the sub-intervals where the Doppler shifted frequencies are in range, defaults to False
+        :type time_resolved: bool, optional
+        :return: ditcionary contaning all collisions
+        :rtype: dictionary
+        """
+        satellites = list(satellites)
+        candidate_pairs, candidates = gss._candidates(satellites, frequency_range)
+        overlaps = gss._find_overlapping_passes(self.pass_table(ground_station, candidates, date_time_range))
+        return collision_dicts(gss._pair_collisions(ground_station, satellites, candidate_pairs, date_time_range, frequency_range,
+                                                    True, overlaps, time_resolved))
+
+    def compute_RF_collision_of_satellites_over_groundstations(self, ground_stations, satellites, date_time_range,
+                                                               frequency_range=30000, time_resolved=False):
+        """Computes the RF collisions that every pair of satellites will have with each other over every
+        ground station, like `compute_RF_collision_of_satellites_over_groundstations`.
+
+        :param ground_stations: List of `GroundStation`s
+        :type ground_stations: list
+        :return: ditcionary contaning all collisions
+        :rtype: dictionary
+        """
+        satellites = list(satellites)
+        return {id: self.compute_RF_collision_of_satellites_over_groundstation(ground_station, satellites, date_time_range,
+                        frequency_range=frequency_range, time_resolved=time_resolved)
+                for id, ground_station in enumerate(ground_stations, 1)}
+
+    def _slice_periods(self, pairs, start, time_accuracy):
+        """Returns the footprint overlaps of every pair in the time slice. The satellites of the pairs
+        that aren't stored yet are propagated at once.
+        """
+        backend = get_backend(self.backend)
+        name = getattr(backend, "name", type(backend).__name__)     # Backends don't propagate exactly alike
+        keys = {pair: (tuple(pair[0].get_tle()), tuple(pair[1].get_tle()), time_accuracy, start, name) for pair in pairs}
+        missing = [pair for pair in pairs if keys[pair] not in self._periods]
+        if missing:
+            end = start + self.slice_length
+            times = [time for time in sat_intersection._time_grid([start, end], time_accuracy) if time < end]
+            sats = list(dict.fromkeys(sat for pair in missing for sat in pair))
+            index = {sat: position for position, sat in enumerate(sats)}
+            sublat, sublong, h = propagate(sats, times, backend=backend)
+            radius = sat_intersection._footprint_radius(h, alpha=self.alpha)
+            for sat1, sat2 in missing:
+                i, j = index[sat1], index[sat2]
+                overlap = sat_intersection._cap_overlap(sublat[i], sublong[i], radius[i], sublat[j], sublong[j], radius[j])
+                self._periods[keys[(sat1, sat2)]] = [[times[first], times[last]]
+                                                     for first, last in sat_intersection._overlap_periods(overlap)]
+            self.computed["periods"] += len(missing)
+        return {pair: self._periods[keys[pair]] for pair in pairs}
+
+    def compute_RF_collision_of_satellites(self, sats, date_time_range, time_accuracy, frequency_range=30000, intersection=False):
+        """Computes the RF collisions that every pair of satellites will have with each other, like
+        `compute_RF_collision_of_satellites`.
+
+        :param sats: List of all Satellites
+        :type sats: list
+        :param date_time_range: desired date and time range
+        :type date_time_range: Python datetime object
+        :param time_accuracy: incrments of the time parameter in the given range to check for collisions in seconds
+        :type time_accuracy: int
+        :param frequency_range: frequency in Hz, defaults to 30000
+        :type frequency_range: int, optional
+        :param intersection: parameter set to add footprint of the collisions to the Metadata, defaults to False
+        :type intersection: bool, optional
+        :return: dictionary of the collisions of every satellite with all other satellites, keyed by satellite name
+        :rtype: dictionary
+        """
+        sats = list(sats)
+        pairs = [(sat1, sat2) for sat1, sat2 in FrequencyIndex(sats).candidate_pairs(frequency_range)
+                 if sat_intersection._in_freq_range(sat1.get_frequencies(), sat2.get_frequencies(), frequency_range)]
+        slices = [self._slice_periods(pairs, start, time_accuracy) for start in self._slices(date_time_range)]
+        pair_periods = {}
+        for pair in pairs:
+            periods = _splice([slice_periods[pair] for slice_periods in slices], datetime.timedelta(seconds=time_accuracy),
+                              date_time_range)
+            pair_periods[pair] = pair_periods[pair[::-1]] = periods
+        return collision_dicts(sat_intersection._check_all_pairs(sats, date_time_range, time_accuracy, frequency_range,
+                                                                 alpha=self.alpha, time_period=True, intersection=intersection,
+                                                                 backend=self.backend, pair_periods=pair_periods))
+
+    def prune(self, before=None, satellites=None):
+        """Drops the stored results that can't be reused anymore.
+
+        :param before: drop the time slices ending before this time, defaults to None
+        :type before: Python datetime object, optional
+        :param satellites: drop the results of the TLEs of any other satellites, defaults to None
+        :type satellites: list, optional
+        """
+        tles = set(tuple(sat.get_tle()) for sat in satellites) if satellites is not None else None
+        def _keep(start, *key_tles):
+            if before is not None and start + self.slice_length <= before:
+                return False
+            return tles is None or all(tle in tles for tle in key_tles)
+        self._passes = {key: value for key, value in self._passes.items() if _keep(key[3], key[1])}
+        self._periods = {key: value for key, value in self._periods.items() if _keep(key[3], key[0], key[1])}
+
+    def clear(self):
+        self._passes.clear()
+        self._periods.clear()
+
+    def save(self, path):
+        """Saves the stored results to a JSON file, to reuse them in a later run.
+
+        :param path: path of the file
+        :type path: str
+        """
+        passes = [{"station": [station[0], list(station[1]), station[2]], "tle": list(tle), "frequencies": list(frequencies),
+                   "start": start.isoformat(), "passes": [_encode_pass(sat_pass) for sat_pass in value]}
+                  for (station, tle, frequencies, start), value in self._passes.items()]
+        periods = [{"tles": [list(tle1), list(tle2)], "time_accuracy": time_accuracy, "start": start.isoformat(),
+                    "backend": backend, "periods": [[first.isoformat(), last.isoformat()] for first, last in value]}
+                   for (tle1, tle2, time_accuracy, start, backend), value in self._periods.items()]
+        with open(path, "w") as state_file:
+            json.dump({"slice_length": self.slice_length.total_seconds(), "alpha": self.alpha, "passes": passes,
+                       "periods": periods}, state_file)
+
+    @classmethod
+    def load(cls, path, backend=None):
+        """Loads a planner saved by `save`. The overlaps stored by an other propagation backend aren't reused.
+
+        :param path: path of the file
+        :type path: str
+        :param backend: propagation backend of the footprints, see `get_backend`, defaults to None
+        :type backend: str, optional
+        :return: planner
+        :rtype: Instance of `IncrementalPlanner`
+        """
+        with open(path) as state_file:
+            state = json.load(state_file)
+        planner = cls(slice_length=datetime.timedelta(seconds=state["slice_length"]), alpha=state["alpha"], backend=backend)
+        for elem in state["passes"]:
+            station = (elem["station"][0], tuple(elem["station"][1]), elem["station"][2])
+            key = (station, tuple(elem["tle"]), tuple(elem["frequencies"]), datetime.datetime.fromisoformat(elem["start"]))
+            planner._passes[key] = [_decode_pass(value) for value in elem["passes"]]
+        for elem in state["periods"]:
+            key = (tuple(elem["tles"][0]), tuple(elem["tles"][1]), elem["time_accuracy"],
+                   datetime.datetime.fromisoformat(elem["start"]), elem["backend"])
+            planner._periods[key] = [[datetime.datetime.fromisoformat(first), datetime.datetime.fromisoformat(last)]
+                                     for first, last in elem["periods"]]
+        return planner
@@ -0,0 +1,12 @@
+from .propagation import EphemBackend, SGP4Backend, get_backend, propagate
+from .cache import EphemerisCache, LRUCache, get_cache
+
+__all__ = [
+    'EphemBackend',
+    'SGP4Backend',
+    'get_backend',
+    'propagate',
+    'EphemerisCache',
+    'LRUCache',
+    'get_cache'
+]
@@ -0,0 +1,147 @@
+import threading
+from collections import OrderedDict
+import ephem
+import numpy as np
+
+try:
+    from sgp4.api import Satrec
+except ImportError:                                     # sgp4 is an optional dependency
+    Satrec = None
+
+class LRUCache:
+    """Least recently used cache holding at most `maxsize` units, every entry weighing `size` units.
+
+    :param maxsize: total size of the entries kept in the cache
+    :type maxsize: int
+    """
+    def __init__(self, maxsize):
+        """Constructor method
+        """
+        self.maxsize = maxsize
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Returns the entry of the key and marks it as the most recently used one.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key, value, size=1):
+        """Adds the entry and evicts the least recently used ones until the cache fits in `maxsize`.
+        Entries larger than `maxsize` aren't kept.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            if size > self.maxsize:
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.maxsize:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+class EphemerisCache:
+    """Cache of the parsed ephem bodies and SGP4 records of the satellites, keyed by TLE, and of their
+    propagated positions, keyed by backend, TLE and timestep grid. All are evicted least recently used first.
+
+    :param max_bodies: number of parsed bodies, and of parsed SGP4 records, kept, defaults to 1024
+    :type max_bodies: int, optional
+    :param max_timesteps: total number of timesteps of the positions kept, defaults to 2000000
+    :type max_timesteps: int, optional
+    """
+    def __init__(self, max_bodies=1024, max_timesteps=2000000):
+        """Constructor method
+        """
+        self.bodies = LRUCache(max_bodies)
+        self.satrecs = LRUCache(max_bodies)
+        self.positions = LRUCache(max_timesteps)
+
+    def body(self, tle):
+        """Returns the ephem body of the TLE, parsing it only the first time.
+
+        :param tle: Two line element set
+        :type tle: list
+        :return: ephem body, shared by every caller, so `compute` it before reading it
+        :rtype: Instance of ephem EarthSatellite
+        """
+        key = tuple(tle)
+        body = self.bodies.get(key)
+        if body is None:
+            body = ephem.readtle(*tle)
+            self.bodies.put(key, body)
+        return body
+
+    def satrec(self, tle):
+        """Returns the SGP4 record of the TLE, parsing it only the first time.
+
+        :param tle: Two line element set
+        :type tle: list
+        :return: SGP4 record, shared by every caller
+        :rtype: Instance of sgp4 Satrec
+        :raises ImportError: `sgp4` isn't installed
+        """
+        if Satrec is None:
+            raise ImportError("The 'sgp4' package is required to parse SGP4 records")
+        key = (tle[1], tle[2])                          # The title doesn't change the record
+        satrec = self.satrecs.get(key)
+        if satrec is None:
+            satrec = Satrec.twoline2rv(tle[1], tle[2])
+            self.satrecs.put(key, satrec)
+        return satrec
+
+    def propagate(self, backend, satellites, times):
+        """Computes the sub-satellite points and altitudes of the satellites with the backend, propagating
+        only the satellites whose positions over these timesteps aren't cached yet.
+
+        :param backend: propagation backend, positions are only cached for backends with a `name`
+        :type backend: Instance of `SGP4Backend` or `EphemBackend`
+        :param satellites: List of Satellites
+        :type satellites: list
+        :param times: timesteps of the propagation
+        :type times: list of Python datetime objects
+        :return: latitudes and longitudes in radians and altitudes in m, each shaped (satellites, timesteps)
+        :rtype: tuple of numpy arrays
+        """
+        name = getattr(backend, "name", None)
+        if name is None or not len(satellites) or not len(times):
+            return backend.propagate(satellites, times)
+        grid = tuple(times)
+        keys = [(name, tuple(sat.get_tle()), grid) for sat in satellites]
+        tracks = [self.positions.get(key) for key in keys]
+        missing = [index for index, track in enumerate(tracks) if track is None]
+        if missing:                                         # Propagate every missing satellite at once
+            computed = backend.propagate([satellites[index] for index in missing], times)
+            for row, index in enumerate(missing):
+                tracks[index] = np.stack([computed[0][row], computed[1][row], computed[2][row]])
+                self.positions.put(keys[index], tracks[index], size=len(times))
+        stacked = np.stack(tracks, axis=1)                  # Shaped (3, satellites, timesteps)
+        return stacked[0], stacked[1], stacked[2]
+
+    def clear(self):
+        self.bodies.clear()
+        self.satrecs.clear()
+        self.positions.clear()
+
+_cache = EphemerisCache()
+
+def get_cache():
+    """Returns the ephemeris cache shared by the `only_sat` and `GSS` modules.
+
+    :return: Ephemeris cache
+    :rtype: Instance of `EphemerisCache`
+    """
+    return _cache
@@ -0,0 +1,202 @@
+import numpy as np
+from .cache import get_cache
+
+try:
+    from sgp4.api import Satrec, SatrecArray
+except ImportError:                                     # sgp4 is an optional dependency
+    Satrec = None
+    SatrecArray = None
+
+A = 6378137.0                                           # WGS84 equatorial radius in m
+F = 1 / 298.257223563                                   # WGS84 flattening
+E2 = F * (2 - F)                                        # WGS84 first eccentricity squared
+UNIX_EPOCH_JD = 2440587.5                               # Julian date of 1970-01-01 00:00 UTC
+OMEGA_E = 7.292115e-5                                   # Earth rotation rate in rad/s
+
+def _julian_dates(times):
+    """Converts the datetimes to Julian dates split in a whole and a fractional part.
+
+    :param times: timesteps of the propagation
+    :type times: list of Python datetime objects
+    :return: whole and fractional parts of the Julian dates
+    :rtype: tuple of numpy arrays
+    """
+    seconds = np.array(times, dtype="datetime64[us]").astype("int64") / 1e6     # Seconds since the Unix epoch
+    days = seconds / 86400.0
+    whole = np.floor(days)
+    return UNIX_EPOCH_JD + whole, days - whole
+
+def _gmst(jd, fr):
+    """Computes the Greenwich Mean Sidereal Time (IAU 1982) in radians.
+    """
+    t = ((jd - 2451545.0) + fr) / 36525.0
+    gmst = (67310.54841 + (876600.0 * 3600.0 + 8640184.812866) * t + 0.093104 * t ** 2 - 6.2e-6 * t ** 3)
+    return np.mod(np.radians(gmst / 240.0), 2 * np.pi)
+
+def _teme_to_subpoint(r, jd, fr):
+    """Converts TEME positions to sub-satellite points and altitude above the WGS84 ellipsoid.
+    Like ephem, the latitude of the sub-satellite point is geocentric.
+
+    :param r: TEME positions in km, shaped (satellites, timesteps, 3)
+    :type r: numpy array
+    :return: sub-satellite latitudes and longitudes in radians and altitudes in m
+    :rtype: tuple of numpy arrays
+    """
+    theta = _gmst(jd, fr)                                   # Rotate TEME to the Earth fixed frame
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    x = (r[..., 0] * cos_t + r[..., 1] * sin_t) * 1000.0
+    y = (-r[..., 0] * sin_t + r[..., 1] * cos_t) * 1000.0
+    z = r[..., 2] * 1000.0
+
+    lon = np.arctan2(y, x)
+    p = np.hypot(x, y)
+    lat = np.arctan2(z, p * (1 - E2))
+    for _ in range(3):                                      # Converges to sub-millimetre for LEO and GEO
+        n = A / np.sqrt(1 - E2 * np.sin(lat) ** 2)
+        lat = np.arctan2(z + E2 * n * np.sin(lat), p)
+    n = A / np.sqrt(1 - E2 * np.sin(lat) ** 2)
+    h = p / np.cos(lat) - n
+    return np.arctan2(z, p), lon, h
+
+def _teme_to_ecef(r, v, jd, fr):
+    """Converts TEME positions and velocities to the Earth fixed frame.
+
+    :param r: TEME positions in km, shaped (satellites, timesteps, 3)
+    :type r: numpy array
+    :param v: TEME velocities in km/s, shaped (satellites, timesteps, 3)
+    :type v: numpy array
+    :return: Earth fixed positions in m and velocities in m/s, each shaped (satellites, timesteps, 3)
+    :rtype: tuple of numpy arrays
+    """
+    theta = _gmst(jd, fr)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    position = np.empty(r.shape)
+    position[..., 0] = (r[..., 0] * cos_t + r[..., 1] * sin_t) * 1000.0
+    position[..., 1] = (-r[..., 0] * sin_t + r[..., 1] * cos_t) * 1000.0
+    position[..., 2] = r[..., 2] * 1000.0
+    velocity = np.empty(v.shape)                            # Relative to the rotating Earth
+    velocity[..., 0] = (v[..., 0] * cos_t + v[..., 1] * sin_t) * 1000.0 + OMEGA_E * position[..., 1]
+    velocity[..., 1] = (-v[..., 0] * sin_t + v[..., 1] * cos_t) * 1000.0 - OMEGA_E * position[..., 0]
+    velocity[..., 2] = v[..., 2] * 1000.0
+    return position, velocity
+
+class EphemBackend:
+    """Propagation backend computing one satellite at one timestep at a time with ephem.
+    """
+    name = "ephem"
+
+    def propagate(self, satellites, times):
+        """Computes the sub-satellite points and altitudes of the satellites at every timestep.
+
+        :param satellites: List of Satellites
+        :type satellites: list
+        :param times: timesteps of the propagation
+        :type times: list of Python datetime objects
+        :return: latitudes and longitudes in radians and altitudes in m, each shaped (satellites, timesteps)
+        :rtype: tuple of numpy arrays
+        """
+        sublat = np.empty((len(satellites), len(times)))
+        sublong = np.empty((len(satellites), len(times)))
+        elevation = np.empty((len(satellites), len(times)))
+        for index, sat in enumerate(satellites):
+            body = get_cache().body(sat.get_tle())          # Ephem instance of the satellite, parsed once per TLE
+            for step, date_time in enumerate(times):
+                body.compute(date_time)
+                sublat[index, step] = body.sublat
+                sublong[index, step] = body.sublong
+                elevation[index, step] = body.elevation
+        return sublat, sublong, elevation
+
+class SGP4Backend:
+    """Propagation backend computing every satellite at every timestep at once with the vectorized
+    SGP4 implementation of the `sgp4` package.
+
+    :raises ImportError: `sgp4` isn't installed
+    """
+    name = "sgp4"
+
+    def __init__(self):
+        """Constructor method
+        """
+        if SatrecArray is None:
+            raise ImportError("The 'sgp4' package is required by the SGP4 propagation backend")
+
+    def propagate(self, satellites, times):
+        """Computes the sub-satellite points and altitudes of the satellites at every timestep.
+        Timesteps where SGP4 fails, e.g. for decayed satellites, are set to NaN.
+
+        :param satellites: List of Satellites
+        :type satellites: list
+        :param times: timesteps of the propagation
+        :type times: list of Python datetime objects
+        :return: latitudes and longitudes in radians and altitudes in m, each shaped (satellites, timesteps)
+        :rtype: tuple of numpy arrays
+        """
+        if not len(satellites) or not len(times):
+            empty = np.empty((len(satellites), len(times)))
+            return empty, empty.copy(), empty.copy()
+        sats = SatrecArray([get_cache().satrec(sat.get_tle()) for sat in satellites])
+        jd, fr = _julian_dates(times)
+        errors, r, _ = sats.sgp4(jd, fr)
+        r[errors != 0] = np.nan
+        return _teme_to_subpoint(r, jd, fr)
+
+    def propagate_ecef(self, satellites, times):
+        """Computes the Earth fixed positions and velocities of the satellites at every timestep.
+        Timesteps where SGP4 fails are set to NaN.
+
+        :param satellites: List of Satellites
+        :type satellites: list
+        :param times: timesteps of the propagation
+        :type times: list of Python datetime objects
+        :return: positions in m and velocities in m/s, each shaped (satellites, timesteps, 3)
+        :rtype: tuple of numpy arrays
+        """
+        if not len(satellites) or not len(times):
+            empty = np.empty((len(satellites), len(times), 3))
+            return empty, empty.copy()
+        sats = SatrecArray([get_cache().satrec(sat.get_tle()) for sat in satellites])
+        jd, fr = _julian_dates(times)
+        errors, r, v = sats.sgp4(jd, fr)
+        r[errors != 0] = np.nan
+        v[errors != 0] = np.nan
+        return _teme_to_ecef(r, v, jd, fr)
+
+def get_backend(backend=None):
+    """Returns the propagation backend, the SGP4 backend if `sgp4` is installed and ephem otherwise.
+
+    :param backend: backend instance or one of "sgp4" and "ephem", defaults to None
+    :type backend: str, optional
+    :return: Propagation backend
+    :rtype: Instance of `SGP4Backend` or `EphemBackend`
+    """
+    if backend is None:
+        return SGP4Backend() if SatrecArray is not None else EphemBackend()
+    if backend == "sgp4":
+        return SGP4Backend()
+    if backend == "ephem":
+        return EphemBackend()
+    if hasattr(backend, "propagate"):
+        return backend
+    raise ValueError("Unknown propagation backend '{}'".format(backend))
+
+def propagate(satellites, times, backend=None, cache=None):
+    """Computes the sub-satellite points and altitudes of the satellites at every timestep with the backend,
+    reusing the positions already computed for the same TLEs and timesteps.
+
+    :param satellites: List of Satellites
+    :type satellites: list
+    :param times: timesteps of the propagation
+    :type times: list of Python datetime objects
+    :param backend: propagation backend, see `get_backend`, defaults to None
+    :type backend: str, optional
+    :param cache: ephemeris cache, defaults to the shared one
+    :type cache: Instance of `EphemerisCache`, optional
+    :return: latitudes and longitudes in radians and altitudes in m, each shaped (satellites, timesteps)
+    :rtype: tuple of numpy arrays
+    """
+    if cache is None:
+        cache = get_cache()
+    return cache.propagate(get_backend(backend), satellites, times)
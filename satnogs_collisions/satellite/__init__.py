@@ -1,5 +1,11 @@
 from .satellite import Satellite
+from .constellation import Constellation
+from .frequency_index import FrequencyIndex
+from .catalog import SatelliteCatalog
 
 __all__ = [
-    Satellite
-]
\ No newline at end of file
+    'Satellite',
+    'Constellation',
+    'FrequencyIndex',
+    'SatelliteCatalog'
+]
@@ -0,0 +1,150 @@
+import json
+import requests
+from satnogs_collisions.cache import fetch_json, load
+from .satellite import Satellite
+
+TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?GROUP=active&FORMAT=tle"
+TRANSMITTERS_URL = "https://db.satnogs.org/api/transmitters/"
+
+def _fetch_text(url):
+    response = requests.get(url)
+    response.raise_for_status()
+    return response.text
+
+def _parse_tles(text):
+    """Parses a TLE file into TLEs keyed by NORAD ID. Title lines are optional, TLEs without one
+    are titled with their NORAD ID.
+
+    :param text: contents of the TLE file
+    :type text: str
+    :return: [title, line1, line2] lists keyed by NORAD ID
+    :rtype: dictionary
+    """
+    tles = {}
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    index = 0
+    while index < len(lines) - 1:
+        if lines[index].startswith("1 ") and lines[index + 1].startswith("2 "):
+            title = None
+            line1, line2 = lines[index], lines[index + 1]
+            index += 2
+        elif index < len(lines) - 2 and lines[index + 1].startswith("1 ") and lines[index + 2].startswith("2 "):
+            title, line1, line2 = lines[index:index + 3]
+            index += 3
+        else:                                               # Skip lines that aren't part of a TLE
+            index += 1
+            continue
+        norad_id = int(line1[2:7])
+        tles[norad_id] = [title.strip() if title else str(norad_id), line1, line2]
+    return tles
+
+def _parse_transmitters(transmitters):
+    """Groups the downlink frequencies of a SatNOGS DB transmitters dump by NORAD ID.
+
+    :param transmitters: transmitters as returned by the SatNOGS DB API
+    :type transmitters: list
+    :return: lists of frequencies keyed by NORAD ID
+    :rtype: dictionary
+    """
+    frequencies = {}
+    for elem in transmitters:
+        if elem.get("norad_cat_id") is None or elem.get("downlink_low") is None:
+            continue
+        downlink_lows = frequencies.setdefault(int(elem["norad_cat_id"]), [])
+        if elem["downlink_low"] not in downlink_lows:
+            downlink_lows.append(elem["downlink_low"])
+    return frequencies
+
+class SatelliteCatalog:
+    """In-memory catalog of TLEs and transmitter frequencies indexed by NORAD ID, which builds
+    `Satellite`s without any network request.
+
+    :param tles: [title, line1, line2] lists keyed by NORAD ID, defaults to None
+    :type tles: dictionary, optional
+    :param frequencies: lists of frequencies keyed by NORAD ID, defaults to None
+    :type frequencies: dictionary, optional
+    """
+    def __init__(self, tles=None, frequencies=None):
+        """Constructor method
+        """
+        self.tles = dict(tles or {})
+        self.frequencies = dict(frequencies or {})
+        self._satellites = {}
+
+    @classmethod
+    def from_files(cls, tle_path, transmitters_path):
+        """Loads the catalog from a TLE file and a SatNOGS DB transmitters JSON dump.
+
+        :param tle_path: path of the TLE file
+        :type tle_path: str
+        :param transmitters_path: path of the transmitters JSON file
+        :type transmitters_path: str
+        :return: Satellite catalog
+        :rtype: Instance of `SatelliteCatalog`
+        """
+        with open(tle_path) as tle_file:
+            tles = _parse_tles(tle_file.read())
+        with open(transmitters_path) as transmitters_file:
+            frequencies = _parse_transmitters(json.load(transmitters_file))
+        return cls(tles, frequencies)
+
+    @classmethod
+    def fetch(cls, tle_url=TLE_URL, transmitters_url=TRANSMITTERS_URL):
+        """Loads the catalog with one bulk request for the TLEs and one for the transmitters, through the
+        disk cache if it is enabled.
+
+        :param tle_url: URL of the TLE file, defaults to the active satellites of CelesTrak
+        :type tle_url: str, optional
+        :param transmitters_url: URL of the transmitters, defaults to the SatNOGS DB API
+        :type transmitters_url: str, optional
+        :return: Satellite catalog
+        :rtype: Instance of `SatelliteCatalog`
+        """
+        tles = _parse_tles(load(tle_url, lambda: _fetch_text(tle_url)))
+        frequencies = _parse_transmitters(fetch_json(transmitters_url))
+        return cls(tles, frequencies)
+
+    def __len__(self):
+        return len(self.tles)
+
+    def __contains__(self, norad_id):
+        return int(norad_id) in self.tles
+
+    def norad_ids(self):
+        """Returns the NORAD IDs of the satellites having a TLE, in ascending order.
+        """
+        return sorted(self.tles)
+
+    def get(self, norad_id):
+        """Returns the `Satellite` of the NORAD ID, built once from the catalog.
+
+        :param norad_id: NORAD ID of the satellite
+        :type norad_id: int
+        :raises KeyError: the catalog has no TLE for the NORAD ID
+        :return: Satellite
+        :rtype: Instance of `Satellite`
+        """
+        norad_id = int(norad_id)
+        if norad_id not in self._satellites:
+            if norad_id not in self.tles:
+                raise KeyError("No TLE for the NORAD ID {} in the catalog".format(norad_id))
+            self._satellites[norad_id] = Satellite(norad_id=norad_id, tle=self.tles[norad_id],
+                                                   frequencies=self.frequencies.get(norad_id, []))
+        return self._satellites[norad_id]
+
+    def satellites(self, norad_ids=None, transmitting=True):
+        """Returns the `Satellite`s of the NORAD IDs, or of the whole catalog.
+
+        :param norad_ids: NORAD IDs, defaults to every satellite of the catalog
+        :type norad_ids: list, optional
+        :param transmitting: skip the satellites without known transmitter frequencies, defaults to True
+        :type transmitting: bool, optional
+        :return: List of Satellites
+        :rtype: list
+        """
+        if norad_ids is None:
+            norad_ids = self.norad_ids()
+        sats = [self.get(norad_id) for norad_id in norad_ids]
+        if transmitting:
+            sats = [sat for sat in sats if sat.get_frequencies()]
+        return sats
@@ -0,0 +1,55 @@
+import numpy as np
+
+def _epoch_jd(line1):
+    """Converts the epoch of the TLE to a Julian date.
+    """
+    year = int(line1[18:20])
+    year += 2000 if year < 57 else 1900
+    day = float(line1[20:32])
+    # Julian date of January 0 of the year, valid for the Gregorian calendar from 1901 to 2099
+    return 367*year - (7*year)//4 + 275//9 + 1721013.5 + day
+
+class Constellation:
+    """Columnar representation of a list of Satellites, holding the orbital elements of their TLEs and
+    their frequencies as NumPy arrays. It iterates over the Satellites, so every function taking a list of
+    Satellites takes a `Constellation` too.
+
+    The frequencies of the satellite `i` are `frequencies[offsets[i]:offsets[i + 1]]`.
+
+    :param satellites: List of Satellites
+    :type satellites: list
+    """
+    def __init__(self, satellites):
+        """Constructor method
+        """
+        self.satellites = list(satellites)
+        tles = [sat.get_tle() for sat in self.satellites]
+        self.names = [tle[0] for tle in tles]
+        self.norad_ids = np.array([int(tle[1][2:7]) for tle in tles], dtype=np.int64)
+        self.epochs = np.array([_epoch_jd(tle[1]) for tle in tles], dtype=float)           # Julian dates
+        self.inclination = np.array([float(tle[2][8:16]) for tle in tles], dtype=float)      # Degrees
+        self.raan = np.array([float(tle[2][17:25]) for tle in tles], dtype=float)            # Degrees
+        self.eccentricity = np.array([float("0." + tle[2][26:33].strip()) for tle in tles], dtype=float)
+        self.arg_perigee = np.array([float(tle[2][34:42]) for tle in tles], dtype=float)     # Degrees
+        self.mean_anomaly = np.array([float(tle[2][43:51]) for tle in tles], dtype=float)    # Degrees
+        self.mean_motion = np.array([float(tle[2][52:63]) for tle in tles], dtype=float)     # Revolutions per day
+        counts = [len(sat.get_frequencies()) for sat in self.satellites]
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.frequencies = np.array([freq for sat in self.satellites for freq in sat.get_frequencies()], dtype=float)
+        self.owners = np.repeat(np.arange(len(self.satellites)), counts)                      # Satellite of every frequency
+
+    def __len__(self):
+        return len(self.satellites)
+
+    def __iter__(self):
+        return iter(self.satellites)
+
+    def __getitem__(self, index):
+        return self.satellites[index]
+
+    def get_frequencies(self, index):
+        """Returns the frequencies of the satellite at the index.
+
+        :rtype: numpy array
+        """
+        return self.frequencies[self.offsets[index]:self.offsets[index + 1]]
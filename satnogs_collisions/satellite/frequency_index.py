@@ -0,0 +1,115 @@
+import numpy as np
+from .constellation import Constellation
+
+C = 299792458.0                                         # Define speed of light
+MU = 398600441800000.0                                  # Standard gravitational parameter of the Earth in m^3/s^2
+OMEGA_E = 7.2921159e-5                                  # Rotation rate of the Earth in rad/s
+R = 6378137.0                                           # Equatorial radius of the Earth in m
+
+def _max_range_rate(tle):
+    """Computes an upper bound of the range rate of the satellite seen from any ground station, which is
+    its speed at perigee plus the speed of a ground station at the equator.
+
+    :param tle: Two line element set
+    :type tle: list
+    :return: range rate in m/s
+    :rtype: float
+    """
+    return float(_max_range_rates(float("0." + tle[2][26:33].strip()), float(tle[2][52:63])))
+
+def _max_range_rates(eccentricity, mean_motion):
+    """Computes the upper bounds of the range rates from the eccentricities and mean motions in revolutions per day.
+
+    :return: range rates in m/s
+    :rtype: numpy array
+    """
+    mean_motion = np.asarray(mean_motion, dtype=float) * 2 * np.pi / 86400          # rad/s
+    a = (MU / mean_motion ** 2) ** (1 / 3)                              # Semi-major axis in m
+    v_perigee = np.sqrt(MU * (1 + eccentricity) / (a * (1 - eccentricity)))
+    return v_perigee + OMEGA_E * R
+
+class FrequencyIndex:
+    """Sorted index over the transmitting frequencies of the satellites, used to find the satellites whose
+    frequencies may lie in a frequency range of each other before propagating any orbit.
+
+    Every frequency is stored as the interval of the frequencies it can be received at, which is the
+    frequency itself or, with `doppler`, the frequency widened by the worst case Doppler shift of the satellite.
+
+    :param satellites: List of Satellites
+    :type satellites: list
+    :param doppler: widen the frequencies by the worst case Doppler shift, defaults to False
+    :type doppler: bool, optional
+    """
+    def __init__(self, satellites, doppler=False):
+        """Constructor method
+        """
+        self.satellites = list(satellites)
+        self.doppler = doppler
+        if isinstance(satellites, Constellation):               # The frequencies and elements are already arrays
+            owners = satellites.owners
+            shift = _max_range_rates(satellites.eccentricity, satellites.mean_motion)[owners] / C if doppler else 0
+            lows = satellites.frequencies * (1 - shift)
+            highs = satellites.frequencies * (1 + shift)
+        else:
+            lows = []
+            highs = []
+            owners = []
+            for index, sat in enumerate(self.satellites):
+                shift = _max_range_rate(sat.get_tle()) / C if doppler else 0
+                for freq in sat.get_frequencies():
+                    lows.append(freq * (1 - shift))
+                    highs.append(freq * (1 + shift))
+                    owners.append(index)
+        lows = np.array(lows, dtype=float)
+        order = np.argsort(lows, kind="stable")                         # Sort the intervals by their lower frequency
+        self._lows = lows[order]
+        self._highs = np.array(highs, dtype=float)[order]
+        self._owners = np.array(owners, dtype=int)[order]
+        self._max_width = float(np.max(self._highs - self._lows)) if len(order) else 0.0
+
+    def query(self, sat, frequency_range):
+        """Finds the satellites of the index having a frequency in the frequency range of the satellite.
+
+        :param sat: Satellite
+        :type sat: Instance of `Satellite`
+        :param frequency_range: frequency in Hz
+        :type frequency_range: int
+        :return: list of candidate satellites in the order of the index
+        :rtype: list
+        """
+        shift = _max_range_rate(sat.get_tle()) / C if self.doppler else 0
+        owners = set()
+        for freq in sat.get_frequencies():
+            low = freq * (1 - shift) - frequency_range
+            high = freq * (1 + shift) + frequency_range
+            start = np.searchsorted(self._lows, low - self._max_width, side="left")
+            end = np.searchsorted(self._lows, high, side="right")
+            matches = self._highs[start:end] >= low
+            owners.update(self._owners[start:end][matches].tolist())
+        return [self.satellites[index] for index in sorted(owners) if self.satellites[index] is not sat]
+
+    def candidate_pairs(self, frequency_range):
+        """Finds every pair of satellites of the index having frequencies in the frequency range of each other
+        with a single sweep over the sorted frequencies.
+
+        :param frequency_range: frequency in Hz
+        :type frequency_range: int
+        :return: set of (sat1, sat2) tuples, sat1 coming first in the list of satellites
+        :rtype: set
+        """
+        # Every interval is paired with the following ones that start before it ends
+        ends = np.searchsorted(self._lows, self._highs + frequency_range, side="right")
+        starts = np.arange(1, len(self._lows) + 1)
+        counts = np.maximum(ends - starts, 0)
+        first = np.repeat(np.arange(len(self._lows)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = first + 1 + offsets
+        owners1 = self._owners[first]
+        owners2 = self._owners[second]
+        pairs = set()
+        for index1, index2 in zip(np.minimum(owners1, owners2).tolist(), np.maximum(owners1, owners2).tolist()):
+            sat1 = self.satellites[index1]
+            sat2 = self.satellites[index2]
+            if sat1 is not sat2:
+                pairs.add((sat1, sat2))
+        return pairs
@@ -1,13 +1,14 @@
-import requests
+import asyncio
 from satellite_tle import fetch_tle_from_celestrak
+from satnogs_collisions.cache import fetch_json, load
+from satnogs_collisions.fetcher import AsyncFetcher
 
 def _set_tle(norad_id):
-    tle = fetch_tle_from_celestrak(norad_id)
+    tle = load("tle:" + str(norad_id), lambda: list(fetch_tle_from_celestrak(norad_id)))
     return tle
 
 def _set_frequencies(norad_id):
-    response = requests.get("https://db.satnogs.org/api/transmitters/?satellite__norad_cat_id=" + str(norad_id))
-    data = response.json()
+    data = fetch_json("https://db.satnogs.org/api/transmitters/?satellite__norad_cat_id=" + str(norad_id))
     downlink_lows = set()
     for elem in data:
         downlink_lows.add(elem["downlink_low"])
@@ -24,11 +25,13 @@ class Satellite:
     :type frequencies: list, optional
     :raises ValueError: Missing values
     """
+    __slots__ = ("norad_id", "tle", "frequencies")
+
     def __init__(self, norad_id=None, tle=[], frequencies=None):
         """Constructor method
         """
         self.norad_id = norad_id
-        if (len(tle) == 3 and frequencies):
+        if (len(tle) == 3 and frequencies is not None):
             self.tle = tle
             self.frequencies = frequencies
         elif (norad_id):
@@ -40,6 +43,30 @@ class Satellite:
         else:
             raise ValueError("Values Missing. Must provide either the 'Norad ID' or the 'TLE and frequency' of satellite")
 
+    @classmethod
+    async def fetch_many(cls, norad_ids, fetcher=None):
+        """Creates the Satellites of the NORAD IDs, fetching their TLEs and frequencies concurrently.
+
+        :param norad_ids: NORAD IDs of the satellites
+        :type norad_ids: list
+        :param fetcher: fetcher of the requests, defaults to a new `AsyncFetcher`
+        :type fetcher: Instance of `AsyncFetcher`, optional
+        :return: List of Satellites in the order of the NORAD IDs
+        :rtype: list
+        """
+        norad_ids = list(norad_ids)
+        own_fetcher = fetcher is None
+        if own_fetcher:
+            fetcher = AsyncFetcher()
+        try:
+            tles, frequencies = await asyncio.gather(
+                asyncio.gather(*[fetcher.tle(norad_id) for norad_id in norad_ids]),
+                asyncio.gather(*[fetcher.frequencies(norad_id) for norad_id in norad_ids]))
+        finally:
+            if own_fetcher:
+                fetcher.close()
+        return [cls(norad_id=norad_id, tle=tle, frequencies=freqs) for norad_id, tle, freqs in zip(norad_ids, tles, frequencies)]
+
     def get_tle(self):
         return self.tle
 
@@ -7,6 +7,9 @@ setup(name='satnogs-collisions',
 	author='SatNOGS project',
 	author_email='dev@satnogs.org',
 	packages=find_packages(),
+	extras_require={
+          "sgp4": ["sgp4>=2.7"],
+      },
 	classifiers=[
           "Programming Language :: Python :: 3",
           "License :: OSI Approved :: GNU Affero General Public License v3",
@@ -0,0 +1,40 @@
+import importlib.util
+import os
+import unittest
+
+BENCH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "bench.py")
+spec = importlib.util.spec_from_file_location("bench", BENCH)
+bench = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench)
+
+class TestBenchmarks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.satellites, cls.stations = bench.load_fixtures()
+
+    def test_fixtures(self):
+        """The fixtures cover the largest scales of the full preset without any network access
+        """
+        self.assertEqual(len(self.satellites), 1000)
+        self.assertEqual(len(self.stations), 500)
+        self.assertTrue(all(sat.get_frequencies() for sat in self.satellites))
+
+    def test_every_entry_point_runs(self):
+        matrix = bench.cases([3], [2], ["1h"])
+        self.assertEqual(len(matrix), len(bench.ENTRY_POINTS))
+        for case in matrix:
+            memory = case[0] == "compute_RF_collision_of_satellites_over_groundstations"
+            result = bench.run_case(case, self.satellites, self.stations, memory=memory)
+            self.assertGreater(result["pair_hours_per_second"], 0)
+            self.assertEqual(result["peak_bytes"] is not None, memory)
+            if memory:
+                self.assertGreater(result["peak_bytes"], 0)
+
+    def test_scaling_and_compare(self):
+        results = [{"entry": "entry", "satellites": satellites, "stations": 0, "window": "1h", "seconds": seconds}
+                   for satellites, seconds in ((10, 1.0), (100, 100.0))]
+        (entry, fixed, points, exponent), = bench.scaling(results, "satellites")
+        self.assertAlmostEqual(exponent, 2)
+        slower = [dict(result, seconds=result["seconds"]*1.5) for result in results]
+        self.assertEqual([regression for result, seconds, ratio, regression in bench.compare(slower, {"results": results})], [True, True])
+        self.assertFalse(any(regression for result, seconds, ratio, regression in bench.compare(results, {"results": slower})))
@@ -0,0 +1,85 @@
+from satnogs_collisions.cache import DiskCache, CacheMissError
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+
+class StationsHandler(BaseHTTPRequestHandler):
+    """Local stand-in of the SatNOGS Network API, answering conditional requests
+    """
+    etag = '"v1"'
+    body = [{"id": 6, "lat": 37.98, "lng": 23.73, "altitude": 100}]
+    requests = []
+
+    def do_GET(self):
+        StationsHandler.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        data = json.dumps(self.body).encode()
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        StationsHandler.requests = []
+        self.server = HTTPServer(("127.0.0.1", 0), StationsHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:{}/api/stations/?id=6".format(self.server.server_port)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def test_fresh_records_are_reused(self):
+        """Records are only fetched again once they expire
+        """
+        cache = DiskCache(self.directory)
+        self.assertEqual(cache.get_json(self.url), StationsHandler.body)
+        self.assertEqual(DiskCache(self.directory).get_json(self.url), StationsHandler.body)
+        self.assertEqual(len(StationsHandler.requests), 1)
+
+    def test_conditional_refresh(self):
+        """Expired records are refreshed with the ETag of the previous response
+        """
+        cache = DiskCache(self.directory, ttl=0)
+        cache.get_json(self.url)
+        self.assertEqual(cache.get_json(self.url), StationsHandler.body)
+        self.assertEqual(len(StationsHandler.requests), 2)
+        self.assertEqual(StationsHandler.requests[1].get("If-None-Match"), '"v1"')
+
+    def test_cache_only(self):
+        """Cache-only mode serves stale records and never accesses the network
+        """
+        DiskCache(self.directory, ttl=0).get_json(self.url)
+        cache = DiskCache(self.directory, ttl=0, offline=True)
+        self.assertEqual(cache.get_json(self.url), StationsHandler.body)
+        self.assertRaises(CacheMissError, cache.get_json, self.url + "1")
+        self.assertRaises(CacheMissError, cache.get, "tle:6", lambda: ["6", "1", "2"])
+        self.assertEqual(len(StationsHandler.requests), 1)
+
+    def test_outage(self):
+        """Stale records are served when the network fails
+        """
+        cache = DiskCache(self.directory, ttl=0)
+        cache.get_json(self.url)
+        self.assertEqual(cache.get("tle:6", lambda: ["6", "1", "2"]), ["6", "1", "2"])
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertEqual(cache.get_json(self.url), StationsHandler.body)
+
+        def unavailable():
+            raise ConnectionError()
+        self.assertEqual(cache.get("tle:6", unavailable), ["6", "1", "2"])
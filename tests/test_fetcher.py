@@ -0,0 +1,84 @@
+from satnogs_collisions import Satellite, GroundStation
+from satnogs_collisions.fetcher import AsyncFetcher
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import asyncio
+import json
+import threading
+import unittest
+
+TLES = {
+    "45258": "45258 - Phoenix (ASU)\r\n"
+             "1 45258U 98067RB  20067.47769304  .00002942  00000-0  59624-4 0  9996\r\n"
+             "2 45258  51.6418 131.6319 0006369 330.6920  29.3711 15.49954130  2659\r\n",
+    "40014": "40014 - BUGSAT-1\r\n"
+             "1 40014U 14033E   20089.83608613  .00000338  00000-0  36005-4 0  9996\r\n"
+             "2 40014  98.0547  49.3997 0031228 193.5632 166.4767 14.95418473315114\r\n"
+}
+TRANSMITTERS = {
+    "45258": [{"norad_cat_id": 45258, "downlink_low": 437350000}],
+    "40014": [{"norad_cat_id": 40014, "downlink_low": 437445000}, {"norad_cat_id": 40014, "downlink_low": None}]
+}
+STATIONS = {
+    "6": [{"id": 6, "lat": 37.98, "lng": 23.73, "altitude": 100}],
+    "7": [{"id": 7, "lat": 51.5, "lng": -0.12, "altitude": 0}]
+}
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Local stand-in of CelesTrak, SatNOGS DB and SatNOGS Network, failing the first request of every station
+    """
+    failed = set()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: value[0] for key, value in parse_qs(url.query).items()}
+        if url.path == "/stations" and query["id"] not in MockHandler.failed:
+            MockHandler.failed.add(query["id"])
+            self.send_response(503)
+            self.end_headers()
+            return
+        if url.path == "/tle":
+            data = TLES[query["CATNR"]].encode()
+        elif url.path == "/transmitters":
+            data = json.dumps(TRANSMITTERS[query["satellite__norad_cat_id"]]).encode()
+        else:
+            data = json.dumps(STATIONS[query["id"]]).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+class TestAsyncFetcher(unittest.TestCase):
+    def setUp(self):
+        MockHandler.failed = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MockHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        base = "http://127.0.0.1:{}".format(self.server.server_port)
+        self.fetcher = AsyncFetcher(concurrency=4, backoff=0.01, tle_url=base + "/tle?CATNR={}",
+                                    transmitters_url=base + "/transmitters?satellite__norad_cat_id={}",
+                                    stations_url=base + "/stations?id={}")
+
+    def tearDown(self):
+        self.fetcher.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_satellites(self):
+        """Satellites are fully populated in the order of the NORAD IDs
+        """
+        sats = asyncio.run(Satellite.fetch_many([40014, 45258], fetcher=self.fetcher))
+        self.assertEqual([sat.norad_id for sat in sats], [40014, 45258])
+        self.assertEqual(sats[0].get_name(), "40014 - BUGSAT-1")
+        self.assertEqual(len(sats[1].get_tle()), 3)
+        self.assertEqual(sats[0].get_frequencies(), [437445000])
+
+    def test_ground_stations_are_retried(self):
+        """Failed requests are retried
+        """
+        stations = asyncio.run(GroundStation.fetch_many([6, 7], fetcher=self.fetcher))
+        self.assertEqual(stations[0].get_coordinates(), (37.98, 23.73))
+        self.assertEqual(stations[1].get_elevation(), 0)
+        self.assertEqual(MockHandler.failed, {"6", "7"})
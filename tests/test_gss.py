@@ -0,0 +1,304 @@
+from satnogs_collisions import Satellite, GroundStation, Constellation, StationSet, compute_RF_collision_of_satellites_over_groundstation
+from satnogs_collisions.GSS import gss
+from satnogs_collisions import propagation
+import ephem
+import numpy as np
+import datetime as dt
+import unittest
+
+def _satellites():
+    tle = [
+    "45258 - Phoenix (ASU)",
+    "1 45258U 98067RB  20067.47769304  .00002942  00000-0  59624-4 0  9996",
+    "2 45258  51.6418 131.6319 0006369 330.6920  29.3711 15.49954130  2659"
+    ]
+    sat1 = Satellite(tle=tle, frequencies=[437350000])
+    tle = [
+    "45263 - QARMAN",
+    "1 45263U 98067RG  20067.47843361  .00002564  00000-0  53131-4 0  9995",
+    "2 45263  51.6423 131.6371 0007933 343.6105  16.4627 15.49877689  2719"
+    ]
+    sat2 = Satellite(tle=tle, frequencies=[437350000])
+    tle = [
+    "40014 - BUGSAT-1",
+    "1 40014U 14033E   20089.83608613  .00000338  00000-0  36005-4 0  9996",
+    "2 40014  98.0547  49.3997 0031228 193.5632 166.4767 14.95418473315114"
+    ]
+    sat3 = Satellite(tle=tle, frequencies=[437445000])
+    return [sat1, sat2, sat3]
+
+class TestPassTable(unittest.TestCase):
+    def setUp(self):
+        self.satellites = _satellites()
+        self.gs = GroundStation(coordinates=[37.98, 23.73], elevation=100)
+        self.dt_range = [dt.datetime(2020, 3, 9, 0, 0), dt.datetime(2020, 3, 9, 12, 0)]
+
+    def test_passes_are_computed_once_per_satellite(self):
+        """Every candidate satellite's passes are computed once for all the pairs, the satellites
+        out of frequency range of all the others not at all
+        """
+        candidate = Satellite(tle=_tle(90010, 51.6, 90, 15.5), frequencies=[437345000])
+        satellites = self.satellites + [candidate]
+        calls = []
+        compute_passes = gss._compute_passes
+        def _counting_compute_passes(observer, sat, frequencies, date_time_range, **kwargs):
+            calls.append(sat.name)
+            return compute_passes(observer, sat, frequencies, date_time_range, **kwargs)
+        gss._compute_passes = _counting_compute_passes
+        try:
+            compute_RF_collision_of_satellites_over_groundstation(self.gs, satellites, self.dt_range)
+        finally:
+            gss._compute_passes = compute_passes
+        self.assertEqual(len(calls), 3)
+        self.assertNotIn(gss.get_cache().body(self.satellites[2].get_tle()).name, calls)     # 95 kHz from the others
+
+    def test_pass_table_matches_pairwise_computation(self):
+        """Collisions found with a shared pass table match the ones of a single pair
+        """
+        sat1, sat2 = self.satellites[:2]
+        pass_table = gss._compute_pass_table(self.gs, self.satellites, self.dt_range)
+        shared = gss._check_collision(self.gs, sat1, sat2, self.dt_range, 30000, time_period=True, pass_table=pass_table)
+        single = gss._check_collision(self.gs, sat1, sat2, self.dt_range, 30000, time_period=True)
+        self.assertTrue(len(shared))
+        self.assertEqual([(c.start, c.end) for c in shared], [(c.start, c.end) for c in single])
+
+class TestOverlappingPasses(unittest.TestCase):
+    def test_only_overlapping_pairs_are_returned(self):
+        """The sweep line returns only the passes that overlap in time
+        """
+        sat1, sat2, sat3 = _satellites()
+        pass_table = {
+            sat1: [(1.0, 2.0, {}), (5.0, 6.0, {})],
+            sat2: [(1.5, 2.5, {}), (3.0, 4.0, {})],
+            sat3: [(5.5, 7.0, {})]
+        }
+        overlaps = gss._find_overlapping_passes(pass_table)
+        self.assertEqual(gss._get_overlapping_passes(overlaps, sat1, sat2), [(pass_table[sat1][0], pass_table[sat2][0])])
+        self.assertEqual(gss._get_overlapping_passes(overlaps, sat3, sat1), [(pass_table[sat3][0], pass_table[sat1][1])])
+        self.assertEqual(gss._get_overlapping_passes(overlaps, sat2, sat3), [])
+
+    def test_main_sat_restricts_the_pairs(self):
+        """Only the pairs including the main satellite are returned
+        """
+        sat1, sat2, sat3 = _satellites()
+        pass_table = {sat1: [(1.0, 2.0, {})], sat2: [(1.5, 2.5, {})], sat3: [(1.2, 3.0, {})]}
+        overlaps = gss._find_overlapping_passes(pass_table, main_sat=sat1)
+        self.assertEqual(len(overlaps), 2)
+        self.assertEqual(gss._get_overlapping_passes(overlaps, sat2, sat3), [])
+
+class TestParallel(unittest.TestCase):
+    def test_workers_match_serial(self):
+        """Ground stations split over a process pool give the same collisions as a serial run
+        """
+        satellites = _satellites()
+        ground_stations = [GroundStation(coordinates=[37.98, 23.73], elevation=100),
+                           GroundStation(coordinates=[51.5, -0.12], elevation=20),
+                           GroundStation(coordinates=[-33.9, 18.4], elevation=10)]
+        dt_range = [dt.datetime(2020, 3, 20, 0, 0), dt.datetime(2020, 3, 20, 12, 0)]
+        serial = gss.compute_RF_collision_of_satellites_over_groundstations(ground_stations, satellites, dt_range)
+        parallel = gss.compute_RF_collision_of_satellites_over_groundstations(ground_stations, satellites, dt_range, workers=2)
+        self.assertEqual(list(parallel), [1, 2, 3])
+        self.assertEqual(parallel, serial)
+        columnar = gss.compute_RF_collision_of_satellites_over_groundstations(StationSet(ground_stations), Constellation(satellites), dt_range)
+        self.assertEqual(columnar, serial)
+
+@unittest.skipIf(propagation.propagation.SatrecArray is None, "sgp4 isn't installed")
+class TestBatchedPasses(unittest.TestCase):
+    def setUp(self):
+        self.satellites = _satellites()
+        self.ground_stations = [GroundStation(coordinates=[37.98, 23.73], elevation=100),
+                                GroundStation(coordinates=[-33.9, 151.2], elevation=20)]
+        self.dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+
+    def test_passes_match_ephem(self):
+        """The passes found for every ground station at once match the passes of ephem within a second
+        """
+        pass_tables = gss._compute_pass_tables(self.ground_stations, self.satellites, self.dt_range)
+        for ground_station, pass_table in zip(self.ground_stations, pass_tables):
+            expected = gss._compute_pass_table(ground_station, self.satellites, self.dt_range)
+            for sat in self.satellites:
+                # ephem reports grazing passes as rising and setting at once
+                passes = [sat_pass for sat_pass in expected[sat] if sat_pass[1] - sat_pass[0] > ephem.minute]
+                batched = [sat_pass for sat_pass in pass_table[sat] if sat_pass[1] - sat_pass[0] > 2 * ephem.minute]
+                self.assertEqual(len(batched), len(passes))
+                for sat_pass, expected_pass in zip(batched, passes):
+                    self.assertLess(abs(sat_pass[0] - expected_pass[0]) * 86400, 1)
+                    self.assertLess(abs(sat_pass[1] - expected_pass[1]) * 86400, 1)
+                    for freq, (low, high) in sat_pass[2].items():
+                        self.assertLess(abs(low - expected_pass[2][freq][0]), 100)
+                        self.assertLess(abs(high - expected_pass[2][freq][1]), 100)
+
+    def test_batched_collisions(self):
+        serial = gss.compute_RF_collision_of_satellites_over_groundstations(self.ground_stations, self.satellites, self.dt_range)
+        batched = gss.compute_RF_collision_of_satellites_over_groundstations(self.ground_stations, self.satellites, self.dt_range,
+                                                                              batched=True)
+        self.assertEqual(list(batched), [1, 2])
+        for id in serial:
+            for name in serial[id]:
+                for collisions, batched_collisions in zip(serial[id][name], batched[id][name]):
+                    self.assertEqual(len(batched_collisions), len(collisions))
+                    for collision, batched_collision in zip(collisions, batched_collisions):
+                        self.assertEqual(batched_collision["satellites"], collision["satellites"])
+                        for time, batched_time in zip(collision["time_period"], batched_collision["time_period"]):
+                            self.assertLess(abs((batched_time - time).total_seconds()), 1)
+
+def _tle(norad_id, inclination, mean_anomaly, mean_motion):
+    def checksum(line):
+        return str(sum(int(char) if char.isdigit() else char == "-" for char in line) % 10)
+    line1 = "1 {:05d}U 20001A   20080.50000000  .00000000  00000-0  10000-4 0  999".format(norad_id)
+    line2 = "2 {:05d} {:8.4f} 100.0000 0001000   0.0000 {:8.4f} {:11.8f}    1".format(norad_id, inclination, mean_anomaly, mean_motion)
+    return ["{:05d} - TEST-{}".format(norad_id, norad_id), line1 + checksum(line1), line2 + checksum(line2)]
+
+class TestAlwaysBelowOrAbove(unittest.TestCase):
+    def setUp(self):
+        self.dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 22, 0, 0)]
+
+    def _check(self, ground_station, satellites):
+        serial = gss.compute_RF_collision_of_satellites_over_groundstation(ground_station, satellites, self.dt_range)
+        batched = gss.compute_RF_collision_of_satellites_over_groundstations([ground_station], satellites, self.dt_range, batched=True)[1]
+        for name in serial:
+            for collisions, batched_collisions in zip(serial[name], batched[name]):
+                self.assertEqual(len(batched_collisions), len(collisions))
+                for collision, batched_collision in zip(collisions, batched_collisions):
+                    for time, batched_time in zip(collision["time_period"], batched_collision["time_period"]):
+                        self.assertLess(abs((batched_time - time).total_seconds()), 1)
+        return serial
+
+    def test_never_rises(self):
+        """A satellite that never rises over the ground station has no passes
+        """
+        low = Satellite(tle=_tle(90001, 28.5, 0, 15.2), frequencies=[437350000])
+        polar = [Satellite(tle=_tle(90002 + index, 97.5, 10 + 30*index, 15.2), frequencies=[437355000]) for index in range(2)]
+        ground_station = GroundStation(coordinates=[70, 20], elevation=0)
+        self.assertEqual(gss._compute_pass_table(ground_station, [low], self.dt_range), {low: []})
+        collisions = self._check(ground_station, [low] + polar)
+        self.assertEqual(collisions[low.get_name()], [[], []])
+        self.assertGreater(len(collisions[polar[0].get_name()][1]), 0)
+        self.assertEqual(gss.detect_RF_collision_of_satellite_over_groundstation(ground_station, polar, low, self.dt_range), [False, False])
+
+    def test_never_sets(self):
+        """A satellite that never sets has a single pass covering the time range
+        """
+        geo = [Satellite(tle=_tle(90004 + index, 0.05, 2*index, 1.0027), frequencies=[437350000]) for index in range(2)]
+        ground_station = GroundStation(coordinates=[10, 101.5], elevation=0)
+        passes = gss._compute_pass_table(ground_station, geo, self.dt_range)[geo[0]]
+        self.assertEqual([(sat_pass[0].datetime(), sat_pass[1].datetime()) for sat_pass in passes],
+                         [(self.dt_range[0] - dt.timedelta(hours=1), self.dt_range[1])])
+        collisions = self._check(ground_station, geo)
+        self.assertEqual([collision["time_period"] for collision in collisions[geo[0].get_name()][0]], [self.dt_range])
+
+class TestGroundStation(unittest.TestCase):
+    def test_longitude_alias(self):
+        """The misspelled `longitide` attribute is kept as an alias of `longitude`
+        """
+        gs = GroundStation(coordinates=[37.98, 23.73], elevation=0)
+        self.assertEqual(gs.longitide, 23.73)
+        gs.longitide = 24.0
+        self.assertEqual(gs.get_coordinates(), (37.98, 24.0))
+        self.assertEqual(StationSet([gs]).longitude.tolist(), [24.0])
+
+class TestStreaming(unittest.TestCase):
+    def test_iter_matches_compute(self):
+        """Streamed collisions match the computed ones, in the order of their start time
+        """
+        satellites = _satellites()
+        ground_stations = [GroundStation(coordinates=[37.98, 23.73], elevation=100),
+                           GroundStation(coordinates=[51.5, -0.12], elevation=20)]
+        dt_range = [dt.datetime(2020, 3, 20, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+        computed = gss.compute_RF_collision_of_satellite_over_groundstations(ground_stations, satellites[1:], satellites[0], dt_range)
+        expected = [(id, collision) for id, results in computed.items() for result in results for collision in result]
+        streamed = list(gss.iter_RF_collisions_over_groundstations(ground_stations, satellites[1:], dt_range,
+                                                                   main_sat=satellites[0], window=dt.timedelta(hours=5)))
+        self.assertEqual(streamed[0][1].station_id, None)
+        streamed = [(id, event.to_dict()) for id, event in streamed]
+        starts = [collision["time_period"][0] for _, collision in streamed]
+        self.assertEqual(starts, sorted(starts))
+        self.assertEqual(len(streamed), len(expected))
+        key = lambda elem: (elem[0], elem[1]["time_period"][0])
+        for (id, collision), (expected_id, expected_collision) in zip(sorted(streamed, key=key), sorted(expected, key=key)):
+            self.assertEqual(id, expected_id)
+            self.assertEqual(collision["satellites"], expected_collision["satellites"])
+            for time, expected_time in zip(collision["time_period"], expected_collision["time_period"]):
+                self.assertLess(abs((time - expected_time).total_seconds()), 1)   # ephem root finding noise
+
+    def test_window_must_be_positive(self):
+        satellites = _satellites()
+        ground_station = GroundStation(coordinates=[37.98, 23.73], elevation=100)
+        dt_range = [dt.datetime(2020, 3, 20, 0, 0), dt.datetime(2020, 3, 20, 6, 0)]
+        for window in (dt.timedelta(0), dt.timedelta(hours=-1)):
+            with self.assertRaises(ValueError):
+                gss.iter_RF_collisions_over_groundstation(ground_station, satellites, dt_range, window=window)
+            with self.assertRaises(ValueError):
+                gss.iter_RF_collisions_over_groundstations([ground_station], satellites, dt_range, window=window)
+
+class TestDopplerProfile(unittest.TestCase):
+    def test_profile(self):
+        """Frequencies are received higher while the satellite approaches and lower while it moves away
+        """
+        sat = _satellites()[0]
+        observer = gss._create_observer(GroundStation(coordinates=[37.98, 23.73], elevation=100))
+        dt_range = [dt.datetime(2020, 3, 20, 0, 0), dt.datetime(2020, 3, 20, 12, 0)]
+        rise_time, set_time, freq_low_high, (times, tracks) = gss._compute_passes(observer, gss.get_cache().body(sat.get_tle()),
+                                                                                [437350000, 145800000], dt_range)[0]
+        self.assertEqual(tracks.shape, (2, len(times)))
+        self.assertAlmostEqual(times[0], float(rise_time))
+        self.assertAlmostEqual(times[-1], float(set_time))
+        self.assertLessEqual(max(abs(times[1:] - times[:-1])) * 86400, gss.DOPPLER_STEP + 1e-6)
+        self.assertGreater(tracks[0, 0], 437350000)
+        self.assertLess(tracks[0, -1], 437350000)
+        self.assertTrue((tracks[0, 1:] <= tracks[0, :-1]).all())                 # Monotonic over a pass
+        self.assertAlmostEqual(tracks[1, 0] / tracks[0, 0], 145800000 / 437350000)
+        self.assertEqual(freq_low_high[437350000], [tracks[0].min(), tracks[0].max()])
+
+    @unittest.skipIf(propagation.propagation.SatrecArray is None, "sgp4 isn't installed")
+    def test_sgp4_matches_ephem(self):
+        """The profile computed at once from the SGP4 track matches the one computed with ephem sample by sample
+        """
+        sat = _satellites()[0]
+        observer = gss._create_observer(GroundStation(coordinates=[37.98, 23.73], elevation=100))
+        body = gss.get_cache().body(sat.get_tle())
+        rise_time, set_time = ephem.Date(dt.datetime(2020, 3, 20, 0, 0)), ephem.Date(dt.datetime(2020, 3, 20, 0, 30))
+        times, tracks = gss._compute_doppler_profile(body, observer, [437350000], rise_time, set_time)
+        sgp4_times, sgp4_tracks = gss._compute_doppler_profile(body, observer, [437350000], rise_time, set_time, satellite=sat)
+        np.testing.assert_array_equal(sgp4_times, times)
+        self.assertLess(abs(sgp4_tracks - tracks).max(), 5)
+
+class TestTimeResolved(unittest.TestCase):
+    def _pass(self, start, end, track):
+        times = np.linspace(float(start), float(end), 11)
+        tracks = np.array([track(times)])
+        return (start, end, {100000000: [float(tracks.min()), float(tracks.max())]}, (times, tracks))
+
+    def test_sub_interval_of_the_passes(self):
+        """Only the part of the shared interval where the received frequencies are in range is reported
+        """
+        start, end = ephem.Date(dt.datetime(2020, 3, 20, 0, 0)), ephem.Date(dt.datetime(2020, 3, 20, 0, 10))
+        pass1 = self._pass(start, end, lambda times: np.full(len(times), 100000000.0))
+        # Drifts linearly from +50 kHz to -50 kHz, so it is within 10 kHz from 4 to 6 minutes
+        pass2 = self._pass(start, end, lambda times: 100050000.0 - 100000.0 * (times - float(start)) / (float(end) - float(start)))
+        dt_range = [dt.datetime(2020, 3, 19), dt.datetime(2020, 3, 21)]
+
+        whole = gss._pass_collisions(pass1, pass2, dt_range, 10000)
+        self.assertEqual(len(whole), 1)
+        self.assertEqual(whole[0][1], [start.datetime(), end.datetime()])
+
+        collisions = gss._pass_collisions(pass1, pass2, dt_range, 10000, [100000000], [100000000], time_resolved=True)
+        self.assertEqual(len(collisions), 1)
+        freq_list, (low, high) = collisions[0]
+        self.assertEqual(freq_list, [(100000000, 100000000)])
+        self.assertLess(abs((low - dt.datetime(2020, 3, 20, 0, 4)).total_seconds()), 0.01)
+        self.assertLess(abs((high - dt.datetime(2020, 3, 20, 0, 6)).total_seconds()), 0.01)
+
+    def test_time_resolved_is_within_the_passes(self):
+        sats = _satellites()
+        ground_station = GroundStation(coordinates=[37.98, 23.73], elevation=100)
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+        whole = gss.compute_RF_collision_of_satellite_over_groundstation(ground_station, sats, sats[0], dt_range)
+        resolved = gss.compute_RF_collision_of_satellite_over_groundstation(ground_station, sats, sats[0], dt_range,
+                                                                            time_resolved=True)
+        for collisions, sub_collisions in zip(whole, resolved):
+            periods = [collision["time_period"] for collision in collisions]
+            for collision in sub_collisions:
+                low, high = collision["time_period"]
+                self.assertLessEqual(low, high)
+                self.assertTrue(any(period[0] <= low and high <= period[1] for period in periods))
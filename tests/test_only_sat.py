@@ -0,0 +1,339 @@
+from satnogs_collisions import GroundStation, Satellite, compute_RF_collision_of_satellites, compute_RF_collision_of_satellite_with_satellites
+from satnogs_collisions.only_sat import sat_intersection, SatelliteRegistry
+from satnogs_collisions.only_sat.sat_intersection import detect_RF_collision_of_satellites_with_all_satellites
+from satnogs_collisions.event import CollisionEvent, collision_dicts
+import datetime as dt
+import math
+import numpy as np
+import threading
+import unittest
+import unittest.mock
+
+def _satellites():
+    tle = [
+    "45258 - Phoenix (ASU)",
+    "1 45258U 98067RB  20067.47769304  .00002942  00000-0  59624-4 0  9996",
+    "2 45258  51.6418 131.6319 0006369 330.6920  29.3711 15.49954130  2659"
+    ]
+    sat1 = Satellite(tle=tle, frequencies=[437350000])
+    tle = [
+    "40014 - BUGSAT-1",
+    "1 40014U 14033E   20089.83608613  .00000338  00000-0  36005-4 0  9996",
+    "2 40014  98.0547  49.3997 0031228 193.5632 166.4767 14.95418473315114"
+    ]
+    sat2 = Satellite(tle=tle, frequencies=[437345000])
+    return [sat1, sat2]
+
+class TestAllPairs(unittest.TestCase):
+    def test_pairs_are_mirrored(self):
+        """Every unordered pair is computed once and mirrored for the other satellite
+        """
+        sat1, sat2 = _satellites()
+        dt_range = [dt.datetime(2020, 3, 20, 0, 0), dt.datetime(2020, 3, 20, 2, 0)]
+        collisions = compute_RF_collision_of_satellites([sat1, sat2], dt_range, 60)
+        expected = compute_RF_collision_of_satellite_with_satellites([sat2], sat1, dt_range, 60)
+        self.assertEqual(collisions[sat1.get_name()], expected)
+        for collision, mirrored in zip(collisions[sat1.get_name()][0], collisions[sat2.get_name()][0]):
+            self.assertEqual(collision["time_period"], mirrored["time_period"])
+            self.assertIsNot(collision["time_period"], mirrored["time_period"])
+            self.assertEqual(collision["satellites"], mirrored["satellites"][::-1])
+
+    def test_collisions_own_their_metadata(self):
+        """Pairs are checked into compact events, and every collision gets its own metadata
+        """
+        sat1, sat2 = _satellites()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+        events = sat_intersection._check_all_pairs([sat1, sat2], dt_range, 60, 30000, time_period=True)
+        self.assertGreater(len(events[sat1.get_name()][0]), 1)
+        self.assertTrue(all(isinstance(event, CollisionEvent) for event in events[sat1.get_name()][0]))
+        collisions = compute_RF_collision_of_satellites([sat1, sat2], dt_range, 60)
+        first, second = collisions[sat1.get_name()][0][:2]
+        self.assertIsNot(first["satellites"], second["satellites"])
+        self.assertIsNot(first["satellites"][0], collisions[sat2.get_name()][0][0]["satellites"][1])
+
+class TestCapOverlap(unittest.TestCase):
+    def test_footprint_radius(self):
+        """The antenna half angle footprint lies inside the horizon footprint
+        """
+        horizon = sat_intersection._footprint_radius(500000)
+        self.assertAlmostEqual(math.degrees(horizon), 22.0, places=0)
+        self.assertLess(sat_intersection._footprint_radius(500000, alpha=30), horizon)
+        self.assertEqual(sat_intersection._footprint_radius(500000, alpha=89), horizon)
+
+    def test_cap_overlap(self):
+        """Footprints overlap when their centers are closer than the sum of their radii
+        """
+        radius = math.radians(10)
+        sublong = np.radians([0, 15, 19.9, 20.1, 180])
+        overlap = sat_intersection._cap_overlap(0.0, 0.0, radius, np.zeros(5), sublong, radius)
+        self.assertEqual(overlap.tolist(), [True, True, True, False, False])
+
+    def test_overlap_periods(self):
+        """Consecutive overlapping timesteps make a single period
+        """
+        overlap = np.array([True, True, False, False, True, False, True])
+        self.assertEqual(sat_intersection._overlap_periods(overlap), [(0, 1), (4, 4), (6, 6)])
+
+class TestAdaptiveStepping(unittest.TestCase):
+    def test_max_gap_rate(self):
+        """The gap between the footprints never changes faster than the bound
+        """
+        sat1, sat2 = _satellites()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 2, 0)]
+        times = sat_intersection._time_grid(dt_range, 10)
+        sublat, sublong, h = sat_intersection.get_backend().propagate([sat1, sat2], times)
+        radius = sat_intersection._footprint_radius(h)
+        gap = sat_intersection._cap_gap(sublat[0], sublong[0], radius[0], sublat[1], sublong[1], radius[1])
+        rate = sat_intersection._max_gap_rate(sat1) + sat_intersection._max_gap_rate(sat2)
+        self.assertLess(np.max(np.abs(np.diff(gap)))/10, rate)
+
+    def test_adaptive_matches_grid(self):
+        """Adaptive stepping finds the same collisions as a fine time grid
+        """
+        sat1, sat2 = _satellites()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+        grid = compute_RF_collision_of_satellite_with_satellites([sat2], sat1, dt_range, 1)[0]
+        adaptive = compute_RF_collision_of_satellite_with_satellites([sat2], sat1, dt_range, 1, adaptive=True, tolerance=0.5)[0]
+        self.assertGreater(len(grid), 0)
+        self.assertEqual(len(grid), len(adaptive))
+        for collision, refined in zip(grid, adaptive):
+            for time, refined_time in zip(collision["time_period"], refined["time_period"]):
+                self.assertLessEqual(abs((time - refined_time).total_seconds()), 1)
+
+def _geostationary():
+    tles = [
+    ["1 90001U 05041A   20080.50000000 -.00000100  00000-0  00000-0 0  9997",
+     "2 90001   0.0200 100.0000 0002000 200.0000 160.0000  1.00270000 50001"],
+    ["1 90002U 05041A   20080.50000000 -.00000100  00000-0  00000-0 0  9998",
+     "2 90002   0.0200 100.0000 0002000 200.0000 175.0000  1.00270000 50008"],
+    ["1 90003U 05041A   20080.50000000 -.00000100  00000-0  00000-0 0  9999",
+     "2 90003   0.0200 100.0000 0002000 200.0000 340.0000  1.00270000 50003"]
+    ]
+    return [Satellite(tle=["{} - GEO-{}".format(tle[0][2:7], index)] + tle, frequencies=[437350000]) for index, tle in enumerate(tles)]
+
+class TestOrbitalPruning(unittest.TestCase):
+    def test_orbital_summary(self):
+        sat1, sat2 = _satellites()
+        summary = sat_intersection.orbital_summary(sat1)
+        self.assertAlmostEqual(summary["inclination"], 51.6418)
+        self.assertTrue(380000 < summary["perigee_height"] < 420000 < summary["apogee_height"] < 470000)
+        self.assertLess(summary["min_footprint_radius"], summary["max_footprint_radius"])
+        self.assertAlmostEqual(summary["latitude_reach"], math.radians(51.6418) + summary["max_footprint_radius"])
+        self.assertAlmostEqual(sat_intersection.orbital_summary(sat2)["latitude_reach"], math.pi/2)   # Polar orbit
+        geo = sat_intersection.orbital_summary(_geostationary()[0])
+        self.assertLess(geo["max_gap_rate"], 1e-6)
+        self.assertGreater(geo["max_footprint_radius"], math.radians(80))
+
+    def test_geostationary_pairs_are_classified(self):
+        """Geostationary satellites close to each other always overlap, opposite ones never do
+        """
+        geo1, geo2, geo3 = _geostationary()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 22, 0, 0)]
+        known = sat_intersection._classified_periods([geo1, geo2, geo3], [(geo1, geo2), (geo1, geo3)], dt_range, 60)
+        self.assertEqual(known, {(geo1, geo2): [dt_range], (geo1, geo3): []})
+        narrow = sat_intersection._classified_periods([geo1, geo2], [(geo1, geo2)], dt_range, 60, alpha=1)
+        self.assertEqual(narrow, {(geo1, geo2): []})
+
+    def test_pruning_matches_propagation(self):
+        """Pairs classified from their orbits give the same collisions as propagating them
+        """
+        sats = _satellites() + _geostationary()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 6, 0)]
+        pruned = compute_RF_collision_of_satellites(sats, dt_range, 60)
+        classify_pair = sat_intersection._classify_pair
+        sat_intersection._classify_pair = lambda *args: "sweep"
+        try:
+            propagated = compute_RF_collision_of_satellites(sats, dt_range, 60)
+        finally:
+            sat_intersection._classify_pair = classify_pair
+        self.assertEqual(pruned, propagated)
+        self.assertEqual(len(pruned["90001 - GEO-0"][2]), 1)
+
+    def test_summaries_once_per_satellite(self):
+        """Serial and adaptive checks summarize every satellite once, not once per pair
+        """
+        sats = _satellites() + _geostationary()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 1, 0)]
+        summary = sat_intersection.orbital_summary
+        for run in (lambda: compute_RF_collision_of_satellites(sats, dt_range, 60),
+                    lambda: compute_RF_collision_of_satellites(sats, dt_range, 60, adaptive=True),
+                    lambda: compute_RF_collision_of_satellite_with_satellites(sats[1:], sats[0], dt_range, 60, adaptive=True)):
+            with unittest.mock.patch.object(sat_intersection, "orbital_summary", side_effect=summary) as orbital_summary:
+                run()
+            self.assertEqual(orbital_summary.call_count, len(sats))
+
+class TestOneToMany(unittest.TestCase):
+    def test_batch_matches_pairwise(self):
+        """One satellite checked against all the others at once gives the same collisions as pair by pair
+        """
+        sats = _satellites() + _geostationary()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 6, 0)]
+        for alpha in (None, 20):
+            grid = compute_RF_collision_of_satellite_with_satellites(sats, sats[0], dt_range, 30, alpha=alpha)
+            pairwise = [sat_intersection._check_collision(sat, sats[0], dt_range, 30, 30000, alpha=alpha, time_period=True)
+                        for sat in sats[1:]]
+            self.assertEqual(grid, [[]] + collision_dicts(pairwise))
+
+def _box(lat, lon, size):
+    return {"type": "Polygon", "coordinates": [[[lon - size, lat - size], [lon + size, lat - size], [lon + size, lat + size],
+                                                [lon - size, lat + size], [lon - size, lat - size]]]}
+
+class TestAreaOfInterest(unittest.TestCase):
+    def setUp(self):
+        self.sats = _satellites()
+        self.dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+        self.full = compute_RF_collision_of_satellite_with_satellites(self.sats[1:], self.sats[0], self.dt_range, 60)[0]
+
+    def _inside(self, periods):
+        step = dt.timedelta(seconds=60)
+        for period in periods:
+            self.assertTrue(any(full["time_period"][0] - step <= period[0] <= period[1] <= full["time_period"][1] + step
+                                for full in self.full))
+
+    def test_far_area(self):
+        area = _box(-87, 0, 2)
+        self.assertEqual(sat_intersection.detect_RF_collision_of_satellite_with_satellites(self.sats[1:], self.sats[0], self.dt_range, 60, area=area), [False])
+        self.assertEqual(compute_RF_collision_of_satellites(self.sats, self.dt_range, 60, area=area)[self.sats[0].get_name()], [[]])
+
+    def test_polygon(self):
+        """Collisions over a polygon are part of the collisions anywhere, with footprints clipped to the polygon
+        """
+        area = _box(19.3, -4.5, 5)
+        for adaptive in (False, True):
+            collisions = compute_RF_collision_of_satellite_with_satellites(self.sats[1:], self.sats[0], self.dt_range, 60,
+                                                                           intersection=True, adaptive=adaptive, area=area)[0]
+            self.assertGreater(len(collisions), 0)
+            self.assertLess(len(collisions), len(self.full))
+            self._inside([collision["time_period"] for collision in collisions])
+            polygon = sat_intersection.shapely.geometry.shape(area).buffer(1e-6)
+            for collision in collisions:
+                self.assertGreater(len(collision["footprints"]), 0)
+                self.assertTrue(all(polygon.contains(footprint) for time, footprint in collision["footprints"]))
+        pairs = compute_RF_collision_of_satellites(self.sats, self.dt_range, 60, area=area)[self.sats[0].get_name()][0]
+        self.assertEqual([collision["time_period"] for collision in pairs],
+                         [collision["time_period"] for collision in compute_RF_collision_of_satellite_with_satellites(
+                             self.sats[1:], self.sats[0], self.dt_range, 60, area=area)[0]])
+
+    def test_outside_polygon_in_bounding_cap(self):
+        """Footprints overlapping inside the bounding cap of the polygon but not over it aren't collisions
+        """
+        area = {"type": "Polygon", "coordinates": [[[-10, 35], [30, 35], [30, 60], [-10, 60], [-10, 35]]]}
+        caps = sat_intersection._area_caps(area)
+        times = [time for collision in self.full for time in sat_intersection._time_grid(collision["time_period"], 60)]
+        sublat, sublong, h = sat_intersection.propagate(self.sats, times)
+        radius = sat_intersection._footprint_radius(h)
+        reach = sat_intersection._area_reach(caps, sublat[0], sublong[0], radius[0]) & sat_intersection._area_reach(caps, sublat[1], sublong[1], radius[1])
+        self.assertTrue(reach.any())
+        for adaptive in (False, True):
+            self.assertEqual(compute_RF_collision_of_satellite_with_satellites(self.sats[1:], self.sats[0], self.dt_range, 60,
+                                                                              adaptive=adaptive, area=area), [[]])
+        self.assertEqual(compute_RF_collision_of_satellites(self.sats, self.dt_range, 60, area=area)[self.sats[0].get_name()], [[]])
+
+    def test_concave_polygon(self):
+        """Every timestep of the collisions over an L-shaped polygon has an intersection over it
+        """
+        area = {"type": "Polygon", "coordinates": [[[-40, 0], [40, 0], [40, 10], [-30, 10], [-30, 60], [-40, 60], [-40, 0]]]}
+        collisions = compute_RF_collision_of_satellite_with_satellites(self.sats[1:], self.sats[0], self.dt_range, 60,
+                                                                       intersection=True, area=area)[0]
+        self.assertGreater(len(collisions), 0)
+        for collision in collisions:
+            self.assertEqual(len(collision["footprints"]), len(sat_intersection._time_grid(collision["time_period"], 60)))
+            self.assertFalse(any(footprint.is_empty for time, footprint in collision["footprints"]))
+
+    def test_ground_stations(self):
+        """Collisions over Ground Stations are the timesteps where both satellites are above their horizon
+        """
+        stations = [GroundStation(coordinates=[21.5, -65.3], elevation=0), GroundStation(coordinates=[-87, 0], elevation=0)]
+        collisions = compute_RF_collision_of_satellite_with_satellites(self.sats[1:], self.sats[0], self.dt_range, 60, area=stations)[0]
+        self.assertGreater(len(collisions), 0)
+        self._inside([collision["time_period"] for collision in collisions])
+        for collision in collisions:
+            times = sat_intersection._time_grid(collision["time_period"], 60)
+            sublat, sublong, h = sat_intersection.propagate(self.sats, times)
+            radius = sat_intersection._footprint_radius(h)
+            gap = sat_intersection._cap_gap(math.radians(21.5), math.radians(-65.3), 0, sublat, sublong, radius)
+            self.assertTrue((gap < 0).all())
+
+class TestParallelPairs(unittest.TestCase):
+    def test_workers_match_serial(self):
+        """Pairs evaluated from the shared tracks give the same collisions as a serial run
+        """
+        sats = _satellites()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+        serial = compute_RF_collision_of_satellites(sats, dt_range, 30)
+        parallel = compute_RF_collision_of_satellites(sats, dt_range, 30, workers=2)
+        self.assertGreater(len(serial[sats[0].get_name()][0]), 0)
+        self.assertEqual(parallel, serial)
+
+    def test_adaptive_workers(self):
+        """Adaptive stepping doesn't use the shared time grid
+        """
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 1, 0)]
+        with self.assertRaises(ValueError):
+            compute_RF_collision_of_satellites(_satellites(), dt_range, 30, adaptive=True, workers=2)
+
+class TestSatelliteRegistry(unittest.TestCase):
+    def setUp(self):
+        self.loads = 0
+
+    def _loader(self):
+        self.loads += 1
+        return _satellites()
+
+    def test_loaded_once(self):
+        """Concurrent callers share a single load until the registry is refreshed
+        """
+        registry = SatelliteRegistry(loader=self._loader)
+        threads = [threading.Thread(target=registry.satellites) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.loads, 1)
+        first = registry.satellites()
+        registry.refresh()
+        self.assertEqual(self.loads, 2)
+        self.assertIsNot(registry.satellites(), first)
+        registry.invalidate()
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(self.loads, 3)
+
+    def test_injected_registry(self):
+        """The all satellites functions compare with the injected registry
+        """
+        sat1, sat2 = _satellites()
+        registry = SatelliteRegistry(satellites=[sat2])
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 6, 0)]
+        self.assertEqual(detect_RF_collision_of_satellites_with_all_satellites(sat1, dt_range, 60, registry=registry), [True])
+
+class TestStreaming(unittest.TestCase):
+    def test_iter_matches_compute(self):
+        """Streamed collisions match the computed ones, whatever the window
+        """
+        sat1, sat2 = _satellites()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 12, 0)]
+        computed = compute_RF_collision_of_satellites([sat1, sat2], dt_range, 30)[sat1.get_name()][0]
+        for window in (dt.timedelta(minutes=7), dt.timedelta(days=1)):
+            streamed = list(sat_intersection.iter_RF_collisions([sat1, sat2], dt_range, 30, window=window))
+            self.assertEqual([event.to_dict() for event in streamed], computed)
+        streamed = sat_intersection.iter_RF_collisions([sat2], dt_range, 30, main_sat=sat1, window=dt.timedelta(minutes=7))
+        self.assertEqual([event.to_dict() for event in streamed], computed)
+
+    def test_window_must_be_positive(self):
+        sat1, sat2 = _satellites()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 1, 0)]
+        for window in (dt.timedelta(0), dt.timedelta(minutes=-5)):
+            with self.assertRaises(ValueError):
+                sat_intersection.iter_RF_collisions([sat1, sat2], dt_range, 30, window=window)
+
+    def test_compact_events(self):
+        """Events only hold the IDs, the period and the indices of the colliding frequencies
+        """
+        sat1, sat2 = _satellites()
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 6, 0)]
+        event = next(sat_intersection.iter_RF_collisions([sat2], dt_range, 30, main_sat=sat1))
+        self.assertEqual(event.norad_ids, (40014, 45258))
+        self.assertIsNone(event.station_id)
+        self.assertEqual(event.frequency_indices, ((0, 0),))
+        self.assertEqual(event.collision_frequencies, [(437345000, 437350000)])
+        self.assertFalse(hasattr(event, "__dict__"))
@@ -0,0 +1,143 @@
+from satnogs_collisions import Satellite, GroundStation, IncrementalPlanner, compute_RF_collision_of_satellites
+from satnogs_collisions.GSS import gss
+from satnogs_collisions.propagation import EphemBackend
+import datetime as dt
+import ephem
+import numpy as np
+import os
+import tempfile
+import unittest
+
+class RenamedBackend(EphemBackend):
+    name = "renamed"                                     # Stands for an other backend
+
+def _tle(norad_id, inclination, mean_anomaly, mean_motion):
+    def checksum(line):
+        return str(sum(int(char) if char.isdigit() else char == "-" for char in line) % 10)
+    line1 = "1 {:05d}U 20001A   20080.50000000  .00000000  00000-0  10000-4 0  999".format(norad_id)
+    line2 = "2 {:05d} {:8.4f} 100.0000 0001000   0.0000 {:8.4f} {:11.8f}    1".format(norad_id, inclination, mean_anomaly, mean_motion)
+    return ["{:05d} - TEST-{}".format(norad_id, norad_id), line1 + checksum(line1), line2 + checksum(line2)]
+
+def _satellites():
+    tle = [
+    "45258 - Phoenix (ASU)",
+    "1 45258U 98067RB  20067.47769304  .00002942  00000-0  59624-4 0  9996",
+    "2 45258  51.6418 131.6319 0006369 330.6920  29.3711 15.49954130  2659"
+    ]
+    sat1 = Satellite(tle=tle, frequencies=[437350000])
+    tle = [
+    "45263 - QARMAN",
+    "1 45263U 98067RG  20067.47843361  .00002564  00000-0  53131-4 0  9995",
+    "2 45263  51.6423 131.6371 0007933 343.6105  16.4627 15.49877689  2719"
+    ]
+    sat2 = Satellite(tle=tle, frequencies=[437350000])
+    tle = [
+    "40014 - BUGSAT-1",
+    "1 40014U 14033E   20089.83608613  .00000338  00000-0  36005-4 0  9996",
+    "2 40014  98.0547  49.3997 0031228 193.5632 166.4767 14.95418473315114"
+    ]
+    sat3 = Satellite(tle=tle, frequencies=[437345000])
+    return [sat1, sat2, sat3]
+
+class TestGroundStationPlanner(unittest.TestCase):
+    def setUp(self):
+        self.satellites = _satellites()
+        self.ground_station = GroundStation(coordinates=[37.98, 23.73], elevation=100)
+        self.dt_range = [dt.datetime(2020, 3, 21, 0, 30), dt.datetime(2020, 3, 21, 12, 30)]
+
+    def test_pass_table_matches_full_computation(self):
+        planner = IncrementalPlanner()
+        pass_table = planner.pass_table(self.ground_station, self.satellites, self.dt_range)
+        expected = gss._compute_pass_table(self.ground_station, self.satellites, self.dt_range)
+        for sat in self.satellites:
+            self.assertEqual(len(pass_table[sat]), len(expected[sat]))
+            for sat_pass, expected_pass in zip(pass_table[sat], expected[sat]):
+                self.assertLess(abs(sat_pass[1] - expected_pass[1]) * 86400, 1)
+                if expected_pass[1] - expected_pass[0] > ephem.minute:           # ephem finds grazing passes from where it starts searching
+                    self.assertLess(abs(sat_pass[0] - expected_pass[0]) * 86400, 1)
+
+    def test_sliding_window_only_computes_new_slices(self):
+        planner = IncrementalPlanner()
+        first = planner.compute_RF_collision_of_satellites_over_groundstation(self.ground_station, self.satellites, self.dt_range)
+        computed = planner.computed["passes"]
+        self.assertEqual(computed, 14 * len(self.satellites))                 # 23:00 to 12:00
+        self.assertEqual(planner.compute_RF_collision_of_satellites_over_groundstation(self.ground_station, self.satellites,
+                                                                                        self.dt_range), first)
+        self.assertEqual(planner.computed["passes"], computed)
+
+        planner.compute_RF_collision_of_satellites_over_groundstation(self.ground_station, self.satellites,
+                                                                      [time + dt.timedelta(hours=1) for time in self.dt_range])
+        self.assertEqual(planner.computed["passes"], computed + len(self.satellites))
+
+    def test_never_sets(self):
+        """Satellites that never set keep one pass covering the range, like the full computation
+        """
+        geo = [Satellite(tle=_tle(90004 + index, 0.05, 2*index, 1.0027), frequencies=[437350000]) for index in range(2)]
+        ground_station = GroundStation(coordinates=[10, 101.5], elevation=0)
+        dt_range = [dt.datetime(2020, 3, 21, 0, 0), dt.datetime(2020, 3, 21, 6, 0)]
+        expected = gss.compute_RF_collision_of_satellites_over_groundstation(ground_station, geo, dt_range)
+        self.assertEqual([collision["time_period"] for collision in expected[geo[0].get_name()][0]], [dt_range])
+        planner = IncrementalPlanner()
+        self.assertEqual(planner.compute_RF_collision_of_satellites_over_groundstation(ground_station, geo, dt_range), expected)
+        later = [time + dt.timedelta(hours=2) for time in dt_range]
+        self.assertEqual(planner.compute_RF_collision_of_satellites_over_groundstation(ground_station, geo, later),
+                         gss.compute_RF_collision_of_satellites_over_groundstation(ground_station, geo, later))
+
+class TestSatellitePlanner(unittest.TestCase):
+    def setUp(self):
+        self.satellites = _satellites()
+        self.dt_range = [dt.datetime(2020, 3, 20, 0, 0), dt.datetime(2020, 3, 20, 3, 0)]
+
+    def test_matches_full_computation(self):
+        planner = IncrementalPlanner()
+        self.assertEqual(planner.compute_RF_collision_of_satellites(self.satellites, self.dt_range, 10),
+                         compute_RF_collision_of_satellites(self.satellites, self.dt_range, 10))
+
+    def test_new_tle_only_recomputes_its_pairs(self):
+        planner = IncrementalPlanner()
+        planner.compute_RF_collision_of_satellites(self.satellites, self.dt_range, 10)
+        computed = planner.computed["periods"]
+        self.assertEqual(computed, 3 * 4)                                       # 3 pairs over 4 slices
+
+        sat1, sat2, sat3 = self.satellites
+        tle = list(sat3.get_tle())
+        tle[1] = tle[1][:20] + "20089.83608614" + tle[1][34:]                   # Newer epoch
+        updated = [sat1, sat2, Satellite(tle=tle, frequencies=sat3.get_frequencies())]
+        self.assertEqual(planner.compute_RF_collision_of_satellites(updated, self.dt_range, 10),
+                         compute_RF_collision_of_satellites(updated, self.dt_range, 10))
+        self.assertEqual(planner.computed["periods"], computed + 2 * 4)
+
+        planner.prune(satellites=updated)
+        self.assertEqual(len(planner._periods), 3 * 4)
+
+    def test_save_and_load(self):
+        """Passes and overlaps are saved as JSON and reused as they were
+        """
+        planner = IncrementalPlanner()
+        ground_station = GroundStation(coordinates=[37.98, 23.73], elevation=100)
+        expected = planner.compute_RF_collision_of_satellites(self.satellites, self.dt_range, 10)
+        expected_passes = planner.pass_table(ground_station, self.satellites, self.dt_range)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "planner.json")
+            planner.save(path)
+            loaded = IncrementalPlanner.load(path)
+        self.assertEqual(loaded.compute_RF_collision_of_satellites(self.satellites, self.dt_range, 10), expected)
+        self.assertEqual(loaded.computed["periods"], 0)
+        passes = loaded.pass_table(ground_station, self.satellites, self.dt_range)
+        self.assertEqual(loaded.computed["passes"], 0)
+        for sat in self.satellites:
+            self.assertEqual([sat_pass[:3] for sat_pass in passes[sat]], [sat_pass[:3] for sat_pass in expected_passes[sat]])
+            for sat_pass, expected_pass in zip(passes[sat], expected_passes[sat]):
+                np.testing.assert_array_equal(sat_pass[3][1], expected_pass[3][1])
+
+    def test_other_backend_recomputes(self):
+        """Overlaps are only reused by the propagation backend that computed them
+        """
+        planner = IncrementalPlanner(backend="ephem")
+        planner.compute_RF_collision_of_satellites(self.satellites, self.dt_range, 10)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "planner.json")
+            planner.save(path)
+            loaded = IncrementalPlanner.load(path, backend=RenamedBackend())
+        loaded.compute_RF_collision_of_satellites(self.satellites, self.dt_range, 10)
+        self.assertEqual(loaded.computed["periods"], 3 * 4)
@@ -0,0 +1,106 @@
+from satnogs_collisions import Satellite
+from satnogs_collisions.propagation import EphemBackend, SGP4Backend, get_backend, EphemerisCache, LRUCache
+from satnogs_collisions.propagation import propagation
+import datetime as dt
+import numpy as np
+import unittest
+import unittest.mock
+
+def _satellites():
+    tle = [
+    "45258 - Phoenix (ASU)",
+    "1 45258U 98067RB  20067.47769304  .00002942  00000-0  59624-4 0  9996",
+    "2 45258  51.6418 131.6319 0006369 330.6920  29.3711 15.49954130  2659"
+    ]
+    satellites = [Satellite(tle=tle, frequencies=[437350000])]
+    tle = [
+    "40014 - BUGSAT-1",
+    "1 40014U 14033E   20089.83608613  .00000338  00000-0  36005-4 0  9996",
+    "2 40014  98.0547  49.3997 0031228 193.5632 166.4767 14.95418473315114"
+    ]
+    satellites.append(Satellite(tle=tle, frequencies=[437445000]))
+    return satellites
+
+class TestPropagation(unittest.TestCase):
+    def setUp(self):
+        self.satellites = _satellites()
+        self.times = [dt.datetime(2020, 3, 9, 0, 0) + dt.timedelta(seconds=60 * i) for i in range(180)]
+
+    @unittest.skipIf(propagation.SatrecArray is None, "sgp4 isn't installed")
+    def test_sgp4_matches_ephem(self):
+        """The vectorized SGP4 backend computes the same sub-satellite points as ephem
+        """
+        sublat1, sublong1, h1 = EphemBackend().propagate(self.satellites, self.times)
+        sublat2, sublong2, h2 = SGP4Backend().propagate(self.satellites, self.times)
+        self.assertEqual(sublat2.shape, (2, 180))
+        self.assertLess(np.degrees(np.abs(sublat1 - sublat2)).max(), 0.01)
+        self.assertLess(np.degrees(np.abs(np.angle(np.exp(1j * (sublong1 - sublong2))))).max(), 0.01)
+        self.assertLess(np.abs(h1 - h2).max(), 100)
+
+    def test_get_backend(self):
+        """Backends are selected by name
+        """
+        self.assertIsInstance(get_backend("ephem"), EphemBackend)
+        self.assertRaises(ValueError, get_backend, "unknown")
+
+class CountingBackend(EphemBackend):
+    """Ephem backend counting the propagated satellites
+    """
+    def __init__(self):
+        self.count = 0
+
+    def propagate(self, satellites, times):
+        self.count += len(satellites)
+        return super().propagate(satellites, times)
+
+class TestEphemerisCache(unittest.TestCase):
+    def setUp(self):
+        self.satellites = _satellites()
+        self.times = [dt.datetime(2020, 3, 9, 0, 0) + dt.timedelta(seconds=60 * i) for i in range(180)]
+
+    def test_positions_are_reused(self):
+        """Satellites are only propagated once per timestep grid
+        """
+        cache = EphemerisCache()
+        backend = CountingBackend()
+        first = cache.propagate(backend, self.satellites, self.times)
+        second = cache.propagate(backend, self.satellites[::-1], self.times)
+        self.assertEqual(backend.count, 2)
+        np.testing.assert_array_equal(first[0], second[0][::-1])
+        cache.propagate(backend, self.satellites, self.times[:10])
+        self.assertEqual(backend.count, 4)
+
+    def test_bodies_are_reused(self):
+        """TLEs are only parsed once
+        """
+        cache = EphemerisCache()
+        self.assertIs(cache.body(self.satellites[0].get_tle()), cache.body(list(self.satellites[0].get_tle())))
+
+    @unittest.skipIf(propagation.SatrecArray is None, "sgp4 isn't installed")
+    def test_satrecs_are_reused(self):
+        """SGP4 records are parsed once per TLE, also across propagations of the SGP4 backend
+        """
+        cache = propagation.get_cache()
+        cache.clear()
+        tle = self.satellites[0].get_tle()
+        self.assertIs(cache.satrec(tle), cache.satrec(["renamed"] + list(tle[1:])))
+        parse = propagation.Satrec.twoline2rv
+        with unittest.mock.patch.object(propagation.Satrec, "twoline2rv", side_effect=parse) as twoline2rv:
+            backend = SGP4Backend()
+            for start in range(3):
+                backend.propagate(self.satellites, self.times[start:])
+                backend.propagate_ecef(self.satellites, self.times[start:])
+        self.assertEqual(twoline2rv.call_count, 1)
+
+    def test_lru_eviction(self):
+        """The least recently used entries are evicted first
+        """
+        cache = LRUCache(3)
+        cache.put("a", 1)
+        cache.put("b", 2, size=2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+        cache.put("d", 4, size=4)
+        self.assertEqual(len(cache), 2)
@@ -0,0 +1,116 @@
+from satnogs_collisions import Satellite, compute_RF_collision_of_satellites
+from satnogs_collisions.satellite import FrequencyIndex, SatelliteCatalog, Constellation
+from satnogs_collisions.satellite import catalog, satellite
+import datetime
+import os
+import unittest
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+TLE = [
+"45258 - Phoenix (ASU)",
+"1 45258U 98067RB  20067.47769304  .00002942  00000-0  59624-4 0  9996",
+"2 45258  51.6418 131.6319 0006369 330.6920  29.3711 15.49954130  2659"
+]
+
+class TestFrequencyIndex(unittest.TestCase):
+    def setUp(self):
+        self.sat1 = Satellite(tle=TLE, frequencies=[437350000])
+        self.sat2 = Satellite(tle=TLE, frequencies=[145800000, 437370000])
+        self.sat3 = Satellite(tle=TLE, frequencies=[2400000000])
+        self.sat4 = Satellite(tle=TLE, frequencies=[437395000])
+
+    def test_candidate_pairs(self):
+        """Only the pairs with frequencies in range are candidates
+        """
+        index = FrequencyIndex([self.sat1, self.sat2, self.sat3, self.sat4])
+        self.assertEqual(index.candidate_pairs(30000), {(self.sat1, self.sat2), (self.sat2, self.sat4)})
+
+    def test_doppler_widens_the_frequencies(self):
+        """The worst case Doppler shift of LEO satellites is around 10 kHz at UHF
+        """
+        index = FrequencyIndex([self.sat1, self.sat2, self.sat3, self.sat4], doppler=True)
+        self.assertEqual(index.candidate_pairs(30000), {(self.sat1, self.sat2), (self.sat1, self.sat4), (self.sat2, self.sat4)})
+        self.assertEqual(FrequencyIndex([self.sat4], doppler=True).query(self.sat1, 30000), [self.sat4])
+        self.assertEqual(FrequencyIndex([self.sat4]).query(self.sat1, 30000), [])
+
+    def test_query(self):
+        """The satellite itself is never a candidate
+        """
+        index = FrequencyIndex([self.sat1, self.sat2, self.sat3, self.sat4])
+        self.assertEqual(index.query(self.sat1, 30000), [self.sat2])
+        self.assertEqual(index.query(self.sat2, 30000), [self.sat1, self.sat4])
+
+class TestSatelliteCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = SatelliteCatalog.from_files(os.path.join(FIXTURES, "tle.txt"),
+                                                   os.path.join(FIXTURES, "transmitters.json"))
+
+    def test_index_by_norad_id(self):
+        """TLEs and downlink frequencies are indexed by NORAD ID
+        """
+        self.assertEqual(self.catalog.norad_ids(), [40014, 44369, 45258, 45263])
+        self.assertEqual(self.catalog.tles[44369][0], "44369")
+        self.assertEqual(self.catalog.frequencies[45263], [437350000])
+        self.assertEqual(self.catalog.frequencies[40014], [437445000])
+        self.assertNotIn(99999, self.catalog)
+
+    def test_satellites_without_network(self):
+        """Satellites are built from the catalog without calling the network
+        """
+        def offline(norad_id):
+            raise AssertionError("network access")
+        fetch_tle, fetch_frequencies = satellite._set_tle, satellite._set_frequencies
+        satellite._set_tle, satellite._set_frequencies = offline, offline
+        try:
+            sat = self.catalog.get(45258)
+            self.assertIs(self.catalog.get("45258"), sat)
+            self.assertEqual(sat.get_name(), "45258 - Phoenix (ASU)")
+            self.assertEqual(sat.get_frequencies(), [437350000])
+            self.assertEqual(self.catalog.get(44369).get_frequencies(), [])
+            self.assertEqual([sat.norad_id for sat in self.catalog.satellites()], [40014, 45258, 45263])
+        finally:
+            satellite._set_tle, satellite._set_frequencies = fetch_tle, fetch_frequencies
+        self.assertRaises(KeyError, self.catalog.get, 99999)
+
+    def test_collisions_of_catalog_satellites(self):
+        """Untitled TLEs and CelesTrak titles without NORAD ID give the metadata of the collisions
+        """
+        with open(os.path.join(FIXTURES, "tle.txt")) as tle_file:
+            tles = catalog._parse_tles(tle_file.read().replace("45263 - QARMAN", "QARMAN (CUBESAT)"))
+        sats = SatelliteCatalog(tles, {norad_id: [437350000] for norad_id in tles}).satellites()
+        dt_range = [datetime.datetime(2020, 3, 21, 0, 0), datetime.datetime(2020, 3, 21, 12, 0)]
+        collisions = compute_RF_collision_of_satellites(sats, dt_range, 60)
+        names = {(metadata["norad_id"], metadata["name"]) for sat_collisions in collisions.values() for pair in sat_collisions
+                 for collision in pair for metadata in collision["satellites"]}
+        self.assertIn(("44369", "44369"), names)
+        self.assertIn(("45263", "QARMAN (CUBESAT)"), names)
+        self.assertIn(("45258", "Phoenix (ASU)"), names)
+
+class TestConstellation(unittest.TestCase):
+    def setUp(self):
+        catalog = SatelliteCatalog.from_files(os.path.join(FIXTURES, "tle.txt"),
+                                              os.path.join(FIXTURES, "transmitters.json"))
+        self.satellites = catalog.satellites(transmitting=False)
+        self.constellation = Constellation(self.satellites)
+
+    def test_columns(self):
+        """Orbital elements and frequencies are parsed into arrays
+        """
+        self.assertEqual(self.constellation.norad_ids.tolist(), [40014, 44369, 45258, 45263])
+        self.assertAlmostEqual(self.constellation.inclination[0], 98.0547)
+        self.assertAlmostEqual(self.constellation.eccentricity[0], 0.0031228)
+        self.assertAlmostEqual(self.constellation.mean_motion[2], 15.49954130)
+        self.assertAlmostEqual(self.constellation.epochs[2], 2458915.97769304)     # 2020-03-07 11:27:52 UTC
+        self.assertEqual(self.constellation.offsets.tolist(), [0, 1, 1, 2, 3])
+        self.assertEqual(self.constellation.get_frequencies(1).tolist(), [])
+        self.assertEqual(self.constellation.get_frequencies(3).tolist(), [437350000])
+        self.assertEqual(list(self.constellation), self.satellites)
+
+    def test_frequency_index(self):
+        """The index of a constellation matches the index of its satellites
+        """
+        for doppler in (False, True):
+            pairs = FrequencyIndex(self.satellites, doppler=doppler).candidate_pairs(30000)
+            self.assertEqual(FrequencyIndex(self.constellation, doppler=doppler).candidate_pairs(30000), pairs)
+        self.assertFalse(hasattr(self.satellites[0], "__dict__"))